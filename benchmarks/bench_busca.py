@@ -0,0 +1,55 @@
+"""Speedup da busca de hiperparâmetros do turnover: pool de processos vs. série.
+
+Monta os folds uma vez (tempo reportado à parte) e roda a mesma grade com
+os mesmos folds em diretórios de resultados separados:
+- série: um processo, uma tarefa (configuração, fold) por vez;
+- paralelo: pool com --workers processos;
+- retomada: a busca paralela de novo, com todos os pares reaproveitados.
+
+Uso:
+    python benchmarks/bench_busca.py [--workers N] [--folds 3] [--models random_forest gradient_boosting]
+"""
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def main():
+    from painel_busca import DEFAULT_FOLDS, SEARCH_SPACE, WORKERS, build_folds, search
+    from painel_turnover import DATA_FILE
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default=str(DATA_FILE))
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--folds", type=int, default=DEFAULT_FOLDS)
+    parser.add_argument("--models", nargs="+", choices=sorted(SEARCH_SPACE))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        serial_dir, parallel_dir = Path(tmp) / "serie", Path(tmp) / "paralelo"
+        start = time.perf_counter()
+        folds_dir = build_folds(args.csv, args.folds, serial_dir)
+        print(f"folds + SMOTE: {time.perf_counter() - start:.1f} s (uma vez, em cache)")
+        shutil.copytree(folds_dir, parallel_dir / folds_dir.name)
+
+        serial = search(args.csv, 1, args.folds, args.models, serial_dir)
+        parallel = search(args.csv, args.workers, args.folds, args.models, parallel_dir)
+        resumed = search(args.csv, args.workers, args.folds, args.models, parallel_dir)
+
+    print(f"{serial['tasks']} tarefas")
+    print(f"série:     {serial['seconds']:>8.1f} s")
+    print(f"paralelo:  {parallel['seconds']:>8.1f} s com {args.workers} workers "
+          f"(speedup {serial['seconds'] / parallel['seconds']:.1f}x)")
+    print(f"retomada:  {resumed['seconds']:>8.1f} s ({resumed['reused']} pares reaproveitados)")
+    best_serial, best_parallel = serial["ranking"][0], parallel["ranking"][0]
+    print(f"melhor configuração igual nas duas execuções: {best_serial['id'] == best_parallel['id']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark do carregador de dados (painel_dados.load_data).
+
+Mede o cold start (processo novo: import + parse + validação) e o acesso
+quente (cache por mtime). Sai com código 1 se a mediana do cold start
+ultrapassar o orçamento.
+
+Uso:
+    python benchmarks/bench_data_loader.py [--budget-ms 50] [--runs 7]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+COLD_START_BUDGET_MS = 50.0
+
+COLD_SNIPPET = (
+    "import time; t = time.perf_counter(); "
+    "import painel_dados; painel_dados.load_data(); "
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+
+def measure_cold(runs: int) -> list:
+    """Executa o carregamento em processos novos e retorna os tempos (ms)"""
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", COLD_SNIPPET],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+        timings.append(float(out.stdout.strip()))
+    return timings
+
+
+def measure_warm(runs: int) -> list:
+    """Mede chamadas repetidas no mesmo processo (cache por mtime)"""
+    import painel_dados
+
+    painel_dados.load_data()
+    timings = []
+    for _ in range(runs):
+        t = time.perf_counter()
+        painel_dados.load_data()
+        timings.append((time.perf_counter() - t) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=COLD_START_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    cold = statistics.median(measure_cold(args.runs))
+    warm = statistics.median(measure_warm(args.runs * 100))
+
+    print(f"cold start: {cold:.2f} ms (orçamento {args.budget_ms:.0f} ms)")
+    print(f"warm:       {warm * 1000:.1f} µs")
+
+    if cold > args.budget_ms:
+        print("FALHA: cold start acima do orçamento", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Relatório de tempo de import dos módulos do painel (python -X importtime).
+
+Importa cada módulo do painel em um processo novo com -X importtime e lista
+os imports diretos com maior tempo cumulativo, além de indicar se
+pandas, numpy e plotly foram carregados. Serve para garantir que o import
+dos módulos (e, portanto, a inicialização do app) não volte a puxar
+bibliotecas pesadas que só algumas abas usam.
+
+Uso:
+    python benchmarks/bench_imports.py [--top 5] [--out benchmarks/importtime.txt]
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = [
+    "painel_dados", "painel_modelo", "painel_indice", "painel_cache", "painel_html",
+    "painel_tema", "painel_figuras", "painel_perfil",
+]
+HEAVY = ["pandas", "numpy", "plotly", "plotly.express", "plotly.graph_objects"]
+
+
+def import_times(code: str) -> list:
+    """Executa o código em um processo novo e retorna (cumulativo em µs, profundidade, nome) de cada import"""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(cumulative), depth, name.strip()))
+    return rows
+
+
+def report(top: int) -> str:
+    """Tempo total, módulos pesados carregados e maiores imports diretos de cada módulo do painel"""
+    # Módulos que o interpretador já carrega sozinho (site, .pth) não contam
+    startup = {name for _, _, name in import_times("pass")}
+    lines = []
+    for module in MODULES:
+        rows = [row for row in import_times(f"import {module}") if row[2] not in startup]
+        loaded = {name for _, _, name in rows}
+        total = next((us for us, _, name in rows if name == module), 0)
+        heavy = [name for name in HEAVY if name in loaded]
+        lines.append(f"{module}: {total / 1000:.1f} ms, pesados: {', '.join(heavy) or 'nenhum'}")
+        direct = sorted((us, name) for us, depth, name in rows if depth == 1)
+        for us, name in direct[::-1][:top]:
+            lines.append(f"  {us / 1000:>8.1f} ms  {name}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=5, help="imports de primeiro nível listados por módulo")
+    parser.add_argument("--out", type=Path, help="grava o relatório neste arquivo")
+    args = parser.parse_args()
+
+    text = report(args.top)
+    print(text)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
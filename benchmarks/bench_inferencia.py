@@ -0,0 +1,131 @@
+"""Latência e vazão do modelo de churn do Waze: chamada direta vs. micro-batching.
+
+Com 1, 10 e 100 clientes concorrentes (threads), cada um envia --requests
+requisições de um registro em sequência, sorteadas da base do Waze. Modos:
+- direto: cada requisição chama o modelo com um lote de 1 linha;
+- micro-batch: requisições passam pelo MicroBatcher em processo;
+- http (--url): POST /predict em um servidor de painel_inferencia já no ar,
+  em outro processo (no mesmo processo, as threads dos clientes disputariam
+  o GIL com o servidor).
+Imprime p50/p99 da latência por requisição, vazão e o lote médio.
+
+Uso:
+    python benchmarks/bench_inferencia.py [--clients 1 10 100] [--requests 200]
+    python painel_inferencia.py & python benchmarks/bench_inferencia.py --url http://127.0.0.1:8601
+"""
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Percentil por posição na lista ordenada"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_clients(call, records: list, clients: int, requests: int) -> dict:
+    """Dispara os clientes em paralelo e agrega as latências (ms) e a vazão (req/s)"""
+    latencies = [[] for _ in range(clients)]
+    barrier = threading.Barrier(clients + 1)
+
+    def client(number: int):
+        barrier.wait()
+        for i in range(requests):
+            record = records[(number * requests + i) % len(records)]
+            start = time.perf_counter()
+            call(record)
+            latencies[number].append((time.perf_counter() - start) * 1000)
+
+    threads = [threading.Thread(target=client, args=(number,)) for number in range(clients)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    flat = [value for values in latencies for value in values]
+    return {
+        "p50_ms": statistics.median(flat),
+        "p99_ms": percentile(flat, 0.99),
+        "throughput_rps": len(flat) / elapsed,
+    }
+
+
+def http_call(base_url: str):
+    """Cliente HTTP de uma instância por requisição"""
+    url = f"{base_url.rstrip('/')}/predict"
+
+    def call(record):
+        body = json.dumps({"instances": [record]}).encode("utf-8")
+        request = urllib.request.Request(url, body, {"Content-Type": "application/json"})
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())["scores"][0]
+
+    return call
+
+
+def server_stats(base_url: str) -> dict:
+    """Contadores do batcher do servidor (GET /health)"""
+    with urllib.request.urlopen(f"{base_url.rstrip('/')}/health") as response:
+        return json.loads(response.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--requests", type=int, default=200, help="requisições por cliente")
+    parser.add_argument("--url", help="mede também o servidor HTTP neste endereço")
+    parser.add_argument("--max-wait-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    from painel_inferencia import MAX_WAIT_MS, MicroBatcher
+    from painel_ingestao import WAZE_FILE, read_chunks
+    from painel_waze import MODEL_FILE, RAW_COLUMNS, load_churn_model
+
+    model = load_churn_model()
+    if model is None:
+        parser.exit(1, f"modelo não encontrado em {MODEL_FILE} (python painel_waze.py --train xgboost)\n")
+    max_wait_ms = MAX_WAIT_MS if args.max_wait_ms is None else args.max_wait_ms
+
+    sample = next(read_chunks(WAZE_FILE, "waze", 5000))
+    records = [
+        {**{column: float(row[column]) for column in RAW_COLUMNS}, "device": str(row["device"])}
+        for _, row in sample.iterrows()
+    ]
+
+    batcher = MicroBatcher(model.score_records, max_wait_ms=max_wait_ms)
+    modes = {
+        "direto": lambda record: model.score_records([record])[0],
+        "micro-batch": lambda record: batcher.submit(record).result(),
+    }
+    if args.url:
+        modes["http"] = http_call(args.url)
+
+    print(f"{'modo':<12} {'clientes':>8} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>9} {'lote médio':>11}")
+    for mode, call in modes.items():
+        for clients in args.clients:
+            before = server_stats(args.url) if mode == "http" else batcher.stats()
+            result = run_clients(call, records, clients, args.requests)
+            after = server_stats(args.url) if mode == "http" else batcher.stats()
+            batches = after["batches"] - before["batches"]
+            mean_batch = (after["rows"] - before["rows"]) / batches if batches and mode != "direto" else 1.0
+            print(
+                f"{mode:<12} {clients:>8} {result['p50_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+                f"{result['throughput_rps']:>9.0f} {mean_batch:>11.1f}"
+            )
+
+    batcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Pico de memória da ingestão em blocos vs. leitura integral dos notebooks.
+
+Gera uma base sintética no formato do Waze com --rows linhas (metade
+repetida, como nas cópias de extrações), e mede em processos novos o pico de
+RSS e o tempo de:
+- notebook: pd.read_csv + copy() + drop_duplicates(inplace=True);
+- ingestão: painel_ingestao.ingest (blocos tipados, deduplicação e Parquet).
+
+Uso:
+    python benchmarks/bench_ingestao.py [--rows 2000000] [--chunksize 100000]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+MEASURE = (
+    "import json, resource, time; t = time.perf_counter()\n"
+    "{code}\n"
+    "print(json.dumps({{'seconds': time.perf_counter() - t, "
+    "'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}}))"
+)
+
+CASES = {
+    "notebook": "import pandas as pd\ndf0 = pd.read_csv({csv!r})\ndf = df0.copy()\ndf.drop_duplicates(inplace=True)",
+    "ingestao": "import painel_ingestao\npainel_ingestao.ingest('waze', {csv!r}, {out!r}, {chunksize})",
+}
+
+
+def write_waze_csv(path: Path, rows: int, seed=0):
+    """Base sintética com as colunas e faixas do waze_dataset.csv (metade das linhas repetidas)"""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    n = rows // 2
+    frame = pd.DataFrame({
+        "ID": np.arange(n), "label": rng.choice(["retained", "churned"], n, p=[0.82, 0.18]),
+        "sessions": rng.integers(0, 744, n), "drives": rng.integers(0, 597, n),
+        "total_sessions": rng.random(n) * 1217, "n_days_after_onboarding": rng.integers(4, 3501, n),
+        "total_navigations_fav1": rng.integers(0, 1237, n), "total_navigations_fav2": rng.integers(0, 416, n),
+        "driven_km_drives": rng.random(n) * 21184, "duration_minutes_drives": rng.random(n) * 15852,
+        "activity_days": rng.integers(0, 31, n), "driving_days": rng.integers(0, 31, n),
+        "device": rng.choice(["Android", "iPhone"], n),
+    })
+    pd.concat([frame, frame]).to_csv(path, index=False)
+
+
+def measure(case: str, csv: Path, out: Path, chunksize: int) -> dict:
+    """Executa um caso em um processo novo"""
+    code = MEASURE.format(code=CASES[case].format(csv=str(csv), out=str(out), chunksize=chunksize))
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--child-write", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_write:
+        write_waze_csv(args.child_write, args.rows)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv = Path(tmp) / "waze.csv"
+        # Em outro processo: o pico de RSS do gerador não pode contaminar os processos medidos
+        subprocess.run([sys.executable, __file__, "--rows", str(args.rows), "--child-write", str(csv)], check=True)
+        print(f"{args.rows} linhas, {csv.stat().st_size / 1e6:.0f} MB de CSV")
+        for case in CASES:
+            result = measure(case, csv, Path(tmp) / "ingest", args.chunksize)
+            print(f"{case:<10} pico {result['peak_rss_mb']:>7.0f} MB  {result['seconds']:>6.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Teste de escala do painel com dados sintéticos (N = 10/100/1000/10000).
+
+Para cada N gera um arquivo com painel_sintetico, executa o app com AppTest
+em um processo novo (todas as abas renderizadas, instrumentação ligada) e
+coleta o tempo do primeiro run e do rerun quente, a quantidade de elementos,
+os bytes enviados e o tempo por seção. Entre tamanhos consecutivos reporta o
+expoente de crescimento (1.0 = linear); seções acima de --hotspot são
+marcadas como pontos quentes não lineares.
+
+Uso:
+    python benchmarks/bench_scaling.py [--sizes 10 100 1000 10000] [--timeout 900] [--out scaling.json]
+"""
+import argparse
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / "dashboard_painel_oficial.py"
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+HOTSPOT_EXPONENT = 1.2
+
+
+def app_child(runs: int):
+    """Executado no processo filho: roda o app e imprime as métricas em JSON"""
+    from streamlit.testing.v1 import AppTest
+
+    from bench_tabs import element_stats
+
+    at = AppTest.from_file(str(APP), default_timeout=3600)
+    start = time.perf_counter()
+    at.run()
+    first_run = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+    warm = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        warm.append(time.perf_counter() - start)
+
+    # Painel de depuração do último rerun (PAINEL_PROFILE=1)
+    rows = at.dataframe[-1].value.to_dict("records")
+    sections = {row["seção"]: row["ms"] for row in rows if row["seção"] != "total"}
+    count, size = element_stats(at._tree)
+    print(json.dumps({
+        "first_run_ms": first_run * 1000,
+        "warm_rerun_ms": statistics.median(warm) * 1000,
+        "elements": count,
+        "element_bytes": size,
+        "sections_ms": sections,
+    }))
+
+
+def measure_size(n: int, runs: int, timeout: float, workdir: Path) -> dict:
+    """Gera os dados para N e mede o app em um processo novo"""
+    from painel_sintetico import write_data
+
+    data_file = write_data(n, workdir / f"sintetico-{n}.json")
+    env = dict(os.environ, PAINEL_DATA_FILE=str(data_file), PAINEL_LAZY_TABS="0", PAINEL_PROFILE="1")
+    try:
+        out = subprocess.run(
+            [sys.executable, __file__, "--child-app", "--runs", str(runs)],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {"n": n, "timeout": True}
+    return {"n": n, **json.loads(out.stdout.strip().splitlines()[-1])}
+
+
+def growth(small: float, large: float, ratio: float) -> float:
+    """Expoente k de large/small = ratio**k (1.0 = crescimento linear)"""
+    if small <= 0 or large <= 0:
+        return float("nan")
+    return math.log(large / small) / math.log(ratio)
+
+
+def report(results: list, hotspot: float):
+    """Imprime a tabela por N e os expoentes de crescimento entre tamanhos"""
+    print(f"{'N':>6} {'1º run (ms)':>12} {'rerun (ms)':>11} {'elementos':>10} {'bytes':>11}")
+    for r in results:
+        if r.get("timeout"):
+            print(f"{r['n']:>6} {'timeout':>12}")
+            continue
+        print(
+            f"{r['n']:>6} {r['first_run_ms']:>12.1f} {r['warm_rerun_ms']:>11.1f} "
+            f"{r['elements']:>10} {r['element_bytes']:>11}"
+        )
+
+    done = [r for r in results if not r.get("timeout")]
+    for small, large in zip(done, done[1:]):
+        ratio = large["n"] / small["n"]
+        print(f"\nN {small['n']} → {large['n']}: expoente de crescimento (1.0 = linear)")
+        rows = [
+            ("rerun", growth(small["warm_rerun_ms"], large["warm_rerun_ms"], ratio)),
+            ("elementos", growth(small["elements"], large["elements"], ratio)),
+            ("bytes", growth(small["element_bytes"], large["element_bytes"], ratio)),
+        ]
+        rows += [
+            (f"seção {name}", growth(small["sections_ms"][name], large["sections_ms"].get(name, 0), ratio))
+            for name in small["sections_ms"]
+            if large["sections_ms"].get(name, 0) >= 1.0
+        ]
+        for name, exponent in rows:
+            flag = "  ← não linear" if exponent > hotspot else ""
+            print(f"  {name:<44} {exponent:>6.2f}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=900, help="limite por tamanho em segundos")
+    parser.add_argument("--hotspot", type=float, default=HOTSPOT_EXPONENT)
+    parser.add_argument("--out", type=Path, help="grava os resultados neste arquivo JSON")
+    parser.add_argument("--child-app", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_app:
+        app_child(args.runs)
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in args.sizes:
+            results.append(measure_size(n, args.runs, args.timeout, Path(workdir)))
+            if results[-1].get("timeout"):
+                break
+
+    report(results, args.hotspot)
+    if args.out:
+        args.out.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""Suíte de benchmarks do painel com baseline comparável entre commits.
+
+Mede, offline e sem navegador:
+- tempo de import dos módulos (streamlit, pandas, plotly e os módulos painel_*
+  de bench_imports), cada um em um processo novo, e quantas bibliotecas
+  pesadas (pandas, numpy, plotly) o import de cada módulo do painel carrega;
+- latência do primeiro run e do rerun quente do app via AppTest, e o pico de
+  RSS do processo, em um processo novo;
+- tempo por construtor (build_experience_df e os construtores de figura);
+- time-to-interactive estimado do perfil mobile (?mobile=1) em 3G limitado,
+  em duas visitas: a fria (processo recém-iniciado e navegador sem cache:
+  documento, bundle JS/CSS/fontes do Streamlit e a folha de estilo do tema
+  entram nos bytes) e a repetida (processo aquecido, bundle e tema em cache:
+  só os elementos e as imagens). Cada visita soma o tempo de script, as idas
+  e voltas da sua sequência e os bytes na banda do perfil. Sai com código 1
+  se a visita repetida passar do orçamento de 2 s; a fria é dominada pelo
+  bundle do Streamlit (~1,3 MB comprimido), fora do alcance do app, e é
+  acompanhada só pela comparação com o baseline.
+
+Os resultados são gravados em JSON (--out) e podem ser comparados com um
+baseline (--compare); o script sai com código 1 se alguma métrica piorar
+além da tolerância (métricas em ms só contam acima de um piso absoluto,
+para que imports de poucos ms não falhem por ruído; uma métrica que sai de
+zero, como um módulo pesado passando a ser carregado, sempre conta).
+
+Uso:
+    python benchmarks/bench_suite.py [--out benchmarks/baseline.json]
+    python benchmarks/bench_suite.py --compare benchmarks/baseline.json [--tolerance 0.25]
+"""
+import argparse
+import gzip
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+# Executado como script: a pasta benchmarks/ já está no sys.path
+from bench_imports import HEAVY, MODULES as PANEL_MODULES, import_times
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / "dashboard_painel_oficial.py"
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+BASELINE_FILE = ROOT / "benchmarks" / "baseline.json"
+DEFAULT_TOLERANCE = 0.25
+# Piora absoluta mínima (ms) para que uma métrica de tempo conte como regressão
+MIN_REGRESSION_MS = 5.0
+
+# Módulos medidos isoladamente (cada um em um processo novo)
+IMPORT_MODULES = ["streamlit", "pandas", "plotly.graph_objects", *PANEL_MODULES]
+
+# Data fixa para que o benchmark não dependa do dia em que roda
+REFERENCE_DAY = date(2025, 6, 1)
+
+# 3G limitado: equivalente DevTools do throttling móvel do Lighthouse (150 ms RTT, 1,6 Mbps)
+THROTTLED_3G = {"latency_ms": 562.5, "download_kbps": 1474.56}
+# Idas e voltas até o conteúdo em cada visita (+1 para buscar imagens e, na fria, a folha de estilo do tema)
+COLD_ROUND_TRIPS = ["documento", "bundle", "websocket", "script"]
+WARM_ROUND_TRIPS = ["documento", "websocket", "script"]
+MOBILE_TTI_BUDGET_MS = 2000.0
+# Tipos que o servidor do Streamlit comprime com gzip (compress_response do tornado, nível 6)
+COMPRESSED_SUFFIXES = (".html", ".js", ".css")
+
+IMPORT_SNIPPET = (
+    "import time, importlib; t = time.perf_counter(); "
+    "importlib.import_module({module!r}); "
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+
+def measure_imports(runs: int) -> dict:
+    """Mediana do tempo de import de cada módulo em processos novos (ms)"""
+    results = {}
+    for module in IMPORT_MODULES:
+        timings = []
+        for _ in range(runs):
+            out = subprocess.run(
+                [sys.executable, "-c", IMPORT_SNIPPET.format(module=module)],
+                cwd=ROOT, capture_output=True, text=True, check=True,
+            )
+            timings.append(float(out.stdout.strip().splitlines()[-1]))
+        results[module] = statistics.median(timings)
+    return results
+
+
+def measure_heavy_imports() -> dict:
+    """Bibliotecas pesadas (HEAVY) carregadas pelo import de cada módulo do painel (-X importtime)"""
+    startup = {name for _, _, name in import_times("pass")}
+    results = {}
+    for module in PANEL_MODULES:
+        loaded = {name for _, _, name in import_times(f"import {module}")} - startup
+        results[module] = sum(1 for name in HEAVY if name in loaded)
+    return results
+
+
+def app_child(runs: int):
+    """Executado no processo filho: roda o app com AppTest e imprime as métricas em JSON"""
+    import resource
+
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP), default_timeout=120)
+    start = time.perf_counter()
+    at.run()
+    first_run = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+    warm = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        warm.append(time.perf_counter() - start)
+
+    print(json.dumps({
+        "first_run_ms": first_run * 1000,
+        "warm_rerun_ms": statistics.median(warm) * 1000,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def transfer_size(path: Path) -> int:
+    """Bytes de um arquivo na rede (comprimido quando o servidor comprime o tipo)"""
+    content = path.read_bytes()
+    return len(gzip.compress(content, 6)) if path.suffix in COMPRESSED_SUFFIXES else len(content)
+
+
+def bundle_bytes() -> int:
+    """Bytes do documento e dos recursos que ele referencia (bundle JS/CSS e fontes do Streamlit)"""
+    import streamlit
+
+    static = Path(streamlit.__file__).parent / "static"
+    document = static / "index.html"
+    assets = re.findall(r'(?:src|href)="\./([^"]+)"', document.read_text(encoding="utf-8"))
+    return transfer_size(document) + sum(transfer_size(static / asset) for asset in assets)
+
+
+def visit_tti_ms(server_ms: float, round_trips: int, payload_bytes: int) -> float:
+    """Tempo de script + idas e voltas + transferência na banda do 3G limitado"""
+    transfer_ms = payload_bytes * 8 / THROTTLED_3G["download_kbps"]
+    return server_ms + round_trips * THROTTLED_3G["latency_ms"] + transfer_ms
+
+
+def mobile_child():
+    """Executado no processo filho: visita fria (primeira sessão do processo) e repetida (sessão nova, processo aquecido)"""
+    from streamlit.testing.v1 import AppTest
+
+    from bench_tabs import element_stats
+    from painel_imagens import STATIC_DIR, STATIC_URL
+    from painel_tema import CSS_DIR
+
+    def mobile_run():
+        at = AppTest.from_file(str(APP), default_timeout=120)
+        at.query_params["mobile"] = "1"
+        start = time.perf_counter()
+        at.run()
+        elapsed = (time.perf_counter() - start) * 1000
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+        return at, elapsed
+
+    _, cold_server_ms = mobile_run()  # imports e caches do processo, pagos uma vez por worker
+    at, warm_server_ms = mobile_run()
+
+    _, element_bytes = element_stats(at._tree)
+    pages = "".join(markdown.value for markdown in at.markdown)
+    # Gráficos pré-renderizados (painel_render), buscados como arquivos estáticos
+    images = re.findall(rf'class="chart-img" src="{STATIC_URL}/([^"]+)"', pages)
+    image_bytes = sum((STATIC_DIR / image).stat().st_size for image in images)
+    stylesheets = re.findall(r'rel="stylesheet" href="[^"]*/css/([^"]+)"', pages)
+    theme_bytes = sum(transfer_size(CSS_DIR / name) for name in stylesheets)
+    static_bundle = bundle_bytes()
+
+    warm_payload = element_bytes + image_bytes
+    cold_payload = static_bundle + theme_bytes + warm_payload
+    after_script = 1 if image_bytes or theme_bytes else 0
+    print(json.dumps({
+        "cold_server_ms": cold_server_ms,
+        "warm_server_ms": warm_server_ms,
+        "bundle_bytes": static_bundle + theme_bytes,
+        "payload_bytes": warm_payload,
+        "cold_tti_3g_ms": visit_tti_ms(cold_server_ms, len(COLD_ROUND_TRIPS) + after_script, cold_payload),
+        "warm_tti_3g_ms": visit_tti_ms(
+            warm_server_ms, len(WARM_ROUND_TRIPS) + (1 if image_bytes else 0), warm_payload
+        ),
+    }))
+
+
+def measure_mobile() -> dict:
+    """Estima o time-to-interactive do perfil mobile em 3G limitado (visita fria e repetida), em um processo novo"""
+    out = subprocess.run(
+        [sys.executable, __file__, "--child-mobile"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def measure_app(runs: int) -> dict:
+    """Mede o app em um processo novo (primeiro run, rerun quente e pico de RSS)"""
+    out = subprocess.run(
+        [sys.executable, __file__, "--child-app", "--runs", str(runs)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def measure_builders(runs: int) -> dict:
+    """Mediana do tempo por chamada de cada construtor (ms)"""
+    from painel_dados import load_data
+    from painel_figuras import (
+        create_progress_bars, create_skill_evolution_chart, create_skill_radar, create_timeline_chart,
+    )
+    from painel_modelo import EVOLUTION_SKILLS, EVOLUTION_YEARS, build_experience_df, build_skill_sets
+
+    data = load_data()
+    today = datetime.combine(REFERENCE_DAY, datetime.min.time())
+    df = build_experience_df(data["experiences"], today)
+    skills_core, skills_tools = build_skill_sets(data["skills"])
+
+    builders = {
+        "build_experience_df": lambda: build_experience_df(data["experiences"], today),
+        "create_timeline_chart": lambda: create_timeline_chart(df),
+        "create_skill_radar": lambda: create_skill_radar(skills_core),
+        "create_progress_bars": lambda: create_progress_bars(skills_tools, "Proficiência Técnica"),
+        "create_skill_evolution_chart": lambda: create_skill_evolution_chart(
+            data["skills"], EVOLUTION_SKILLS, EVOLUTION_YEARS
+        ),
+    }
+    results = {}
+    for name, call in builders.items():
+        call()
+        timings = timeit.repeat(call, number=1, repeat=runs)
+        results[name] = statistics.median(timings) * 1000
+    return results
+
+
+def git_revision() -> str:
+    """Commit atual (ou "unknown" fora de um repositório git)"""
+    out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    return out.stdout.strip() or "unknown"
+
+
+def run_suite(runs: int) -> dict:
+    """Executa todas as medições e retorna o resultado no formato do baseline"""
+    return {
+        "meta": {
+            "commit": git_revision(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": runs,
+        },
+        "metrics": {
+            "import_ms": measure_imports(runs),
+            "import_heavy": measure_heavy_imports(),
+            "app": measure_app(runs),
+            "mobile": measure_mobile(),
+            "builders_ms": measure_builders(runs * 4),
+        },
+    }
+
+
+def flatten(metrics: dict, prefix="") -> dict:
+    """Achata as métricas em {"grupo.nome": valor}"""
+    flat = {}
+    for key, value in metrics.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Imprime a comparação com o baseline e retorna as métricas que pioraram além da tolerância"""
+    now, before = flatten(current["metrics"]), flatten(baseline["metrics"])
+    regressions = []
+    print(f"{'métrica':<42} {'baseline':>10} {'atual':>10} {'Δ%':>8}")
+    for name, value in now.items():
+        if name not in before:
+            print(f"{name:<42} {'-':>10} {value:>10.2f} {'novo':>8}")
+            continue
+        if before[name]:
+            delta = (value - before[name]) / before[name]
+        else:
+            delta = float("inf") if value > 0 else 0.0
+        worse = delta > tolerance
+        if worse and "_ms" in name:
+            worse = value - before[name] > MIN_REGRESSION_MS
+        flag = " !" if worse else ""
+        print(f"{name:<42} {before[name]:>10.2f} {value:>10.2f} {delta * 100:>7.1f}%{flag}")
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--out", type=Path, help="grava o resultado neste arquivo JSON")
+    parser.add_argument("--compare", type=Path, help="compara com um baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="piora relativa tolerada (0.25 = 25%%)")
+    parser.add_argument("--child-app", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--child-mobile", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_app:
+        app_child(args.runs)
+        return
+    if args.child_mobile:
+        mobile_child()
+        return
+
+    result = run_suite(args.runs)
+    mobile = result["metrics"]["mobile"]
+    tti = mobile["warm_tti_3g_ms"]
+    print(
+        f"TTI mobile estimado em 3G: visita repetida {tti:.0f} ms (orçamento {MOBILE_TTI_BUDGET_MS:.0f} ms), "
+        f"visita fria {mobile['cold_tti_3g_ms']:.0f} ms ({mobile['bundle_bytes'] / 1024:.0f} KB de bundle)"
+    )
+    if args.out:
+        args.out.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"resultado gravado em {args.out}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(f"baseline: {baseline['meta']['commit']} ({baseline['meta']['created']})")
+        regressions = compare(result, baseline, args.tolerance)
+        if regressions:
+            print(f"FALHA: {len(regressions)} métrica(s) pioraram mais de {args.tolerance:.0%}", file=sys.stderr)
+            sys.exit(1)
+    elif not args.out:
+        print(json.dumps(result["metrics"], indent=2))
+
+    if tti > MOBILE_TTI_BUDGET_MS:
+        print(f"FALHA: TTI mobile da visita repetida acima do orçamento de {MOBILE_TTI_BUDGET_MS:.0f} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compara o modo de abas eager (st.tabs) com o modo lazy (só a aba ativa).
+
+Para cada modo executa o app com o AppTest do Streamlit e mede o tempo de
+script do primeiro run e de reruns quentes, a quantidade de elementos e os
+bytes dos protobufs de elementos enviados ao navegador (aproximação do
+tráfego no websocket).
+
+Uso:
+    python benchmarks/bench_tabs.py [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / "dashboard_painel_oficial.py"
+sys.path.insert(0, str(ROOT))
+
+
+def element_stats(node) -> tuple:
+    """Soma (quantidade, bytes) dos protobufs de elementos da árvore do AppTest"""
+    count, size = 0, 0
+    children = getattr(node, "children", None)
+    if children:
+        for child in children.values():
+            child_count, child_size = element_stats(child)
+            count += child_count
+            size += child_size
+    elif getattr(node, "proto", None) is not None:
+        count, size = 1, node.proto.ByteSize()
+    return count, size
+
+
+def measure(lazy: bool, runs: int) -> dict:
+    """Executa o app no modo indicado e coleta tempos e tamanho do payload"""
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["PAINEL_LAZY_TABS"] = "1" if lazy else "0"
+    at = AppTest.from_file(str(APP), default_timeout=120)
+
+    start = time.perf_counter()
+    at.run()
+    first_run = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+    warm = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        warm.append(time.perf_counter() - start)
+
+    count, size = element_stats(at._tree)
+    return {
+        "mode": "lazy" if lazy else "eager",
+        "first_run_ms": first_run * 1000,
+        "warm_rerun_ms": statistics.median(warm) * 1000,
+        "elements": count,
+        "element_bytes": size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'modo':<6} {'1º run (ms)':>12} {'rerun (ms)':>11} {'elementos':>10} {'bytes':>9}")
+    for lazy in (False, True):
+        r = measure(lazy, args.runs)
+        print(
+            f"{r['mode']:<6} {r['first_run_ms']:>12.1f} {r['warm_rerun_ms']:>11.1f} "
+            f"{r['elements']:>10} {r['element_bytes']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Throughput do motor de score de turnover: linha a linha vs. lote.
+
+Carrega o modelo gravado (python painel_turnover.py train) e pontua a base de
+RH replicada até --rows linhas, uma chamada por linha (como seria pontuar cada
+simulação do painel isoladamente) e em lotes de --batch linhas.
+
+Uso:
+    python benchmarks/bench_turnover.py [--rows 10000] [--batch 5000] [--single 200]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def rows_per_second(model, frame, batch: int) -> float:
+    """Linhas pontuadas por segundo em chamadas de batch linhas"""
+    start = time.perf_counter()
+    for offset in range(0, len(frame), batch):
+        model.score(frame.iloc[offset:offset + batch])
+    return len(frame) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, default=5_000)
+    parser.add_argument("--single", type=int, default=200, help="linhas pontuadas uma a uma")
+    args = parser.parse_args()
+
+    import pandas as pd
+
+    from painel_turnover import DATA_FILE, MODEL_FILE, TARGET, load_model
+
+    model = load_model()
+    if model is None:
+        parser.exit(1, f"modelo não encontrado em {MODEL_FILE} (python painel_turnover.py train)\n")
+
+    base = pd.read_csv(DATA_FILE).drop(columns=[TARGET])
+    frame = pd.concat([base] * (args.rows // len(base) + 1), ignore_index=True).iloc[:args.rows]
+    model.score(frame.iloc[:10])  # aquecimento
+
+    single = rows_per_second(model, frame.iloc[:args.single], 1)
+    batched = rows_per_second(model, frame, args.batch)
+    print(f"linha a linha: {single:>10.0f} linhas/s")
+    print(f"lote de {args.batch}: {batched:>10.0f} linhas/s ({batched / single:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,48 @@
+import json
+import os
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+from datetime import date
+
+from painel_cache import CACHE, cache_key
+from painel_dados import load_data
+from painel_figuras import (
+    MOBILE_IMAGE_FORMAT, create_language_bars, create_progress_bars, create_skill_evolution_chart,
+    create_skill_radar, create_timeline_chart, figure_content_hash, mobile_spec,
+)
+from painel_html import (
+    SOCIAL_LINKS, area_card_html, bio_card_html, certification_card_html, chart_image_html, compact_html,
+    contact_card_html, education_card_html, experience_card_body, experience_card_title, footer_html, grid_html,
+    growth_card_html, highlights_card_html, kpi_card_html, milestone_card_html, page_header_html,
+    philosophy_card_html, profile_picture_block_html, project_card_body, project_card_title, search_results_html,
+    sidebar_footer_html, sidebar_header_html, social_link_html, soft_skill_bar_html, specializations_card_html,
+    versatility_card_html,
+)
+from painel_imagens import load_profile_manifest
+from painel_inferencia import PREDICT_TIMEOUT, MicroBatcher
+from painel_indice import get_index
+from painel_modelo import (
+    EVOLUTION_SKILLS, EVOLUTION_YEARS, build_kpis, build_skill_outlook,
+    build_skill_sets, build_career_frame, compute_career_model, format_percent, skill_delta_label,
+)
+from painel_perfil import (
+    PROFILING, finish_run, profile_builder, profile_section, register_gauges, start_metrics_server, start_run,
+)
+from painel_render import RENDERER
+from painel_tema import theme_link_tag
+from painel_turnover import load_model
+from painel_waze import load_churn_model
+
+# --- PERFIL DE EXECUÇÃO (opcional, PAINEL_PROFILE=1)
+start_run()
+start_metrics_server()
 
 # --- MOBILE DETECTION
 def is_mobile():
-    """Detecta se o usuário está em dispositivo móvel"""
+    """Detecta se o usuário está em dispositivo móvel (?mobile=1 ou ?mobile=0 força o perfil)"""
+    forced = st.query_params.get("mobile")
+    if forced in ("0", "1"):
+        return forced == "1"
     try:
         user_agent = st.context.headers.get("User-Agent", "").lower()
         mobile_keywords = ["android", "iphone", "ipad", "mobile"]
@@ -15,6 +50,7 @@ def is_mobile():
     except Exception:
         return False
 
+# Perfil mobile: imagens estáticas no lugar dos gráficos, CSS enxuto e seções secundárias sob demanda
 IS_MOBILE = is_mobile()
 
 # --- PAGE CONFIG
@@ -25,1251 +61,454 @@ st.set_page_config(
     initial_sidebar_state="collapsed" if IS_MOBILE else "expanded",
 )
 
-# --- CORES E TEMAS
-DARK_BG = "#0f1116"
-CARD_BG = "#1e1e1e"
-ACCENT_BG = "#262626"
-PRIMARY = "#2e86de"
-SECONDARY = "#10ac84"
-ACCENT = "#ff9f43"
-NEUTRAL = "#bdc3c7"
-TEXT = "#ecf0f1"
-TEXT_LIGHT = "#95a5a6"
-BORDER = "#34495e"
-
-# --- CSS CUSTOMIZADO
-st.markdown(f"""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Source+Sans+Pro:wght@300;400;600;700&display=swap');
-
-* {{
-    font-family: 'Inter', 'Source Sans Pro', system-ui, sans-serif;
-}}
-
-[data-testid="stAppViewContainer"] {{
-    background: {DARK_BG};
-    color: {TEXT};
-}}
-
-[data-testid="stSidebar"] {{
-    background: {ACCENT_BG};
-}}
-
-[data-testid="stSidebar"] > div:first-child {{
-    background: {ACCENT_BG};
-}}
-
-/* Remove padding padrão do Streamlit no sidebar */
-section[data-testid="stSidebar"] > div {{
-    padding-top: 2rem;
-    padding-left: 1rem;
-    padding-right: 1rem;
-}}
-
-.data-card {{
-    background: {CARD_BG};
-    border-radius: 12px;
-    border: 1px solid {BORDER};
-    padding: 1.5rem;
-    margin-bottom: 1.5rem;
-    box-shadow: 0 4px 20px rgba(0,0,0,0.3);
-    transition: all 0.3s ease;
-}}
-
-.data-card:hover {{
-    transform: translateY(-2px);
-    box-shadow: 0 6px 25px rgba(0,0,0,0.4);
-}}
-
-.story-kpi {{
-    background: {CARD_BG};
-    padding: 1.5rem;
-    border-radius: 12px;
-    border-left: 4px solid {PRIMARY};
-    box-shadow: 0 4px 20px rgba(0,0,0,0.3);
-    margin-bottom: 1rem;
-    text-align: center;
-    transition: all 0.3s ease;
-}}
-
-.story-kpi:hover {{
-    transform: translateY(-2px);
-}}
-
-.story-kpi b {{
-    font-size: 28px;
-    color: {TEXT};
-    font-weight: 700;
-    display: block;
-}}
-
-.story-kpi small {{
-    font-size: 12px;
-    color: {TEXT_LIGHT};
-    text-transform: uppercase;
-    font-weight: 600;
-    letter-spacing: 0.5px;
-    display: block;
-    margin-bottom: 0.5rem;
-}}
-
-.story-kpi .trend {{
-    font-size: 12px;
-    margin-top: 0.5rem;
-    display: block;
-}}
-
-.story-kpi .trend.positive {{
-    color: {SECONDARY};
-}}
-
-.story-kpi .trend.negative {{
-    color: #e74c3c;
-}}
-
-.story-kpi.highlight {{
-    border-left-color: {SECONDARY};
-    background: linear-gradient(135deg, {CARD_BG}, {ACCENT_BG});
-}}
-
-.data-badge {{
-    display: inline-block;
-    padding: 6px 14px;
-    background: rgba(46,134,222,0.15);
-    color: {PRIMARY};
-    border-radius: 20px;
-    font-size: 12px;
-    font-weight: 600;
-    margin: 3px 5px;
-    border: 1px solid rgba(46,134,222,0.3);
-    backdrop-filter: blur(10px);
-}}
-
-.data-badge.secondary {{
-    background: rgba(16,172,132,0.15);
-    color: {SECONDARY};
-    border-color: rgba(16,172,132,0.3);
-}}
-
-.data-badge.accent {{
-    background: rgba(255,159,67,0.15);
-    color: {ACCENT};
-    border-color: rgba(255,159,67,0.3);
-}}
-
-.story-grid {{
-    display: grid;
-    grid-template-columns: repeat(4, 1fr);
-    gap: 1rem;
-    margin: 2rem 0;
-}}
-
-.main-header {{
-    background: linear-gradient(135deg, {DARK_BG} 0%, {ACCENT_BG} 100%);
-    border-bottom: 1px solid {BORDER};
-    padding: 3rem 0 2rem 0;
-    margin-bottom: 2rem;
-    text-align: center;
-}}
-
-.stMetric {{
-    background: {CARD_BG} !important;
-    border: 1px solid {BORDER} !important;
-    border-radius: 12px !important;
-    padding: 1rem !important;
-}}
-
-.stExpander {{
-    background: {CARD_BG} !important;
-    border: 1px solid {BORDER} !important;
-    border-radius: 12px !important;
-}}
-
-::-webkit-scrollbar {{
-    width: 8px;
-}}
-
-::-webkit-scrollbar-track {{
-    background: {DARK_BG};
-}}
-
-::-webkit-scrollbar-thumb {{
-    background: {PRIMARY};
-    border-radius: 4px;
-}}
-
-::-webkit-scrollbar-thumb:hover {{
-    background: {SECONDARY};
-}}
-
-@media (max-width: 1024px) {{
-    .story-grid {{
-        grid-template-columns: repeat(2, 1fr);
-    }}
-}}
-
-@media (max-width: 640px) {{
-    .story-grid {{
-        grid-template-columns: 1fr;
-    }}
-    
-    .data-card, .story-kpi {{
-        padding: 1rem;
-    }}
-    
-    .story-kpi b {{
-        font-size: 22px;
-    }}
-}}
-</style>
-""", unsafe_allow_html=True)
-
-# --- DADOS BASE
-PROFILE = {
-    "name": "Murillo Martins",
-    "headline": "Data Analyst | Data Science | Marketing | Analytics",
-    "location": "São Paulo, Brasil",
-    "email": "murilomartins09@gmail.com",
-    "site": "https://www.murillomartins.com.br",
-    "linkedin": "https://www.linkedin.com/in/murillomartins101",
-    "github": "https://github.com/murillomartins101",
-    "instagram": "https://www.instagram.com/murillomartins101",
-    "bio": "Analista de Dados com mais de 15 anos de experiência em marketing, inteligência comercial e estratégia. Especialista em transformar dados complexos em insights acionáveis através de Python, SQL, Power BI e Machine Learning."
-}
-
-EXPERIENCES = [
-    {
-        "company": "Honda Brasil",
-        "role": "Analista de Dados",
-        "start": "2025-03",
-        "end": None,
-        "city": "São Paulo",
-        "achievements": [
-            "Dataviz para análise de produtividade e performance",
-            "Criação e Manutenção de Dashboards executivos em Power BI",
-            "Estratégias orientadas a dados para crescimento",
-            "Desenvolvimento de materiais e treinamento das áreas de negócio para adoção de cultura data-driven",
-            "Automatização de relatórios e processos com Python e SQL",
-            "Trabalho com equipes cross-functional para implementação de soluções analíticas"
-        ],
-        "skills": ["Python", "SQL", "Power BI", "ML"]
-    },
-    {
-        "company": "Honda Brasil",
-        "role": "Analista de Operações Internacionais",
-        "start": "2023-04",
-        "end": "2025-02",
-        "city": "São Paulo / LATAM",
-        "achievements": [
-            "Gestão de distribuidores (Ecuador, Colômbia, Panamá, Suriname, Venezuela)",
-            "Planejamento comercial, budget, marketing, vendas e expansão de portfólio",
-            "Análise de performance e inteligência de mercado na região LATAM",
-            "Coordenação de projetos cross-functional com equipes globais",
-            "Liderança de iniciativas de pricing e estratégias de entrada em novos mercados"
-        ],
-        "skills": ["Comercial", "Planejamento", "Pricing", "LATAM"]
-    },
-    {
-        "company": "Honda Brasil",
-        "role": "Consultor Comercial",
-        "start": "2019-06",
-        "end": "2023-03",
-        "city": "São Paulo",
-        "achievements": [
-            "Gestão de negócios em Concessionárias 4 rodas e 2 rodas (Brasil)",
-            "Marketing, Produtos Financeiros, Vendas, Planejamento comercial",
-            "Análise de performance e KPIs comerciais",
-            "Desenvolvimento de campanhas de marketing e vendas orientadas a dados",
-            "Liderança de projetos de melhoria contínua e otimização de processos"
-        ],
-        "skills": ["Serviços Financeiros", "Marketing", "Comercial", "Planejamento", "Pricing"]
-    },
-    {
-        "company": "Aditivo Media",
-        "role": "Founder | Head of Everything",
-        "start": "2015-06",
-        "end": "2019-06",
-        "city": "São Paulo",
-        "achievements": [
-            "Mais de 100k visitas orgânicas em projetos de clientes",
-            "Campanhas de performance e conteúdos data-driven",
-            "Estratégias de crescimento e marketing digital",
-            "Produção de conteúdo, SEO, Social Media e Paid Media",
-            "Consultoria para startups e PMEs em marketing digital e growth",
-            "Análise de dados para otimização de campanhas e estratégias"
-        ],
-        "skills": ["Marketing", "Digital Strategy", "Growth", "SEO", "Branding"]
-    },
-    {
-        "company": "CNH Industrial Capital",
-        "role": "Field Representative",
-        "start": "2011-09",
-        "end": "2015-06",
-        "city": "São Paulo",
-        "achievements": [
-            "Forecast de vendas e inteligência de mercado",
-            "Análise de performance e KPIs comerciais",
-            "Financiamento de máquinas agrícolas e comerciais - Iveco, Case e New Holland",
-            "Desenvolvimento de dashboards e relatórios gerenciais"
-            ],
-        "skills": ["Serviços Financeiros", "BNDES", "Forecast", "BI"]
-    },
-    {
-        "company": "Banco Mercedes-Benz",
-        "role": "Analista de F&I",
-        "start": "2010-01",
-        "end": "2011-09",
-        "city": "São Paulo",
-        "achievements": [
-            "Forecast de vendas e inteligência de mercado",
-            "Análise de performance e KPIs comerciais",
-            "Financiamento de ônibus e caminhões - Mercedes-Benz",
-            "Análise de empresas para crédito e financiamento"
-            ],
-        "skills": ["Serviços Financeiros", "BNDES", "Marketing", "Analytics", "CRM"]
-    }
-]
-
-PROJECTS = [
-    { 
-    "title": "Análise de Turnover – Case RH (XGBoost com PyCaret)",
-    "summary": "Estudo completo de EDA e Machine Learning aplicado à retenção de talentos. O projeto envolveu tratamento de dados, engenharia de variáveis e treinamento com XGBoost via PyCaret para prever risco de desligamento e apoiar decisões estratégicas do RH.",
-    "metrics": {"Accuracy": 0.87, "AUC": 0.81, "Recall": 0.86, "Lift@10%": 2.8},
-    "tags": ["Python", "PyCaret", "XGBoost", "EDA", "Feature Engineering", "SHAP", "Data Storytelling"],
-    "link": "https://github.com/murillomartins101"
-    },
-    {
-        "title": "Churn Prediction – Waze App",
-        "summary": "Análise exploratória e pipeline de machine learning usando Random Forest e XGBoost para prever churn de usuários e identificar fatores de retenção no app Waze.",
-        "metrics": {
-        "Accuracy": 0.81,
-        "Precision": 0.44,
-        "Recall": 0.18,
-        "F1": 0.24
-    },
-    "tags": ["Python", "Scikit-learn", "XGBoost", "EDA", "Machine Learning", "Classification"],
-    "link": "https://github.com/murillomartins101"
-    },
-    {
-        "title": "Murillo Martins – Carreira como Baterista Profissional",
-        "summary": "Mais de 20 anos de trajetória como baterista, atuando em bandas de pop rock e metal. Performances no Brasil e exterior, incluindo apresentação no lendário The Cavern Club (Liverpool).",
-        "metrics": {
-            "Anos_experiência": 20,
-            "Shows_realizados": "300+",
-            "Países": "10+",
-            "Views_Youtube": "125k+",
-            "Watch_time": "4.1K+",
-            "Projetos_ativos": 3
-        },
-    "tags": ["Baterista", "Performance", "Analytics", "Produção Artística", "Marketing Digital", "Educador"],
-        "link": "https://www.murillomartins.com.br/"
-    },
-    {
-        "title": "Machinage – Conteúdo, Growth & Produção Musical",
-        "summary": "Retomada da banda após 8 anos de hiato. Atuação como baterista, produtor artístico e estrategista de marketing digital.",
-        "metrics": {"Status": "Em andamento"},
-        "tags": ["Baterista", "Estratégia Digital", "Marketing", "Growth", "Analytics", "YouTube"],
-        "link": "https://www.instagram.com/machinageband/"
-    },
-    {
-    "title": "RockBuzz – Business Finance (Backstage)",
-    "summary": """**Sistema financeiro completo da banda RockBuzz**, desenvolvido em **Streamlit** e integrado ao **Google Sheets**:
-
-    - Substitui planilhas manuais por uma plataforma automatizada que centraliza lançamentos, fechamentos e rateio.  
-    - Importa planilhas antigas e padroniza automaticamente os dados (datas, categorias e valores em R$).  
-    - Calcula ticket médio, resultados e KPIs em tempo real.  
-    - Utiliza controle seguro por linha (_row_) para rastreabilidade e edição precisa.  
-    - Possui +10 regras de negócio implementadas, incluindo validação automática, fechamento mensal e rateio por centro de custo.    
-    - Interface responsiva com acesso web e mobile para todos os integrantes.  
-    """,
-    "tags": ["Streamlit", "Google Sheets", "Financeiro de Banda", "Automação", "KPIs", "Dashboards"]
-    },
-    {
-        "title": "RockBuzz – GigFlow",
-        "summary": "Sistema que substitui planilhas manuais por uma plataforma automatizada, reduzindo drasticamente o tempo de envio de propostas e aumentando a taxa de fechamento de contratos. Todos os integrantes podem acessar mobile e gerenciar orçamentos, contratos e históricos de forma rápida e eficiente.",
-        "metrics": {
-        "Taxa de Aceite": "100% (antes 20%)",
-        "Tempo Médio de Geração": "03 min (antes ~05 horas)",
-  },
-  "tags": ["Música ao vivo", "Automação", "Contratos", "Orçamentos", "Aditivo Media"],
-  "link": "https://www.bandarockbuzz.com.br/"
-    },
-    {
-        "title": "RockBuzz – Conteúdo, Growth & Performance",
-        "summary": "Criação e consolidação da banda como projeto de entretenimento ao vivo.",
-        "metrics": {"Views": "250k+", "CTR": "6.5%"},
-        "tags": ["Baterista", "Estratégia Digital", "Marketing", "Growth", "Analytics", "YouTube"],
-        "link": "https://www.bandarockbuzz.com.br/"
-    }
-]
-
-EDUCATION = [
-    {"title": "Ciência da Computação (em andamento)", "org": "UniAnchieta", "year": "2025"},
-    {"title": "Power BI Analyst Certificate", "org": "Microsoft", "year": "2024"},
-    {"title": "Google Advanced Data Analytics Certificate", "org": "Google", "year": "2024"},
-    {"title": "Google Data Analytics Certificate", "org": "Google", "year": "2023"},
-    {"title": "Digital Marketing Specialization", "org": "University of Illinois", "year": "2020"},
-    {"title": "MBA em Comércio Exterior", "org": "UniAnchieta", "year": "2012"},
-    {"title": "B.Tech em Marketing", "org": "UniAnchieta", "year": "2010"}
-]
-
-# --- DADOS UNIFICADOS DE HABILIDADES (fonte única de verdade)
-SKILLS_DATA = {
-    "Python": {"current": 87, "history": {2019: 40, 2021: 55, 2023: 70, 2024: 80, 2025: 87}},
-    "Power BI": {"current": 85, "history": {2019: 20, 2021: 35, 2023: 60, 2024: 75, 2025: 85}},
-    "SQL": {"current": 70, "history": {2019: 30, 2021: 40, 2023: 55, 2024: 65, 2025: 70}},
-    "Machine Learning": {"current": 65, "history": {2019: 15, 2021: 25, 2023: 40, 2024: 55, 2025: 65}},
-    "Data Storytelling": {"current": 92, "history": {2019: 75, 2021: 80, 2023: 85, 2024: 90, 2025: 92}},
-    "Streamlit": {"current": 70, "history": {2019: 0, 2021: 20, 2023: 45, 2024: 60, 2025: 70}},
-    "AWS": {"current": 50, "history": {2019: 10, 2021: 20, 2023: 35, 2024: 45, 2025: 50}},
-    "Databricks": {"current": 55, "history": {2019: 0, 2021: 15, 2023: 35, 2024: 50, 2025: 55}},
-}
-
-# Competências derivadas de SKILLS_DATA
-SKILLS_CORE = {
-    "Business Strategy & Growth": 94,
-    "Data Storytelling & Comunicação": SKILLS_DATA["Data Storytelling"]["current"],
-    "Python (Pandas, Scikit-learn, Plotly)": SKILLS_DATA["Python"]["current"],
-    "Power BI & Data Visualization": SKILLS_DATA["Power BI"]["current"],
-    "Estatística Aplicada": 60,
-    "Machine Learning": SKILLS_DATA["Machine Learning"]["current"],
-    "SQL & Databricks": SKILLS_DATA["SQL"]["current"],
-    "Project Management (Agile & Cross-functional)": 80,
-    "Marketing Analytics": 88
-}
-
-# Ferramentas derivadas de SKILLS_DATA
-SKILLS_TOOLS = {
-    "Python": SKILLS_DATA["Python"]["current"],
-    "SQL": SKILLS_DATA["SQL"]["current"],
-    "Power BI": SKILLS_DATA["Power BI"]["current"],
-    "Streamlit": SKILLS_DATA["Streamlit"]["current"],
-    "AWS": SKILLS_DATA["AWS"]["current"],
-    "Databricks": SKILLS_DATA["Databricks"]["current"]
-}
-
-LANGUAGES = {
-    "Alemão": 30,
-    "Espanhol": 70,
-    "Inglês": 95,
-    "Português": 100      
-}
-
-# --- FUNÇÕES AUXILIARES
-def apply_dark_theme(fig):
-    """Aplica tema escuro consistente aos gráficos Plotly"""
-    fig.update_layout(
-        template="plotly_dark",
-        paper_bgcolor=DARK_BG,
-        plot_bgcolor=CARD_BG,
-        font=dict(family="Inter, sans-serif", size=12, color=TEXT),
-        margin=dict(l=20, r=20, t=40, b=20),
-        legend=dict(
-            bgcolor=CARD_BG,
-            bordercolor=BORDER,
-            borderwidth=1,
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        colorway=[PRIMARY, SECONDARY, ACCENT, "#8c564b", "#e377c2", "#7f7f7f"]
-    )
-    fig.update_xaxes(
-        gridcolor=BORDER,
-        linecolor=BORDER,
-        tickfont=dict(size=10, color=TEXT_LIGHT)
-    )
-    fig.update_yaxes(
-        gridcolor=BORDER,
-        linecolor=BORDER,
-        tickfont=dict(size=10, color=TEXT_LIGHT)
-    )
-    return fig
-
-def ym_to_date(ym: str) -> datetime:
-    """Converte string YYYY-MM para datetime"""
-    return datetime.strptime(f"{ym}-01", "%Y-%m-%d")
-
-def format_duration(rd: relativedelta) -> str:
-    """Formata relativedelta em string legível"""
-    years, months = rd.years, rd.months
-    parts = []
-    if years:
-        parts.append(f"{years} ano{'s' if years > 1 else ''}")
-    if months:
-        parts.append(f"{months} mes{'es' if months > 1 else ''}")
-    return " e ".join(parts) if parts else "0 meses"
-
-def build_experience_df(experiences):
-    """Constrói DataFrame de experiências profissionais"""
-    rows = []
-    today = datetime.today()
-    
-    for exp in experiences:
-        start = ym_to_date(exp["start"])
-        end = ym_to_date(exp["end"]) if exp["end"] else today
-        duration = relativedelta(end, start)
-        
-        rows.append({
-            "Empresa": exp["company"],
-            "Cargo": exp["role"],
-            "Início": start,
-            "Fim": end,
-            "Cidade": exp.get("city", ""),
-            "Duração": duration,
-            "Duracao_str": format_duration(duration),
-            "Desc": " • ".join(exp.get("achievements", []))
-        })
-    
-    return pd.DataFrame(rows).sort_values("Início", ascending=False)
-
-def create_timeline_chart(df: pd.DataFrame):
-    """Cria gráfico de timeline profissional"""
-    role_colors = {
-        "Analista de Dados": PRIMARY,
-        "Analista de Operações Internacionais": SECONDARY,
-        "Consultor Comercial": ACCENT,
-        "Founder | Head of Everything": "#8c564b",
-        "Field Representative": "#e377c2",
-        "Analista de F&I": TEXT_LIGHT
-    }
-    
-    fig = px.timeline(
-        df,
-        x_start="Início",
-        x_end="Fim",
-        y="Empresa",
-        color="Cargo",
-        color_discrete_map=role_colors,
-        custom_data=["Empresa", "Cargo", "Cidade", "Início", "Fim", "Duracao_str", "Desc"]
-    )
-    
-    fig.update_traces(
-        marker=dict(line=dict(color=CARD_BG, width=2)),
-        hovertemplate=(
-            "<b>%{customdata[0]}</b><br>"
-            "Cargo: %{customdata[1]}<br>"
-            "Local: %{customdata[2]}<br>"
-            "Período: %{customdata[3]|%b %Y} – %{customdata[4]|%b %Y}<br>"
-            "Duração: %{customdata[5]}<br>"
-            "<em>%{customdata[6]}</em><extra></extra>"
-        )
-    )
-    
-    fig.update_yaxes(autorange="reversed", title=None, showgrid=False)
-    fig.update_xaxes(tickformat="%Y", dtick="M12", title=None)
-    
-    apply_dark_theme(fig)
-    fig.update_layout(
-        height=400,
-        legend=dict(
-            title="Evolução da Carreira",
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="center",
-            x=0.5
-        )
-    )
-    
-    return fig
-
-def create_skill_radar(skills: dict):
-    """Cria gráfico radar de competências"""
-    labels = list(skills.keys())
-    values = list(skills.values())
-    avg_value = sum(values) / len(values)
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatterpolar(
-        r=values,
-        theta=labels,
-        fill='toself',
-        fillcolor=f'rgba(46, 134, 222, 0.2)',
-        line=dict(color=PRIMARY, width=2),
-        name="Competências Atuais"
-    ))
-    
-    fig.add_trace(go.Scatterpolar(
-        r=[avg_value] * len(labels),
-        theta=labels,
-        line=dict(color=TEXT_LIGHT, width=1, dash='dash'),
-        name="Média"
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            bgcolor=CARD_BG,
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                gridcolor=BORDER,
-                linecolor=BORDER
-            ),
-            angularaxis=dict(
-                gridcolor=BORDER,
-                linecolor=BORDER
-            )
-        ),
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="center",
-            x=0.5
+# Renderiza só a aba ativa (PAINEL_LAZY_TABS=0 volta às st.tabs com todas as abas)
+LAZY_TABS = os.environ.get("PAINEL_LAZY_TABS", "1") != "0"
+
+# Itens por página nas listas de experiências e projetos (busca e paginação só acima disso)
+LIST_PAGE_SIZE = 10
+
+# Validade das entradas do cache compartilhado (painel_cache): derivados do dia e buscas
+DERIVED_TTL = 24 * 3600
+SEARCH_TTL = 10 * 60
+
+# Contadores do cache publicados no painel de depuração e no servidor de métricas
+register_gauges("cache", CACHE.stats)
+
+# --- CSS CUSTOMIZADO (compilado uma vez por processo em painel_tema e servido como arquivo estático)
+with profile_section("css"):
+    st.markdown(theme_link_tag(IS_MOBILE), unsafe_allow_html=True)
+
+# --- DADOS BASE (data/perfil.json, recarregado quando o arquivo muda)
+with profile_section("dados"):
+    DATA = load_data()
+    PROFILE = DATA["profile"]
+    EXPERIENCES = DATA["experiences"]
+    PROJECTS = DATA["projects"]
+    EDUCATION = DATA["education"]
+
+    # --- DADOS UNIFICADOS DE HABILIDADES (fonte única de verdade)
+    SKILLS_DATA = DATA["skills"]
+
+    # Competências e ferramentas derivadas de SKILLS_DATA
+    SKILLS_CORE, SKILLS_TOOLS = build_skill_sets(SKILLS_DATA)
+
+    LANGUAGES = DATA["languages"]
+
+    # Índice invertido (busca e contadores), reconstruído só quando os dados mudam
+    INDEX = get_index(DATA)
+
+# --- CACHE COMPARTILHADO (figuras, derivados e fragmentos HTML)
+def cached(namespace: str, compute, *key_parts, ttl=None):
+    """Resultado de compute() compartilhado entre sessões, indexado pelo conteúdo dos dados"""
+    return CACHE.get_or_compute(namespace, cache_key(DATA["content_hash"], *key_parts), compute, ttl)
+
+def _build_figure_json(builder, args: tuple, kwargs: dict) -> str:
+    """Constrói a figura e a serializa em JSON (apenas em cache miss)"""
+    with profile_builder(builder.__name__):
+        return builder(*args, **kwargs).to_json()
+
+def cached_figure(builder, *args, **kwargs) -> dict:
+    """Retorna a figura serializada, compartilhada entre sessões e indexada pelo conteúdo"""
+    content_hash = figure_content_hash(builder.__name__, args, kwargs)
+    return json.loads(CACHE.get_or_compute("figure", content_hash, lambda: _build_figure_json(builder, args, kwargs)))
+
+def show_figure(builder, *args, **kwargs):
+    """Exibe a figura em cache com largura do contêiner (medida como seção própria).
+
+    No mobile envia a imagem pré-renderizada (painel_render) como arquivo estático; enquanto ela não
+    existe, agenda a renderização no pool e envia o gráfico sem interação e com hover reduzido.
+    """
+    with profile_section(f"figura:{builder.__name__}"):
+        spec = cached_figure(builder, *args, **kwargs)
+        if not IS_MOBILE:
+            st.plotly_chart(spec, use_container_width=True)
+            return
+        url = RENDERER.cached_url(spec, MOBILE_IMAGE_FORMAT)
+        if url:
+            st.markdown(chart_image_html(url, spec["layout"].get("title", {}).get("text", "Gráfico")), unsafe_allow_html=True)
+        else:
+            RENDERER.submit(spec, MOBILE_IMAGE_FORMAT)
+            st.plotly_chart(mobile_spec(spec), use_container_width=True, config={"staticPlot": True})
+
+def html_block(name: str, fragments, *key_parts, ttl=None):
+    """Envia os fragmentos de fragments() como um único elemento, renderizado uma vez e compartilhado entre sessões"""
+    st.markdown(cached("html", lambda: compact_html(fragments()), name, *key_parts, ttl=ttl), unsafe_allow_html=True)
+
+def _reset_pages(pages_key: str):
+    """Volta a lista para a primeira página (nova busca)"""
+    st.session_state[pages_key] = 1
+
+def _load_more(pages_key: str):
+    """Acrescenta uma página à janela visível"""
+    st.session_state[pages_key] = st.session_state.get(pages_key, 1) + 1
+
+def _show_section(state_key: str):
+    """Libera uma seção adiada pelo restante da sessão"""
+    st.session_state[state_key] = True
+
+def deferred_section(name: str, label: str, render):
+    """Seção secundária: no desktop é renderizada direto; no mobile só depois do botão "Mostrar ..." """
+    state_key = f"show_{name}"
+    if not IS_MOBILE or st.session_state.get(state_key):
+        render()
+    else:
+        st.button(f"Mostrar {label}", key=f"btn_{name}", on_click=_show_section, args=(state_key,), use_container_width=True)
+
+def _toggle_card(open_key: str, item_id: int):
+    """Abre ou fecha o corpo de um card da lista"""
+    st.session_state[open_key] = st.session_state[open_key] ^ {item_id}
+
+def card_list(key: str, kind: str, ids, title, body, default_open=()):
+    """Cards recolhidos: só o título é enviado; o corpo é montado (e guardado no cache) quando o card é aberto"""
+    open_key = f"{key}_open"
+    opened = st.session_state.setdefault(open_key, set(default_open))
+    for item_id in ids:
+        item = DATA[kind][item_id]
+        is_open = item_id in opened
+        st.button(
+            f"{'▾' if is_open else '▸'} {title(item)}", key=f"{key}_card_{item_id}",
+            on_click=_toggle_card, args=(open_key, item_id), use_container_width=True,
         )
+        if is_open:
+            html_block(f"{key}_body", lambda: [body(item)], item_id, IS_MOBILE)
+
+def paged_list(key: str, kind: str, title, body, placeholder: str, default_open=()):
+    """Lista com busca e "carregar mais": só os cards da janela visível entram na página, recolhidos"""
+    pages_key = f"{key}_pages"
+    items = DATA[kind]
+    if len(items) <= LIST_PAGE_SIZE:
+        card_list(key, kind, range(len(items)), title, body, default_open)
+        return
+
+    query = st.text_input(
+        "Buscar", key=f"{key}_query", placeholder=placeholder, label_visibility="collapsed",
+        on_change=_reset_pages, args=(pages_key,),
     )
-    
-    apply_dark_theme(fig)
-    fig.update_layout(height=400)
-    
-    return fig
+    ids = INDEX.search(kind, query)
+    matches = range(len(items)) if ids is None else ids
+    pages = st.session_state.get(pages_key, 1)
+    visible = matches[:LIST_PAGE_SIZE * pages]
+    card_list(key, kind, visible, title, body, default_open)
 
-def create_progress_bars(skills: dict, title="Progresso"):
-    """Cria gráfico de barras horizontais para habilidades"""
-    df = pd.DataFrame({
-        "Habilidade": list(skills.keys()),
-        "Nível": list(skills.values())
-    }).sort_values("Nível", ascending=True)
-    
-    fig = px.bar(
-        df,
-        x="Nível",
-        y="Habilidade",
-        orientation='h',
-        title=title,
-        text="Nível"
-    )
-    
-    fig.update_traces(
-        marker_color=PRIMARY,
-        texttemplate='%{x}%',
-        textposition='outside',
-        marker_line_color=PRIMARY,
-        marker_line_width=1
-    )
-    
-    fig.update_layout(
-        xaxis=dict(range=[0, 100], showgrid=True, gridcolor=BORDER),
-        yaxis=dict(showgrid=False),
-        showlegend=False
-    )
-    
-    apply_dark_theme(fig)
-    
-    return fig
+    st.caption(f"Exibindo {len(visible)} de {len(matches)}")
+    if len(visible) < len(matches):
+        st.button("Carregar mais", key=f"{key}_more", on_click=_load_more, args=(pages_key,))
 
 def dark_kpi(label: str, value: str, trend=None, highlight=False):
     """Cria KPI card com tema escuro"""
-    trend_html = ""
-    if trend:
-        trend_class = "positive" if trend > 0 else "negative"
-        trend_symbol = "↗️" if trend > 0 else "↘️"
-        trend_html = f'<span class="trend {trend_class}">{trend_symbol} {abs(trend)}%</span>'
-    
-    css_class = "story-kpi highlight" if highlight else "story-kpi"
-    
-    st.markdown(f'''
-    <div class="{css_class}">
-        <small>{label}</small>
-        <b>{value}</b>
-        {trend_html}
-    </div>
-    ''', unsafe_allow_html=True)
+    st.markdown(kpi_card_html(label, value, trend, highlight), unsafe_allow_html=True)
 
-def calculate_total_experience_years(experiences):
-    """Calcula o total de anos de experiência profissional"""
-    today = datetime.today()
-    earliest_start = None
-    
-    for exp in experiences:
-        start = ym_to_date(exp["start"])
-        if earliest_start is None or start < earliest_start:
-            earliest_start = start
-    
-    if earliest_start:
-        total_duration = relativedelta(today, earliest_start)
-        return total_duration.years + (1 if total_duration.months >= 6 else 0)
-    return 0
+def build_career_model(today: date) -> dict:
+    """Modelo de carreira em cache, indexado pelo conteúdo dos dados e pelo dia corrente.
+
+    É recalculado apenas quando os dados ou a data mudam.
+    """
+    return cached("career", lambda: compute_career_model(EXPERIENCES, today), today, ttl=DERIVED_TTL)
+
+def career_frame(today: date):
+    """DataFrame da timeline em cache; só a aba Trajetória importa pandas para montá-lo"""
+    return cached("career_df", lambda: build_career_frame(build_career_model(today)), today, ttl=DERIVED_TTL)
 
-def count_unique_companies(experiences):
-    """Conta o número de empresas únicas"""
-    return len(set(exp["company"] for exp in experiences))
+@st.cache_resource(show_spinner=False)
+def profile_picture_tag() -> str:
+    """HTML da foto de perfil (manifesto de imagens lido uma vez por processo)"""
+    return profile_picture_block_html(load_profile_manifest())
 
-def count_data_projects(projects):
-    """Conta projetos relacionados a dados"""
-    data_tags = ["Python", "SQL", "Machine Learning", "Data", "Analytics", "EDA", "XGBoost", "Scikit-learn"]
-    count = 0
-    for project in projects:
-        if any(tag in project.get("tags", []) for tag in data_tags):
-            count += 1
-    return count
+@st.cache_resource(show_spinner=False)
+def turnover_model():
+    """Modelo de turnover ajustado (painel_turnover), carregado uma vez por processo; None se não treinado"""
+    return load_model()
 
-def count_certifications(education):
-    """Conta certificações (itens com 'Certificate' no título)"""
-    return sum(1 for edu in education if "Certificate" in edu.get("title", ""))
+@st.cache_resource(show_spinner=False)
+def churn_service():
+    """Modelo de churn do Waze e o micro-batcher compartilhado pelas sessões; None se não treinado"""
+    model = load_churn_model()
+    return None if model is None else (model, MicroBatcher(model.score_records))
+
+# Modelo de carreira compartilhado por sidebar, KPIs e aba de trajetória
+with profile_section("modelo"):
+    CAREER = build_career_model(date.today())
 
 # --- SIDEBAR
-with st.sidebar:
+with st.sidebar, profile_section("sidebar"):
     # Foto de perfil
-    st.markdown(f"""
-    <div style="text-align: center; margin-bottom: 1.5rem;">
-        <img src="https://raw.githubusercontent.com/murillomartins101/painel_profissional/main/profile.jpg"
-             alt="Foto de Perfil"
-             style="
-                border-radius: 50%;
-                width: 150px;
-                height: 150px;
-                object-fit: cover;
-                border: 4px solid {PRIMARY};
-                box-shadow: 0 4px 15px rgba(0,0,0,0.3);
-                margin: 0 auto;
-                display: block;
-             ">
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(profile_picture_tag(), unsafe_allow_html=True)
     
     # Nome e título
-    st.markdown(f"""
-    <div style="text-align: center; margin-bottom: 2rem;">
-        <h2 style="
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: {TEXT};
-            margin-bottom: 0.5rem;
-            line-height: 1.2;
-        ">
-            {PROFILE['name']}
-        </h2>
-        <p style="
-            font-size: 0.9rem;
-            color: {PRIMARY};
-            font-weight: 600;
-            margin-bottom: 1rem;
-            line-height: 1.4;
-        ">
-            Data Analyst | Data Science<br>
-            Marketing | Analytics
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(sidebar_header_html(PROFILE), unsafe_allow_html=True)
     
     # Informações de contato
-    st.markdown(f"""
-    <div style="
-        background: {CARD_BG};
-        border-radius: 10px;
-        padding: 1rem;
-        margin-bottom: 1.5rem;
-        border: 1px solid {BORDER};
-    ">
-        <p style="
-            color: {TEXT_LIGHT};
-            font-size: 0.85rem;
-            margin: 0.5rem 0;
-            line-height: 1.6;
-        ">
-            📍 {PROFILE['location']}
-        </p>
-        <p style="
-            color: {TEXT_LIGHT};
-            font-size: 0.85rem;
-            margin: 0.5rem 0;
-            line-height: 1.6;
-        ">
-            ✉️ <a href="mailto:{PROFILE['email']}" style="color: {TEXT}; text-decoration: none;">{PROFILE['email']}</a>
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Links de redes sociais
-    st.markdown("""
-    <style>
-    .sidebar-link {
-        display: block;
-        text-decoration: none;
-        font-weight: 600;
-        border-radius: 8px;
-        padding: 0.75rem 1rem;
-        font-size: 0.9rem;
-        text-align: center;
-        transition: all 0.3s ease;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-        margin-bottom: 10px;
-    }
-    .sidebar-link:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(0,0,0,0.3);
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    # Links individuais para evitar problemas de renderização
-    st.markdown(f"""
-        <a href="{PROFILE['linkedin']}" target="_blank" class="sidebar-link" style="
-            background: linear-gradient(90deg, {PRIMARY}, {SECONDARY});
-            color: #ffffff;
-        ">
-            🔗 LinkedIn
-        </a>
-    """, unsafe_allow_html=True)
-    
-    st.markdown(f"""
-        <a href="{PROFILE['github']}" target="_blank" class="sidebar-link" style="
-            background: linear-gradient(90deg, #333333, {PRIMARY});
-            color: #ffffff;
-        ">
-            💻 GitHub
-        </a>
-    """, unsafe_allow_html=True)
-    
-    st.markdown(f"""
-        <a href="{PROFILE['site']}" target="_blank" class="sidebar-link" style="
-            background: linear-gradient(90deg, {ACCENT}, #e67e22);
-            color: #ffffff;
-        ">
-            📁 Website
-        </a>
-    """, unsafe_allow_html=True)
+    st.markdown(contact_card_html(PROFILE), unsafe_allow_html=True)
     
-    st.markdown(f"""
-        <a href="{PROFILE['instagram']}" target="_blank" class="sidebar-link" style="
-            background: linear-gradient(90deg, #c0392b, #8e44ad);
-            color: #ffffff;
-        ">
-            🥁 Instagram
-        </a>
-    """, unsafe_allow_html=True)
+    # Links de redes sociais (individuais para evitar problemas de renderização)
+    for profile_key, label, background in SOCIAL_LINKS:
+        st.markdown(social_link_html(PROFILE[profile_key], label, background), unsafe_allow_html=True)
     
     # Espaçamento após os links
     st.markdown("<div style='margin-bottom: 2rem;'></div>", unsafe_allow_html=True)
     
+    # Busca no perfil pelo índice invertido (ex.: quais projetos e cargos usam XGBoost)
+    search_query = st.text_input("🔎 Buscar no perfil", key="profile_search", placeholder="ex.: XGBoost, Power BI")
+    if search_query:
+        found = {kind: INDEX.search(kind, search_query) or [] for kind in ("projects", "experiences", "education")}
+        html_block(
+            "search", lambda: [search_results_html(*([DATA[kind][i] for i in ids] for kind, ids in found.items()))],
+            search_query, ttl=SEARCH_TTL,
+        )
+    
     # Footer do sidebar
-    st.markdown(f"""
-    <div style="
-        text-align: center;
-        padding-top: 1.5rem;
-        border-top: 1px solid {BORDER};
-        margin-top: 2rem;
-    ">
-        <p style="
-            color: {TEXT_LIGHT};
-            font-size: 0.75rem;
-            line-height: 1.4;
-        ">
-            Desenvolvido por<br>
-            <strong style="color: {TEXT};">{PROFILE['name']}</strong><br>
-            © 2025
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(sidebar_footer_html(PROFILE), unsafe_allow_html=True)
 
 # --- MAIN CONTENT
 
 # Header
-st.markdown(f"""
-<div class="main-header">
-    <h1 style="font-size: {'1.8rem' if IS_MOBILE else '2.5rem'}; margin-bottom: 1rem;">Dashboard Profissional</h1>
-    <p style="font-size: {'0.9rem' if IS_MOBILE else '1.2rem'}; color: {TEXT_LIGHT}; font-weight: 400;">
-        Um portfólio interativo focado em storytelling com dados
-    </p>
-</div>
-""", unsafe_allow_html=True)
+with profile_section("header"):
+    st.markdown(page_header_html(IS_MOBILE), unsafe_allow_html=True)
 
 # KPIs - Calculados dinamicamente
-total_experience_years = calculate_total_experience_years(EXPERIENCES)
-num_companies = count_unique_companies(EXPERIENCES)
-num_data_projects = count_data_projects(PROJECTS)
-num_certifications = count_certifications(EDUCATION)
-num_languages = len(LANGUAGES)
+with profile_section("kpis"):
+    KPIS = cached("kpis", lambda: build_kpis(DATA, CAREER, INDEX), date.today(), ttl=DERIVED_TTL)
 
-st.markdown("<div class='story-grid'>", unsafe_allow_html=True)
+    st.markdown("<div class='story-grid'>", unsafe_allow_html=True)
 
-if IS_MOBILE:
-    col1, col2 = st.columns(2)
-    with col1:
-        dark_kpi("Experiência", f"{total_experience_years}+ anos", highlight=True)
-    with col2:
-        dark_kpi("Projetos Data", f"{num_data_projects}+")
-else:
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        dark_kpi("Experiência", f"{total_experience_years}+ anos", highlight=True)
-    with col2:
-        dark_kpi("Projetos Data", f"{num_data_projects}+")
-    with col3:
-        dark_kpi("Certificações", f"{num_certifications}", trend=num_certifications)
-    with col4:
-        dark_kpi("Idiomas", f"{num_languages}")
+    # No mobile, apenas os dois primeiros KPIs
+    visible_kpis = KPIS[:2] if IS_MOBILE else KPIS
+    for col, (label, value, trend, highlight) in zip(st.columns(len(visible_kpis)), visible_kpis):
+        with col:
+            dark_kpi(label, value, trend=trend, highlight=highlight)
 
-st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown("</div>", unsafe_allow_html=True)
 
 # Tabs
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
-    "📖 Minha História",
-    "📈 Trajetória",
-    "🛠️ Competências",
-    "🚀 Projetos",
-    "🎓 Formação"
-])
-
-with tab1:
+def render_story_tab():
+    """Aba Minha História: bio, marcos da carreira e idiomas"""
     col1, col2 = st.columns([2, 1] if not IS_MOBILE else [1, 1])
     
     with col1:
         st.markdown("### Da Estratégia à Análise de Dados")
-        st.markdown(f"""
-        <div class="data-card">
-            <p style="font-size: 16px; line-height: 1.7; color: {TEXT};">{PROFILE['bio']}</p>
-            <div style="margin-top: 1.5rem; padding: 1.5rem; background: {ACCENT_BG}; border-radius: 8px; border-left: 4px solid {PRIMARY};">
-                <h4 style="color: {PRIMARY}; margin-bottom: 1rem;">🎯 Foco Atual</h4>
-                <div style="display: flex; flex-wrap: wrap; gap: 0.5rem;">
-                    <span class="data-badge">Python</span>
-                    <span class="data-badge secondary">Power BI</span>
-                    <span class="data-badge">SQL</span>
-                    <span class="data-badge accent">Machine Learning</span>
-                    <span class="data-badge">Data Storytelling</span>
-                    <span class="data-badge" style="background: rgba(155, 89, 182, 0.15); color: #9b59b6; border-color: rgba(155, 89, 182, 0.3);">Pensamento Analítico</span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(bio_card_html(PROFILE), unsafe_allow_html=True)
         
         st.markdown("### Marcos da Carreira")
-        milestones = [
-            {"ano": "2025-Presente", "evento": "Transição para Análise de Dados", "detalhe": "Honda Brasil - Data Analytics & Data Viz"},
-            {"ano": "2023-2024", "evento": "Operações Internacionais", "detalhe": "Honda Brasil - Gestão LATAM"},
-            {"ano": "2019-2023", "evento": "Consultor Comercial", "detalhe": "Honda Brasil"},
-            {"ano": "2015-2019", "evento": "Fundador & Head of Everything", "detalhe": "Aditivo Media - Marketing Digital"},
-            {"ano": "2011-2015", "evento": "Consultor Comercial", "detalhe": "CNH Industrial Capital"},
-            {"ano": "2010-2011", "evento": "Analista de F&I", "detalhe": "Banco Mercedes-Benz"}
-        ]
-        
-        for milestone in milestones:
-            st.markdown(f"""
-            <div class="data-card" style="padding: 1rem; margin-bottom: 0.75rem;">
-                <div style="display: flex; justify-content: space-between; align-items: start; gap: 1rem;">
-                    <div style="flex: 0 0 120px;">
-                        <strong style="color: {PRIMARY}; font-size: 0.9rem;">{milestone['ano']}</strong>
-                    </div>
-                    <div style="flex: 1;">
-                        <strong style="font-size: 1rem;">{milestone['evento']}</strong><br>
-                        <small style="color: {TEXT_LIGHT}; font-size: 0.85rem;">{milestone['detalhe']}</small>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        html_block("milestones", lambda: (milestone_card_html(milestone) for milestone in DATA["milestones"]))
     
     with col2:
         st.markdown("### Idiomas")
-        lang_data = pd.DataFrame({
-            "Idioma": list(LANGUAGES.keys()),
-            "Proficiência": list(LANGUAGES.values())
-        })
-        fig_lang = px.bar(lang_data, x="Proficiência", y="Idioma", orientation='h')
-        fig_lang.update_traces(marker_color=PRIMARY, marker_line_color=PRIMARY, marker_line_width=1)
-        apply_dark_theme(fig_lang)
-        fig_lang.update_layout(height=300, showlegend=False)
-        st.plotly_chart(fig_lang, use_container_width=True)
+        show_figure(create_language_bars, LANGUAGES)
         
-        st.markdown("### Especializações")
-        st.markdown(f"""
-        <div class="data-card">
-            <div style="text-align: center;">
-                <div style="margin-bottom: 1rem;">
-                    <span class="data-badge secondary" style="font-size: 14px; padding: 8px 16px;">Data Analytics</span>
-                </div>
-                <div style="margin-bottom: 1rem;">
-                    <span class="data-badge" style="font-size: 14px; padding: 8px 16px;">Business Intelligence</span>
-                </div>
-                <div>
-                    <span class="data-badge accent" style="font-size: 14px; padding: 8px 16px;">Machine Learning</span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        def specializations():
+            st.markdown("### Especializações")
+            st.markdown(specializations_card_html(), unsafe_allow_html=True)
+        
+        deferred_section("specializations", "especializações", specializations)
 
-with tab2:
+def render_career_tab():
+    """Aba Trajetória: timeline e detalhamento das experiências"""
     st.markdown("### Evolução Profissional")
-    df_exp = build_experience_df(EXPERIENCES)
-    fig_timeline = create_timeline_chart(df_exp)
-    st.plotly_chart(fig_timeline, use_container_width=True)
-    
-    col1, col2 = st.columns(2)
+    df_exp = career_frame(date.today())
+    show_figure(create_timeline_chart, df_exp)
     
-    with col1:
-        st.markdown(f"""
-        <div class="data-card">
-            <h4 style="color: {SECONDARY};">📈 Padrão de Crescimento</h4>
-            <p style="font-size: 14px; color: {TEXT}; line-height: 1.6;">
-                Transição consistente de funções operacionais para estratégicas, 
-                com foco crescente em dados e analytics.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+    def career_highlights():
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(growth_card_html(), unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown(versatility_card_html(), unsafe_allow_html=True)
     
-    with col2:
-        st.markdown(f"""
-        <div class="data-card">
-            <h4 style="color: {ACCENT};">🔄 Versatilidade</h4>
-            <p style="font-size: 14px; color: {TEXT}; line-height: 1.6;">
-                Experiência diversificada em setores: financeiro, automotivo, 
-                marketing digital, tecnologia e music business
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+    deferred_section("career_highlights", "destaques da trajetória", career_highlights)
     
     st.markdown("### Detalhamento das Experiências")
     
-    for exp in EXPERIENCES:
-        with st.expander(f"**{exp['company']}** - {exp['role']}", expanded=False):
-            col_a, col_b = st.columns([3, 1])
-            
-            with col_a:
-                st.markdown(f"**Período:** {exp['start']} - {exp['end'] if exp['end'] else 'Atual'}")
-                st.markdown(f"**Localização:** {exp['city']}")
-                st.markdown("**Principais Realizações:**")
-                for achievement in exp['achievements']:
-                    st.markdown(f"• {achievement}")
-            
-            with col_b:
-                st.markdown("**Habilidades:**")
-                for skill in exp['skills']:
-                    st.markdown(f'<span class="data-badge" style="display: block; margin: 5px 0;">{skill}</span>', unsafe_allow_html=True)
+    # Apenas a janela visível; o corpo de cada experiência só quando aberta
+    paged_list(
+        "experiences", "experiences", experience_card_title, experience_card_body,
+        "Buscar por empresa, cargo, cidade ou habilidade",
+    )
 
-with tab3:
+def render_skills_tab():
+    """Aba Competências: métricas, radar, ferramentas e evolução"""
     st.markdown("### Competências Técnicas")
     
-    # Calcula deltas dinamicamente a partir de SKILLS_DATA
-    python_delta = SKILLS_DATA["Python"]["current"] - SKILLS_DATA["Python"]["history"][2019]
-    powerbi_delta = SKILLS_DATA["Power BI"]["current"] - SKILLS_DATA["Power BI"]["history"][2019]
-    ml_delta = SKILLS_DATA["Machine Learning"]["current"] - SKILLS_DATA["Machine Learning"]["history"][2019]
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Python", f"{SKILLS_DATA['Python']['current']}%", f"+{python_delta}% desde 2019")
-    with col2:
-        st.metric("Power BI", f"{SKILLS_DATA['Power BI']['current']}%", f"+{powerbi_delta}% desde 2019")
-    with col3:
-        st.metric("Machine Learning", f"{SKILLS_DATA['Machine Learning']['current']}%", f"+{ml_delta}% desde 2019")
+    # Deltas, crescimento anual e projeção calculados de uma vez a partir de SKILLS_DATA
+    outlook = cached("skills_outlook", lambda: build_skill_outlook(SKILLS_DATA))
+    forecast_year = outlook.attrs["forecast_year"]
+    
+    for col, (skill, row) in zip(st.columns(len(outlook)), outlook.iterrows()):
+        with col:
+            # Sem registro no ano base o delta é None (o st.metric mostraria uma seta para "—")
+            st.metric(
+                skill, format_percent(row['current']), skill_delta_label(row['delta']),
+                help=f"Crescimento médio de {format_percent(row['growth_rate'], fraction=True)} ao ano · "
+                     f"projeção {forecast_year}: {format_percent(row['forecast'])}",
+            )
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("#### Perfil de Competências")
-        st.plotly_chart(create_skill_radar(SKILLS_CORE), use_container_width=True)
+        show_figure(create_skill_radar, SKILLS_CORE)
     
     with col2:
         st.markdown("#### Ferramentas & Tecnologias")
-        st.plotly_chart(create_progress_bars(SKILLS_TOOLS, "Proficiência Técnica"), use_container_width=True)
-    
-    st.markdown("#### Evolução das Habilidades")
-    
-    # Gera dados de evolução dinamicamente a partir de SKILLS_DATA
-    evolution_skills = ["Python", "Power BI", "SQL", "Machine Learning", "Data Storytelling"]
-    years = [2019, 2021, 2023, 2024, 2025]
-    
-    evolution_rows = []
-    for skill in evolution_skills:
-        skill_key = skill if skill in SKILLS_DATA else skill
-        if skill_key in SKILLS_DATA:
-            for year in years:
-                if year in SKILLS_DATA[skill_key]["history"]:
-                    evolution_rows.append({
-                        "Habilidade": skill,
-                        "Ano": str(year),
-                        "Nível": SKILLS_DATA[skill_key]["history"][year]
-                    })
-    
-    df_evo = pd.DataFrame(evolution_rows)
-    
-    fig_evo = px.line(
-        df_evo,
-        x="Ano",
-        y="Nível",
-        color="Habilidade",
-        markers=True,
-        title="Crescimento das Principais Habilidades (2019-2025)"
-    )
-    apply_dark_theme(fig_evo)
-    fig_evo.update_layout(height=400)
-    st.plotly_chart(fig_evo, use_container_width=True)
-    
-    st.markdown("### Habilidades Comportamentais")
+        show_figure(create_progress_bars, SKILLS_TOOLS, "Proficiência Técnica")
     
-    soft_skills = {
-        "Comunicação": 90,
-        "Liderança": 80,
-        "Trabalho em Equipe": 95,
-        "Resolução de Problemas": 90,
-        "Adaptabilidade": 92
-    }
+    def skill_evolution():
+        st.markdown("#### Evolução das Habilidades")
+        
+        # Gera dados de evolução dinamicamente a partir de SKILLS_DATA
+        show_figure(create_skill_evolution_chart, SKILLS_DATA, EVOLUTION_SKILLS, EVOLUTION_YEARS)
     
-    col1, col2 = st.columns([1, 2])
+    deferred_section("skill_evolution", "evolução das habilidades", skill_evolution)
     
-    with col1:
-        for skill, level in soft_skills.items():
-            st.markdown(f"""
-            <div style="margin-bottom: 1rem;">
-                <div style="display: flex; justify-content: space-between; margin-bottom: 5px;">
-                    <span style="font-size: 14px; color: {TEXT};">{skill}</span>
-                    <span style="font-size: 14px; color: {PRIMARY}; font-weight: 600;">{level}%</span>
-                </div>
-                <div style="width: 100%; background: {BORDER}; height: 8px; border-radius: 4px; overflow: hidden;">
-                    <div style="width: {level}%; background: linear-gradient(90deg, {PRIMARY}, {SECONDARY}); height: 100%;"></div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+    def soft_skills():
+        st.markdown("### Habilidades Comportamentais")
+        
+        col1, col2 = st.columns([1, 2])
+        
+        with col1:
+            html_block("soft_skills", lambda: (soft_skill_bar_html(skill, level) for skill, level in DATA["soft_skills"].items()))
+        
+        with col2:
+            st.markdown(highlights_card_html(), unsafe_allow_html=True)
     
-    with col2:
-        st.markdown(f"""
-        <div class="data-card">
-            <h4 style="color: {PRIMARY};">💡 Destaques</h4>
-            <ul style="line-height: 1.8; color: {TEXT};">
-                <li>Forte capacidade de <strong>comunicação técnica</strong> para públicos diversos</li>
-                <li>Experiência em <strong>gestão de projetos complexos</strong> e multidisciplinares</li>
-                <li>Habilidade comprovada em <strong>storytelling com dados</strong></li>
-                <li>Adaptação rápida a novos <strong>desafios e tecnologias</strong></li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+    deferred_section("soft_skills", "habilidades comportamentais", soft_skills)
 
-with tab4:
+def render_projects_tab():
+    """Aba Projetos: cards de projetos e áreas de atuação"""
     st.markdown("### Projetos com Impacto")
     
-    for i, project in enumerate(PROJECTS):
-        with st.expander(f"📊 {project['title']}", expanded=(i == 0)):
-            col1, col2 = st.columns([3, 1] if not IS_MOBILE else [1, 1])
-            
-            with col1:
-                st.write(f"**Descrição:** {project['summary']}")
-                
-                if project.get('metrics'):
-                    st.write("**Resultados Mensuráveis:**")
-                    metric_cols = st.columns(len(project['metrics']))
-                    for idx, (metric, value) in enumerate(project['metrics'].items()):
-                        with metric_cols[idx]:
-                            st.metric(metric.replace("_", " "), str(value))
-            
-            with col2:
-                st.write("**Tecnologias:**")
-                for tag in project['tags']:
-                    st.markdown(f'<span class="data-badge" style="display: block; margin: 5px 0;">{tag}</span>', unsafe_allow_html=True)
-            
-            if project.get('link'):
-                st.markdown(f"[🔗 Ver projeto detalhado]({project['link']})")
-    
-    st.markdown("### Áreas de Atuação")
-    
-    areas = {
-        "Análise de Dados": ["Python", "Databricks", "AWS", "SQL", "Power BI", "Estatística"],
-        "Business Intelligence": ["Power BI", "Dashboards", "KPIs"],
-        "Marketing Analytics": ["Growth", "SEO", "Paid Media", "CRM"],
-        "Música & Performance": ["Baterista Profissional", "Produção Artística", "Estratégia de Marketing"]
-    }
-    
-    cols = st.columns(2)
+    # Apenas a janela visível; o corpo de cada projeto só quando aberto (no desktop, o primeiro já vem aberto)
+    ratios = (3, 1) if not IS_MOBILE else (1, 1)
+    paged_list(
+        "projects", "projects", project_card_title, lambda project: project_card_body(project, ratios),
+        "Buscar por título, descrição ou tecnologia", default_open=() if IS_MOBILE else (0,),
+    )
     
-    for idx, (area, skills) in enumerate(areas.items()):
-        with cols[idx % 2]:
-            st.markdown(f"""
-            <div class="data-card">
-                <h4 style="color: {PRIMARY}; margin-bottom: 1rem;">{area}</h4>
-                <div style="display: flex; flex-wrap: wrap; gap: 0.5rem;">
-                    {''.join([f'<span class="data-badge">{skill}</span>' for skill in skills])}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+    def areas():
+        st.markdown("### Áreas de Atuação")
+        
+        html_block("areas", lambda: [grid_html([area_card_html(area, skills) for area, skills in DATA["areas"].items()])])
+    
+    deferred_section("areas", "áreas de atuação", areas)
+    
+    model = turnover_model()
+    if model is not None:
+        deferred_section("turnover", "simulador de turnover", lambda: turnover_simulator(model))
+    
+    service = churn_service()
+    if service is not None:
+        deferred_section("churn", "simulador de churn", lambda: churn_simulator(*service))
+
+def turnover_simulator(model):
+    """Simulação "e se" do case de turnover: perfil editável pontuado pelo modelo carregado (sem retreino)"""
+    st.markdown("### Simulador de Turnover")
+    
+    with st.form("turnover_whatif"):
+        col1, col2 = st.columns(2) if not IS_MOBILE else (st.container(), st.container())
+        with col1:
+            overtime = st.radio("Hora extra", ["No", "Yes"], format_func={"No": "Não", "Yes": "Sim"}.get, horizontal=True)
+            income = st.slider("Salário mensal (US$)", 1000, 20000, 5000, step=500)
+            age = st.slider("Idade", 18, 60, 35)
+            years = st.slider("Anos na empresa", 0, 40, 5)
+        with col2:
+            satisfaction = st.select_slider("Satisfação com o trabalho", ["Low", "Medium", "High", "Very High"], value="High")
+            marital = st.selectbox("Estado civil", ["Single", "Married", "Divorced"])
+            travel = st.selectbox("Viagens", ["Non-Travel", "Travel_Rarely", "Travel_Frequently"], index=1)
+            distance = st.slider("Distância de casa (km)", 1, 30, 7)
+        st.form_submit_button("Calcular risco")
+    
+    # Demais atributos vêm do perfil de referência gravado com o modelo
+    risk = model.score_records([{
+        "OverTime": overtime, "MonthlyIncome": income, "Age": age, "YearsAtCompany": years,
+        "JobSatisfaction": satisfaction, "MaritalStatus": marital, "BusinessTravel": travel,
+        "DistanceFromHome": distance,
+    }])[0]
+    threshold = model.metrics["threshold"]
+    # Delta positivo (acima do limiar de alerta) em vermelho
+    st.metric("Risco de saída", f"{risk:.0%}", f"{risk - threshold:+.0%} vs. limiar", delta_color="inverse")
+    st.caption(
+        f"Modelo {model.meta['model']} treinado em {model.meta['trained'][:10]} · "
+        f"AUC {model.metrics['AUC']:.2f} · Lift@10% {model.metrics['Lift@10%']:.1f} · limiar {threshold:.0%}"
+    )
+
+def churn_simulator(model, batcher):
+    """Simulação do projeto Waze: uso do app pontuado pelo serviço de inferência (lotes entre sessões)"""
+    st.markdown("### Simulador de Churn (Waze)")
+    
+    with st.form("churn_whatif"):
+        col1, col2 = st.columns(2) if not IS_MOBILE else (st.container(), st.container())
+        with col1:
+            sessions = st.slider("Sessões no último mês", 0, 750, 56)
+            drives = st.slider("Viagens no último mês", 0, 600, 48)
+            device = st.radio("Dispositivo", ["Android", "iPhone"], index=1, horizontal=True)
+        with col2:
+            activity_days = st.slider("Dias com uso no mês", 0, 31, 16)
+            driving_days = st.slider("Dias dirigindo no mês", 0, 30, 12)
+            km = st.slider("Km rodados no mês", 0, 20000, 3500, step=100)
+        st.form_submit_button("Calcular risco")
+    
+    # Demais atributos vêm do perfil de referência gravado com o modelo
+    try:
+        risk = batcher.predict([{
+            "sessions": sessions, "drives": drives, "device": device, "activity_days": activity_days,
+            "driving_days": driving_days, "driven_km_drives": km,
+        }], PREDICT_TIMEOUT)[0]
+    except TimeoutError:
+        st.warning("O serviço de inferência não respondeu a tempo. Tente novamente em instantes.")
+        return
+    st.metric("Probabilidade de churn", f"{risk:.0%}")
+    st.caption(
+        f"Modelo {model.meta['model']} treinado em {model.meta['trained'][:10]} · "
+        + " · ".join(f"{name} {value:.2f}" for name, value in model.metrics.items())
+    )
 
-with tab5:
+def render_education_tab():
+    """Aba Formação: cursos, certificações e filosofia de aprendizado"""
     st.markdown("### Formação Contínua")
     
-    for edu in EDUCATION:
-        year_color = SECONDARY if edu['year'] == '2025' else PRIMARY
-        st.markdown(f"""
-        <div class="data-card" style="transition: all 0.3s ease;">
-            <div style="display: flex; justify-content: space-between; align-items: start; gap: 1rem;">
-                <div style="flex: 1;">
-                    <h4 style="margin: 0 0 8px 0; color: {TEXT}; font-size: 1.1rem;">{edu['title']}</h4>
-                    <p style="margin: 0; color: {PRIMARY}; font-weight: 600; font-size: 0.95rem;">{edu['org']}</p>
-                </div>
-                <div style="background: {year_color}; color: white; padding: 8px 16px; border-radius: 12px; font-size: 13px; font-weight: 600;">
-                    {edu['year']}
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    html_block("education", lambda: (education_card_html(edu) for edu in EDUCATION))
     
-    st.markdown("### Certificações & Especializações")
-    
-    certifications = [
-        {"name": "Power BI Analyst", "org": "Microsoft", "year": 2024, "icon": "📊"},
-        {"name": "Google Advanced Data Analytics", "org": "Google", "year": 2024, "icon": "🎓"},
-        {"name": "Google Data Analytics", "org": "Google", "year": 2023, "icon": "📈"},
-        {"name": "Digital Marketing Specialization", "org": "Univ. Illinois", "year": 2020, "icon": "🎯"}
-    ]
-    
-    cols = st.columns(2)
+    def certifications():
+        st.markdown("### Certificações & Especializações")
+        
+        html_block("certifications", lambda: [grid_html([certification_card_html(cert) for cert in DATA["certifications"]])])
     
-    for idx, cert in enumerate(certifications):
-        with cols[idx % 2]:
-            st.markdown(f"""
-            <div class="data-card" style="padding: 1rem; text-align: center;">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">{cert['icon']}</div>
-                <strong style="color: {TEXT}; font-size: 0.95rem;">{cert['name']}</strong><br>
-                <small style="color: {TEXT_LIGHT}; font-size: 0.85rem;">{cert['org']} • {cert['year']}</small>
-            </div>
-            """, unsafe_allow_html=True)
+    deferred_section("certifications", "certificações", certifications)
     
-    st.markdown("### Filosofia de Aprendizado")
+    def philosophy():
+        st.markdown("### Filosofia de Aprendizado")
+        
+        st.markdown(philosophy_card_html(), unsafe_allow_html=True)
     
-    st.markdown(f"""
-    <div class="data-card">
-        <p style="font-size: 16px; line-height: 1.8; color: {TEXT}; text-align: center; font-style: italic;">
-            “Vejo o lifelong learning como um modo de viver: 
-            aprender continuamente é o que me move e sustenta meu propósito. 
-            Busco evoluir como profissional e como pessoa, unindo curiosidade, conhecimento aplicado e impacto real em cada projeto que abraço.”
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-
-# --- FOOTER
-st.markdown("---")
-st.markdown(f"""
-<div style="text-align: center; color: {TEXT_LIGHT}; font-size: 14px; padding: 2rem 0;">
-    <strong style="color: {TEXT}; font-size: 1.1rem;">{PROFILE['name']}</strong><br>
-    <p style="margin: 1rem 0; font-size: 0.95rem;">Data Analyst | Data Science | Marketing | Analytics</p>  
-    <p style="margin: 0.5rem 0;">📍 {PROFILE['location']} • ✉️ {PROFILE['email']}</p>
-    <div style="margin-top: 1.5rem; display: flex; justify-content: center; gap: 2rem; flex-wrap: wrap;">
-        <a href="{PROFILE['linkedin']}" style="color: {PRIMARY}; text-decoration: none; font-weight: 600; transition: all 0.3s ease;">
-            LinkedIn
-        </a>
-        <a href="{PROFILE['github']}" style="color: {PRIMARY}; text-decoration: none; font-weight: 600; transition: all 0.3s ease;">
-            GitHub
-        </a>
-        <a href="{PROFILE['site']}" style="color: {PRIMARY}; text-decoration: none; font-weight: 600; transition: all 0.3s ease;">
-            Website
-        </a>
-        <a href="{PROFILE['instagram']}" style="color: {ACCENT}; text-decoration: none; font-weight: 600; transition: all 0.3s ease;">
-            Instagram
-        </a>
-    </div>
-    <p style="margin-top: 2rem; font-size: 0.85rem; color: {TEXT_LIGHT};">
-        © 2025 {PROFILE['name']} • Desenvolvido com Streamlit & Python
-    </p>
-</div>
-""", unsafe_allow_html=True)
-
-
-
-
-
-
+    deferred_section("philosophy", "filosofia de aprendizado", philosophy)
 
+TABS = {
+    "📖 Minha História": render_story_tab,
+    "📈 Trajetória": render_career_tab,
+    "🛠️ Competências": render_skills_tab,
+    "🚀 Projetos": render_projects_tab,
+    "🎓 Formação": render_education_tab,
+}
 
+if LAZY_TABS:
+    # Apenas a aba selecionada é executada e enviada ao navegador
+    active_tab = st.radio("Seção", list(TABS), horizontal=True, label_visibility="collapsed", key="active_tab")
+    with profile_section(f"aba:{active_tab}"):
+        TABS[active_tab]()
+else:
+    for tab, (title, render_tab) in zip(st.tabs(list(TABS)), TABS.items()):
+        with tab, profile_section(f"aba:{title}"):
+            render_tab()
 
+# --- FOOTER
+with profile_section("footer"):
+    st.markdown("---")
+    st.markdown(footer_html(PROFILE), unsafe_allow_html=True)
+
+# --- PAINEL DE DEPURAÇÃO (apenas com PAINEL_PROFILE=1)
+if PROFILING:
+    with st.expander("⏱️ Perfil do rerun", expanded=False):
+        st.dataframe(finish_run(), use_container_width=True, hide_index=True)
+        st.json(CACHE.stats(), expanded=False)
+        st.caption("Agregados do processo em /metrics (Prometheus) e /metrics.json no servidor de métricas.")
@@ -0,0 +1,135 @@
+"""Artefatos pré-calculados para implantações com vários processos.
+
+O passo de pré-cálculo executa o app uma vez (AppTest, todas as abas) e
+grava tudo o que o cache compartilhado recebeu (modelo de carreira, KPIs,
+JSON das figuras e fragmentos HTML) em um único arquivo binário. Cada worker
+mapeia o arquivo somente leitura na inicialização (PAINEL_ARTIFACTS): as
+páginas ficam no page cache do sistema, compartilhadas entre processos, e os
+valores são lidos sob demanda em vez de recalculados.
+
+As chaves são as mesmas do cache (hash do conteúdo dos dados + parâmetros),
+então um arquivo gerado para outros dados ou outro dia simplesmente não tem
+hits.
+
+Formato: MAGIC | tamanho do índice (8 bytes, little-endian) | índice JSON | blobs
+
+Uso:
+    python painel_artefatos.py [--out build/painel.artifacts]
+    PAINEL_ARTIFACTS=build/painel.artifacts streamlit run dashboard_painel_oficial.py
+"""
+import argparse
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+APP = ROOT / "dashboard_painel_oficial.py"
+DEFAULT_ARTIFACTS_FILE = ROOT / "build" / "painel.artifacts"
+
+MAGIC = b"PAINELA1"
+SEPARATOR = "\x1f"
+
+
+class ArtifactStore:
+    """Leitura somente leitura de um arquivo de artefatos mapeado em memória"""
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path}: não é um arquivo de artefatos do painel")
+        (index_size,) = struct.unpack_from("<Q", self._mmap, len(MAGIC))
+        start = len(MAGIC) + 8
+        index = json.loads(self._mmap[start:start + index_size].decode("utf-8"))
+        self.meta = index["meta"]
+        self._entries = index["entries"]
+        self._base = start + index_size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, namespace: str, key: str):
+        """Retorna (expira_em, valor) ou None se ausente ou expirado"""
+        entry = self._entries.get(f"{namespace}{SEPARATOR}{key}")
+        if entry is None:
+            return None
+        offset, length, encoding, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        blob = self._mmap[self._base + offset:self._base + offset + length]
+        value = blob.decode("utf-8") if encoding == "str" else pickle.loads(blob)
+        return expires_at, value
+
+
+def write_artifacts(entries, path, meta=None) -> Path:
+    """Grava as entradas (namespace, chave, valor, expira_em) no formato mapeável, de forma atômica"""
+    index, blobs, offset = {}, [], 0
+    for namespace, key, value, expires_at in entries:
+        if isinstance(value, str):
+            blob, encoding = value.encode("utf-8"), "str"
+        else:
+            blob, encoding = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), "pickle"
+        index[f"{namespace}{SEPARATOR}{key}"] = [offset, len(blob), encoding, expires_at]
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps({"meta": meta or {}, "entries": index}).encode("utf-8")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)
+    return path
+
+
+def collect_cache_entries() -> list:
+    """Executa todas as abas do app (AppTest) e retorna as entradas do cache compartilhado"""
+    sys.path.insert(0, str(ROOT))
+    os.environ["PAINEL_LAZY_TABS"] = "1"
+    os.environ.pop("PAINEL_ARTIFACTS", None)
+    from streamlit.testing.v1 import AppTest
+
+    from painel_cache import CACHE
+
+    at = AppTest.from_file(str(APP), default_timeout=600)
+    at.run()
+    for tab in at.radio(key="active_tab").options:
+        at.radio(key="active_tab").set_value(tab).run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+    return CACHE.items()
+
+
+def precompute(out=DEFAULT_ARTIFACTS_FILE) -> Path:
+    """Executa todas as abas do app e grava o conteúdo do cache compartilhado como artefatos"""
+    from painel_dados import load_data
+
+    entries = collect_cache_entries()
+    meta = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "content_hash": load_data()["content_hash"],
+    }
+    return write_artifacts(entries, out, meta)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pré-calcula os artefatos compartilhados do painel")
+    parser.add_argument("--out", default=str(DEFAULT_ARTIFACTS_FILE), help="arquivo de saída (padrão: build/painel.artifacts)")
+    args = parser.parse_args()
+
+    path = precompute(args.out)
+    store = ArtifactStore(path)
+    print(f"{len(store)} artefatos gravados em {path} ({path.stat().st_size / 1024:.0f} KB)")
@@ -0,0 +1,252 @@
+"""Busca paralela de hiperparâmetros do modelo de turnover, com folds em cache.
+
+O notebook treina um RandomForest e depois roda setup/compare do PyCaret,
+tudo em série e refazendo do zero a cada execução. Aqui:
+- os folds de validação cruzada (StratifiedKFold sobre o conjunto de treino
+  do split 80/20 de painel_turnover) e os conjuntos de treino reamostrados
+  pelo SMOTE de cada fold são montados uma vez e gravados em disco como
+  .npy, em um diretório identificado pelo hash da base e dos parâmetros do
+  split; os workers os abrem com memory map (page cache compartilhado);
+- cada par (configuração, fold) é uma tarefa em um pool de processos com
+  todos os núcleos (estimadores com n_jobs=1, sem disputa de threads);
+- cada resultado é anexado a um JSONL ao lado dos folds: ao retomar a busca,
+  os pares já pontuados são reaproveitados;
+- o relatório traz o speedup estimado (soma do tempo das tarefas / tempo de
+  parede); a comparação medida com a execução serial fica em
+  benchmarks/bench_busca.py.
+
+O SMOTE é aplicado só na parte de treino de cada fold, para que a validação
+não veja exemplos sintéticos. A melhor configuração (maior AUC média) pode
+ser retreinada e gravada como o modelo do painel (--refit).
+
+Uso:
+    python painel_busca.py [--workers N] [--folds 5] [--models random_forest xgboost] [--refit]
+"""
+import argparse
+import hashlib
+import importlib.util
+import itertools
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from painel_turnover import DATA_FILE, RANDOM_STATE, TEST_SIZE, build_estimator, save_model, train
+
+ROOT = Path(__file__).resolve().parent
+SEARCH_DIR = ROOT / "build" / "turnover-search"
+DEFAULT_FOLDS = 5
+WORKERS = os.cpu_count() or 1
+
+# Versão do formato dos folds em cache: muda a chave quando a montagem muda
+FOLDS_FORMAT = 1
+
+# Espaço de busca por modelo (grade completa); XGBoost só entra se estiver instalado
+SEARCH_SPACE = {
+    "random_forest": {
+        "n_estimators": [200, 500],
+        "max_depth": [None, 8, 16],
+        "min_samples_leaf": [1, 3],
+        "max_features": ["sqrt", 0.5],
+    },
+    "gradient_boosting": {
+        "n_estimators": [100, 300],
+        "learning_rate": [0.05, 0.1],
+        "max_depth": [2, 3],
+    },
+    "xgboost": {
+        "n_estimators": [200, 400],
+        "learning_rate": [0.05, 0.1],
+        "max_depth": [3, 6],
+        "subsample": [0.8, 1.0],
+    },
+}
+
+
+def available_models() -> list:
+    """Modelos do espaço de busca cujas bibliotecas estão instaladas"""
+    return [model for model in SEARCH_SPACE if model != "xgboost" or importlib.util.find_spec("xgboost")]
+
+
+def expand_grid(models=None) -> list:
+    """Configurações da grade como {"id", "model", "params"}; o id é o hash do modelo e dos parâmetros"""
+    configs = []
+    for model in models or available_models():
+        space = SEARCH_SPACE[model]
+        for values in itertools.product(*space.values()):
+            params = dict(zip(space, values))
+            payload = json.dumps([model, params], sort_keys=True)
+            configs.append({"id": hashlib.sha256(payload.encode()).hexdigest()[:12], "model": model, "params": params})
+    return configs
+
+
+def folds_key(path, n_folds: int) -> str:
+    """Hash da base e dos parâmetros do split e dos folds"""
+    digest = hashlib.sha256(f"folds-v{FOLDS_FORMAT}:{n_folds}:{TEST_SIZE}:{RANDOM_STATE}".encode())
+    digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def build_folds(path=DATA_FILE, n_folds=DEFAULT_FOLDS, out_dir=SEARCH_DIR) -> Path:
+    """Monta (uma vez) os folds e os treinos reamostrados pelo SMOTE; retorna o diretório em cache"""
+    import numpy as np
+    from imblearn.over_sampling import SMOTE
+    from sklearn.model_selection import StratifiedKFold
+
+    from painel_turnover import encode_training_data, holdout_split
+
+    folds_dir = Path(out_dir) / f"folds-{folds_key(path, n_folds)}"
+    if (folds_dir / "meta.json").exists():
+        return folds_dir
+
+    encoded = encode_training_data(path)
+    X_train, _, y_train, _ = holdout_split(encoded["X"], encoded["y"])
+    X, y = X_train.to_numpy(dtype="float64"), y_train.to_numpy(dtype="int8")
+
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=out_dir, prefix=".tmp-"))
+    try:
+        splitter = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=RANDOM_STATE)
+        for fold, (train_index, val_index) in enumerate(splitter.split(X, y)):
+            X_resampled, y_resampled = SMOTE(random_state=RANDOM_STATE).fit_resample(X[train_index], y[train_index])
+            np.save(tmp / f"fold{fold}-X_train.npy", X_resampled)
+            np.save(tmp / f"fold{fold}-y_train.npy", y_resampled)
+            np.save(tmp / f"fold{fold}-X_val.npy", X[val_index])
+            np.save(tmp / f"fold{fold}-y_val.npy", y[val_index])
+        meta = {"folds": n_folds, "rows": len(X), "columns": list(X_train.columns)}
+        (tmp / "meta.json").write_text(json.dumps(meta, ensure_ascii=False) + "\n", encoding="utf-8")
+        try:
+            os.replace(tmp, folds_dir)
+        except OSError:
+            # Outro processo montou os mesmos folds antes
+            if not (folds_dir / "meta.json").exists():
+                raise
+            shutil.rmtree(tmp, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return folds_dir
+
+
+def score_fold(folds_dir: str, fold: int, config: dict) -> dict:
+    """Executado no worker: treina a configuração no fold (arrays via memory map) e mede na validação"""
+    import numpy as np
+
+    from painel_turnover import evaluate
+
+    def load(name):
+        return np.load(Path(folds_dir) / f"fold{fold}-{name}.npy", mmap_mode="r")
+
+    start = time.perf_counter()
+    estimator = build_estimator(config["model"], config["params"], n_jobs=1)
+    estimator.fit(load("X_train"), load("y_train"))
+    metrics = evaluate(load("y_val"), estimator.predict_proba(load("X_val"))[:, 1])
+    return {"config": config["id"], "fold": fold, **metrics, "seconds": time.perf_counter() - start}
+
+
+def load_results(results_file) -> dict:
+    """Resultados já gravados, por (configuração, fold)"""
+    results = {}
+    if Path(results_file).exists():
+        for line in Path(results_file).read_text(encoding="utf-8").splitlines():
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # linha vazia ou cortada por uma interrupção durante a escrita
+            results[(row["config"], row["fold"])] = row
+    return results
+
+
+def rank(configs: list, results: dict, n_folds: int) -> list:
+    """Configurações com todos os folds pontuados, da maior para a menor AUC média"""
+    ranking = []
+    for config in configs:
+        rows = [results.get((config["id"], fold)) for fold in range(n_folds)]
+        if None in rows:
+            continue
+        ranking.append({
+            **config,
+            "AUC": statistics.mean(row["AUC"] for row in rows),
+            "AUC_std": statistics.pstdev(row["AUC"] for row in rows),
+            "Recall": statistics.mean(row["Recall"] for row in rows),
+            "Lift@10%": statistics.mean(row["Lift@10%"] for row in rows),
+        })
+    return sorted(ranking, key=lambda row: row["AUC"], reverse=True)
+
+
+def search(path=DATA_FILE, workers=WORKERS, n_folds=DEFAULT_FOLDS, models=None, out_dir=SEARCH_DIR) -> dict:
+    """Pontua as tarefas pendentes da grade (em série com workers=1) e retorna o ranking e os tempos"""
+    folds_dir = build_folds(path, n_folds, out_dir)
+    results_file = folds_dir / "results.jsonl"
+    configs = expand_grid(models)
+    results = load_results(results_file)
+    pending = [
+        (config, fold) for config in configs for fold in range(n_folds)
+        if (config["id"], fold) not in results
+    ]
+
+    start = time.perf_counter()
+    # Só o processo principal escreve no JSONL: uma linha por tarefa concluída, preservada se a busca parar
+    with open(results_file, "a+", encoding="utf-8") as out:
+        # Linha cortada por uma interrupção anterior: começa na próxima linha
+        end = out.tell()
+        if end:
+            out.seek(end - 1)
+            if out.read(1) != "\n":
+                out.write("\n")
+
+        def record(row):
+            results[(row["config"], row["fold"])] = row
+            out.write(json.dumps(row) + "\n")
+            out.flush()
+
+        if workers == 1:
+            for config, fold in pending:
+                record(score_fold(str(folds_dir), fold, config))
+        else:
+            # Tarefas mais pesadas primeiro: evita que a maior fique sozinha no fim do pool
+            pending.sort(key=lambda task: task[0]["params"].get("n_estimators", 0), reverse=True)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(score_fold, str(folds_dir), fold, config) for config, fold in pending]
+                for future in as_completed(futures):
+                    record(future.result())
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ranking": rank(configs, results, n_folds),
+        "tasks": len(configs) * n_folds,
+        "scored": len(pending),
+        "reused": len(configs) * n_folds - len(pending),
+        "seconds": elapsed,
+        # Soma do tempo de cada tarefa: o que uma execução serial levaria
+        "task_seconds": sum(results[(config["id"], fold)]["seconds"] for config, fold in pending),
+        "folds_dir": str(folds_dir),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Busca paralela de hiperparâmetros do modelo de turnover")
+    parser.add_argument("--csv", default=str(DATA_FILE))
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--folds", type=int, default=DEFAULT_FOLDS)
+    parser.add_argument("--models", nargs="+", choices=sorted(SEARCH_SPACE))
+    parser.add_argument("--out", default=str(SEARCH_DIR))
+    parser.add_argument("--refit", action="store_true", help="retreina a melhor configuração e grava o modelo do painel")
+    args = parser.parse_args()
+
+    result = search(args.csv, args.workers, args.folds, args.models, args.out)
+    print(f"{result['tasks']} tarefas: {result['scored']} pontuadas, {result['reused']} reaproveitadas, "
+          f"{result['seconds']:.1f} s com {args.workers} worker(s)")
+    if result["scored"] and args.workers > 1:
+        print(f"speedup estimado vs. série: {result['task_seconds'] / result['seconds']:.1f}x (soma das tarefas)")
+    for row in result["ranking"][:5]:
+        print(f"  AUC {row['AUC']:.3f} ±{row['AUC_std']:.3f}  Lift@10% {row['Lift@10%']:.2f}  {row['model']} {row['params']}")
+
+    if args.refit and result["ranking"]:
+        best = result["ranking"][0]
+        fitted = train(args.csv, best["model"], best["params"])
+        print(f"Modelo gravado em {save_model(fitted)}")
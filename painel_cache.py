@@ -0,0 +1,306 @@
+"""Cache compartilhado do painel para dados derivados.
+
+Um único cache por processo, independente de sessão, para DataFrames
+derivados, KPIs, JSON de figuras e fragmentos HTML renderizados:
+- TTL por entrada (sem TTL, a entrada vive até ser despejada);
+- teto global de memória (PAINEL_CACHE_MAX_MB) com despejo LRU;
+- contadores de hits, misses, despejos e expirações;
+- backend opcional em disco (PAINEL_CACHE_DIR), compartilhado entre workers
+  da mesma máquina e preservado entre reinícios, com teto próprio
+  (PAINEL_CACHE_DISK_MAX_MB) e varredura dos arquivos expirados;
+- artefatos pré-calculados somente leitura (PAINEL_ARTIFACTS, ver
+  painel_artefatos), mapeados em memória e compartilhados entre processos;
+  cada valor é desserializado no primeiro hit e depois servido pelo LRU.
+
+As chaves devem identificar o conteúdo (ex.: hash dos dados + parâmetros),
+para que o disco possa ser reaproveitado por outros processos.
+
+Valores mutáveis (DataFrames, dicionários, listas) são entregues como cópia
+a cada leitura: uma sessão que altere o que recebeu não muda o que as outras
+veem. Valores imutáveis (str, bytes, números, tuplas de imutáveis), como o
+JSON das figuras e os fragmentos HTML, são entregues sem cópia.
+"""
+import contextlib
+import copy
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = int(float(os.environ.get("PAINEL_CACHE_MAX_MB", "64")) * 1024 * 1024)
+DISK_DIR = os.environ.get("PAINEL_CACHE_DIR") or None
+DISK_MAX_BYTES = int(float(os.environ.get("PAINEL_CACHE_DISK_MAX_MB", "256")) * 1024 * 1024)
+# Gravações entre duas varreduras do disco (expirados e teto)
+DISK_SWEEP_EVERY = 200
+ARTIFACTS_FILE = os.environ.get("PAINEL_ARTIFACTS") or None
+
+
+def cache_key(*parts) -> str:
+    """Chave estável (SHA-256) a partir de partes serializáveis em JSON"""
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Tipos entregues sem cópia: não podem ser alterados por quem os recebe
+IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None))
+
+
+def private_copy(value):
+    """Cópia de um valor em cache para uma sessão (o próprio valor se for imutável)"""
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, tuple) and all(isinstance(item, IMMUTABLE_TYPES) for item in value):
+        return value
+    # DataFrame.__deepcopy__ = copy(deep=True), com attrs
+    return copy.deepcopy(value)
+
+
+def estimate_size(value) -> int:
+    """Estimativa do tamanho em memória de um valor (bytes)"""
+    # pandas só é consultado se já foi importado: DataFrame em cache implica pandas carregado
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def _read_expiry(f):
+    """Primeiro pickle do arquivo: expira_em (timestamp ou None); ValueError se o formato não for esse"""
+    expires_at = pickle.load(f)
+    if expires_at is not None and not isinstance(expires_at, float):
+        raise ValueError("arquivo de cache em formato desconhecido")
+    return expires_at
+
+
+class DiskBackend:
+    """Entradas em arquivos com dois pickles (expiração, valor) sob um diretório, com teto de bytes.
+
+    A expiração vem primeiro para que a varredura a leia sem carregar o valor.
+    A cada DISK_SWEEP_EVERY gravações, ou quando a estimativa de bytes passa
+    do teto, a varredura remove os arquivos expirados ou ilegíveis e depois os
+    menos usados (mtime, atualizado a cada leitura) até ficar abaixo do teto.
+    Sem isso, chaves com TTL (ex.: buscas digitadas pelos visitantes)
+    acumulariam arquivos indefinidamente.
+    """
+
+    def __init__(self, directory, max_bytes=DISK_MAX_BYTES, sweep_every=DISK_SWEEP_EVERY):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.sweep_every = sweep_every
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._bytes = self.sweep()
+
+    def _path(self, namespace: str, key: str) -> Path:
+        return self.directory / namespace / f"{key}.pkl"
+
+    def get(self, namespace: str, key: str):
+        """Retorna (expira_em, valor) ou None se ausente, expirado ou ilegível"""
+        path = self._path(namespace, key)
+        try:
+            with open(path, "rb") as f:
+                expires_at = _read_expiry(f)
+                expired = expires_at is not None and expires_at <= time.time()
+                value = None if expired else pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+        if expired:
+            path.unlink(missing_ok=True)
+            return None
+        # mtime marca o último uso: a varredura remove primeiro os menos usados
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return expires_at, value
+
+    def set(self, namespace: str, key: str, value, expires_at):
+        """Grava a entrada de forma atômica (arquivo temporário + rename); valores sem pickle ficam só na memória"""
+        path = self._path(namespace, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(expires_at, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                size = f.tell()
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            Path(tmp).unlink(missing_ok=True)
+            return
+        with self._lock:
+            self._writes += 1
+            self._bytes += size
+            due = self._writes >= self.sweep_every or self._bytes > self.max_bytes
+            if due:
+                self._writes = 0
+        if due:
+            total = self.sweep()
+            with self._lock:
+                self._bytes = total
+
+    def sweep(self) -> int:
+        """Remove expirados e ilegíveis e, acima do teto, os menos usados; retorna os bytes restantes"""
+        now = time.time()
+        files = []
+        for path in self.directory.glob("*/*.pkl"):
+            try:
+                stat = path.stat()
+                with open(path, "rb") as f:
+                    expires_at = _read_expiry(f)
+            except FileNotFoundError:
+                continue  # removido por outro processo
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+                expires_at = now
+            if expires_at is not None and expires_at <= now:
+                path.unlink(missing_ok=True)
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        return total
+
+    def clear(self):
+        """Remove todas as entradas gravadas"""
+        for path in self.directory.glob("*/*.pkl"):
+            path.unlink(missing_ok=True)
+
+
+class SharedCache:
+    """Cache LRU com TTL por entrada, teto de memória e backend opcional em disco"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, disk_dir=None, artifacts=None):
+        self.max_bytes = max_bytes
+        self.disk = DiskBackend(disk_dir) if disk_dir else None
+        self.artifacts = artifacts
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0, "misses": 0, "disk_hits": 0, "artifact_hits": 0, "evictions": 0, "expirations": 0,
+        }
+
+    def _drop(self, full_key):
+        """Remove uma entrada da memória (com o lock adquirido)"""
+        _, size, _ = self._entries.pop(full_key)
+        self._bytes -= size
+
+    def _store(self, full_key, value, expires_at):
+        """Guarda na memória e despeja as entradas menos usadas acima do teto (com o lock adquirido)"""
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            # Valor maior que o teto não fica na memória, nem a versão anterior da chave
+            if full_key in self._entries:
+                self._drop(full_key)
+            return
+        if full_key in self._entries:
+            self._drop(full_key)
+        self._entries[full_key] = (value, size, expires_at)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self._counters["evictions"] += 1
+
+    def get(self, namespace: str, key: str, default=None):
+        """Cópia do valor em cache (memória e depois disco) ou default"""
+        full_key = (namespace, key)
+        hit = False
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is not None:
+                value, _, expires_at = entry
+                if expires_at is None or expires_at > time.time():
+                    self._entries.move_to_end(full_key)
+                    self._counters["hits"] += 1
+                    hit = True
+                else:
+                    self._drop(full_key)
+                    self._counters["expirations"] += 1
+        # Cópia fora do lock: não segura as outras sessões
+        if hit:
+            return private_copy(value)
+
+        # Artefatos mapeados: desserializados uma vez e mantidos no LRU, como os hits de disco
+        stored = self.artifacts.get(namespace, key) if self.artifacts else None
+        if stored is not None:
+            with self._lock:
+                self._counters["artifact_hits"] += 1
+                self._store(full_key, stored[1], stored[0])
+            return private_copy(stored[1])
+
+        stored = self.disk.get(namespace, key) if self.disk else None
+        with self._lock:
+            if stored is None:
+                self._counters["misses"] += 1
+                return default
+            self._counters["disk_hits"] += 1
+            self._store(full_key, stored[1], stored[0])
+        return private_copy(stored[1])
+
+    def set(self, namespace: str, key: str, value, ttl=None):
+        """Guarda o valor por ttl segundos (None = sem expiração)"""
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._store((namespace, key), value, expires_at)
+        if self.disk:
+            self.disk.set(namespace, key, value, expires_at)
+
+    def get_or_compute(self, namespace: str, key: str, compute, ttl=None):
+        """Valor em cache ou, em miss, resultado de compute() guardado no cache"""
+        missing = object()
+        value = self.get(namespace, key, missing)
+        if value is missing:
+            value = compute()
+            self.set(namespace, key, value, ttl)
+            # O objeto calculado é o que fica em cache: quem chamou recebe uma cópia
+            value = private_copy(value)
+        return value
+
+    def items(self) -> list:
+        """Entradas válidas em memória como (namespace, chave, valor, expira_em); valores sem cópia, só para leitura"""
+        now = time.time()
+        with self._lock:
+            return [
+                (namespace, key, value, expires_at)
+                for (namespace, key), (value, _, expires_at) in self._entries.items()
+                if expires_at is None or expires_at > now
+            ]
+
+    def clear(self):
+        """Esvazia a memória e o disco (os contadores são mantidos)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.disk:
+            self.disk.clear()
+
+    def stats(self) -> dict:
+        """Contadores, entradas e bytes em memória"""
+        with self._lock:
+            return {**self._counters, "entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes}
+
+
+def _open_artifacts(path):
+    """Mapeia o arquivo de artefatos, se existir"""
+    if not path or not os.path.exists(path):
+        return None
+    from painel_artefatos import ArtifactStore
+
+    return ArtifactStore(path)
+
+
+# Cache do processo, compartilhado por todas as sessões
+CACHE = SharedCache(disk_dir=DISK_DIR, artifacts=_open_artifacts(ARTIFACTS_FILE))
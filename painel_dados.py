@@ -0,0 +1,219 @@
+"""Carregamento e validação dos dados do painel.
+
+Todo o conteúdo (perfil, experiências, projetos, formação, habilidades,
+habilidades comportamentais, idiomas, marcos, certificações e áreas de
+atuação) vive em `data/perfil.json`. O carregador valida o arquivo uma vez
+por versão e mantém o resultado em cache pelo mtime, então uma edição no
+arquivo é refletida no próximo rerun sem reiniciar o servidor.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+# PAINEL_DATA_FILE aponta para outro arquivo no mesmo schema (ex.: dados sintéticos de escala)
+DATA_FILE = Path(os.environ.get("PAINEL_DATA_FILE") or Path(__file__).resolve().parent / "data" / "perfil.json")
+SCHEMA_VERSION = 2
+
+YM_PATTERN = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
+
+PROFILE_FIELDS = ("name", "headline", "location", "email", "site", "linkedin", "github", "instagram", "bio")
+EXPERIENCE_FIELDS = ("company", "role", "start", "end", "city", "achievements", "skills")
+PROJECT_FIELDS = ("title", "summary", "tags")
+EDUCATION_FIELDS = ("title", "org", "year")
+MILESTONE_FIELDS = ("period", "event", "detail")
+CERTIFICATION_FIELDS = ("name", "org", "year", "icon")
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+class DataValidationError(ValueError):
+    """Arquivo de dados fora do schema esperado"""
+
+    def __init__(self, path, errors):
+        self.path = path
+        self.errors = errors
+        super().__init__(f"{path}: " + "; ".join(errors))
+
+
+def _check_fields(item: dict, fields: tuple, where: str, errors: list):
+    """Registra campos obrigatórios ausentes"""
+    for field in fields:
+        if field not in item:
+            errors.append(f"{where}: campo obrigatório '{field}' ausente")
+
+
+def _check_str_list(value, where: str, errors: list):
+    """Registra listas que não são compostas apenas por strings"""
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        errors.append(f"{where}: deve ser uma lista de strings")
+
+
+def _check_level(value, where: str, errors: list):
+    """Registra níveis fora do intervalo 0-100"""
+    if not isinstance(value, int) or isinstance(value, bool) or not 0 <= value <= 100:
+        errors.append(f"{where}: deve ser um inteiro entre 0 e 100")
+
+
+def _check_object_list(value, fields: tuple, where: str, errors: list):
+    """Registra listas de objetos sem os campos obrigatórios"""
+    if not isinstance(value, list):
+        errors.append(f"{where}: deve ser uma lista")
+        return
+    for i, item in enumerate(value):
+        if not isinstance(item, dict):
+            errors.append(f"{where}[{i}]: deve ser um objeto")
+            continue
+        _check_fields(item, fields, f"{where}[{i}]", errors)
+
+
+def validate_data(data) -> list:
+    """Valida o documento de dados e retorna a lista de erros encontrados"""
+    if not isinstance(data, dict):
+        return ["o documento deve ser um objeto JSON"]
+
+    errors = []
+    if data.get("schema_version") != SCHEMA_VERSION:
+        errors.append(f"schema_version deve ser {SCHEMA_VERSION}, encontrado {data.get('schema_version')!r}")
+
+    profile = data.get("profile")
+    if not isinstance(profile, dict):
+        errors.append("profile: deve ser um objeto")
+    else:
+        _check_fields(profile, PROFILE_FIELDS, "profile", errors)
+
+    experiences = data.get("experiences")
+    if not isinstance(experiences, list):
+        errors.append("experiences: deve ser uma lista")
+        experiences = []
+    for i, exp in enumerate(experiences):
+        where = f"experiences[{i}]"
+        if not isinstance(exp, dict):
+            errors.append(f"{where}: deve ser um objeto")
+            continue
+        _check_fields(exp, EXPERIENCE_FIELDS, where, errors)
+        if not YM_PATTERN.match(str(exp.get("start", ""))):
+            errors.append(f"{where}.start: formato esperado YYYY-MM")
+        if exp.get("end") is not None and not YM_PATTERN.match(str(exp["end"])):
+            errors.append(f"{where}.end: formato esperado YYYY-MM ou null")
+        _check_str_list(exp.get("achievements", []), f"{where}.achievements", errors)
+        _check_str_list(exp.get("skills", []), f"{where}.skills", errors)
+
+    projects = data.get("projects")
+    if not isinstance(projects, list):
+        errors.append("projects: deve ser uma lista")
+        projects = []
+    for i, project in enumerate(projects):
+        where = f"projects[{i}]"
+        if not isinstance(project, dict):
+            errors.append(f"{where}: deve ser um objeto")
+            continue
+        _check_fields(project, PROJECT_FIELDS, where, errors)
+        _check_str_list(project.get("tags", []), f"{where}.tags", errors)
+        if "metrics" in project and not isinstance(project["metrics"], dict):
+            errors.append(f"{where}.metrics: deve ser um objeto")
+
+    _check_object_list(data.get("education"), EDUCATION_FIELDS, "education", errors)
+    _check_object_list(data.get("milestones"), MILESTONE_FIELDS, "milestones", errors)
+    _check_object_list(data.get("certifications"), CERTIFICATION_FIELDS, "certifications", errors)
+
+    skills = data.get("skills")
+    if not isinstance(skills, dict):
+        errors.append("skills: deve ser um objeto")
+        skills = {}
+    for name, skill in skills.items():
+        where = f"skills[{name!r}]"
+        if not isinstance(skill, dict) or not isinstance(skill.get("history"), dict):
+            errors.append(f"{where}: deve conter 'current' e 'history'")
+            continue
+        _check_level(skill.get("current"), f"{where}.current", errors)
+        for year, level in skill["history"].items():
+            if not str(year).isdigit():
+                errors.append(f"{where}.history: ano inválido {year!r}")
+            _check_level(level, f"{where}.history[{year}]", errors)
+
+    languages = data.get("languages")
+    if not isinstance(languages, dict):
+        errors.append("languages: deve ser um objeto")
+        languages = {}
+    for name, level in languages.items():
+        _check_level(level, f"languages[{name!r}]", errors)
+
+    soft_skills = data.get("soft_skills")
+    if not isinstance(soft_skills, dict):
+        errors.append("soft_skills: deve ser um objeto")
+        soft_skills = {}
+    for name, level in soft_skills.items():
+        _check_level(level, f"soft_skills[{name!r}]", errors)
+
+    areas = data.get("areas")
+    if not isinstance(areas, dict):
+        errors.append("areas: deve ser um objeto")
+        areas = {}
+    for name, items in areas.items():
+        _check_str_list(items, f"areas[{name!r}]", errors)
+
+    return errors
+
+
+def _normalize(data: dict) -> dict:
+    """Converte o documento JSON para as estruturas usadas pelo painel"""
+    skills = {
+        name: {
+            "current": skill["current"],
+            "history": {int(year): level for year, level in sorted(skill["history"].items())},
+        }
+        for name, skill in data["skills"].items()
+    }
+    return {
+        "schema_version": data["schema_version"],
+        "profile": data["profile"],
+        "experiences": data["experiences"],
+        "projects": data["projects"],
+        "education": data["education"],
+        "skills": skills,
+        "languages": data["languages"],
+        "milestones": data["milestones"],
+        "certifications": data["certifications"],
+        "soft_skills": data["soft_skills"],
+        "areas": data["areas"],
+    }
+
+
+def parse_data_file(path) -> dict:
+    """Lê, valida e normaliza o arquivo de dados (sem cache)"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = json.loads(raw.decode("utf-8"))
+    errors = validate_data(data)
+    if errors:
+        raise DataValidationError(path, errors)
+    normalized = _normalize(data)
+    # Identifica o conteúdo nas chaves do cache compartilhado (estável entre processos)
+    normalized["content_hash"] = hashlib.sha256(raw).hexdigest()
+    return normalized
+
+
+def load_data(path=DATA_FILE) -> dict:
+    """Carrega os dados do painel, reaproveitando o parse enquanto o arquivo não mudar.
+
+    O resultado é compartilhado entre sessões e não deve ser modificado.
+    """
+    path = os.fspath(path)
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        data = parse_data_file(path)
+        _cache[path] = (version, data)
+        return data
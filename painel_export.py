@@ -0,0 +1,331 @@
+"""Exportação estática do painel.
+
+Renderiza todas as abas em um bundle estático (index.html + assets) que pode
+ser servido por qualquer CDN ou nginx, sem sessão Streamlit nem Python por
+visita. Os gráficos saem dos mesmos construtores de painel_figuras, embutidos
+como JSON (sem o template, enviado uma única vez para a página inteira) e
+desenhados pelo plotly.js no navegador; os cards, KPIs, sidebar e
+rodapé saem dos mesmos fragmentos de painel_html. Gráficos já renderizados
+pelo painel_render entram como fallback <noscript> e o radar de competências
+como imagem de prévia (Open Graph) para redes sociais.
+
+Uso:
+    python painel_export.py [--out dist] [--plotly-cdn] [--base-url https://exemplo.com]
+"""
+import argparse
+import html
+import json
+import re
+import shutil
+from datetime import date
+from pathlib import Path
+
+from painel_dados import load_data
+from painel_figuras import (
+    DARK_TEMPLATE, create_language_bars, create_progress_bars, create_skill_evolution_chart,
+    create_skill_radar, create_timeline_chart, split_template,
+)
+from painel_html import (
+    SOCIAL_LINKS, area_card_html, bio_card_html, certification_card_html, chart_image_html, columns_html,
+    contact_card_html, education_card_html, experience_card_html, footer_html, grid_html, growth_card_html,
+    highlights_card_html, kpi_card_html, metric_html, milestone_card_html, page_header_html,
+    philosophy_card_html, profile_picture_block_html, project_card_html, sidebar_footer_html,
+    sidebar_header_html, social_link_html, soft_skill_bar_html, specializations_card_html,
+    versatility_card_html,
+)
+from painel_imagens import IMG_DIR, STATIC_URL, load_profile_manifest
+from painel_indice import get_index
+from painel_modelo import (
+    EVOLUTION_SKILLS, EVOLUTION_YEARS, build_kpis, build_skill_highlights,
+    build_skill_sets, build_career_frame, compute_career_model, format_percent, skill_delta_label,
+)
+from painel_render import RENDER_DIR, RENDERER
+from painel_tema import (
+    ACCENT_BG, BORDER, CARD_BG, DARK_BG, FONTS_DIR, INTER_FONT_FILE, PRIMARY, TEXT, TEXT_LIGHT,
+    self_hosted_font_available, write_stylesheet,
+)
+
+ROOT = Path(__file__).resolve().parent
+DEFAULT_OUT_DIR = ROOT / "dist"
+
+PLOTLY_JS_FILE = "plotly.min.js"
+PLOTLY_CDN_URL = "https://cdn.plot.ly/plotly-{version}.min.js"
+
+# Imagens pré-renderizadas usadas como fallback sem JavaScript e como prévia social
+CHART_IMAGE_FORMAT = "png"
+CHART_IMAGE_PATTERN = re.compile(r"img/charts/([0-9a-f]{64}\.\w+)")
+
+# Layout que no app é feito pelo próprio Streamlit (página, sidebar e abas)
+EXPORT_CSS = f"""
+body {{ margin: 0; background: {DARK_BG}; color: {TEXT}; line-height: 1.5; }}
+a {{ color: {PRIMARY}; }}
+.layout {{ display: grid; grid-template-columns: 300px minmax(0, 1fr); min-height: 100vh; }}
+.sidebar {{ background: {ACCENT_BG}; padding: 2rem 1rem; }}
+.main {{ padding: 1rem 3rem 2rem; }}
+.tabs > input {{ position: absolute; opacity: 0; pointer-events: none; }}
+.tab-labels {{ display: flex; flex-wrap: wrap; gap: 0.5rem; border-bottom: 1px solid {BORDER}; margin-bottom: 1.5rem; }}
+.tab-labels label {{ cursor: pointer; padding: 0.75rem 1rem; color: {TEXT_LIGHT}; border-bottom: 2px solid transparent; }}
+.tab-panel {{ display: none; }}
+.plot {{ min-height: 300px; background: {CARD_BG}; border-radius: 12px; }}
+hr {{ border: none; border-top: 1px solid {BORDER}; margin: 2rem 0 0; }}
+@media (max-width: 768px) {{
+    .layout {{ grid-template-columns: 1fr; }}
+    .main {{ padding: 1rem; }}
+}}
+"""
+
+# Desenha os gráficos de uma aba apenas quando ela é exibida pela primeira vez
+EXPORT_JS = """
+var TEMPLATE = JSON.parse(document.getElementById("plot-template").textContent);
+function renderPanel(panel) {
+    panel.querySelectorAll("script[data-plot]").forEach(function (spec) {
+        if (spec.dataset.rendered) return;
+        spec.dataset.rendered = "1";
+        var fig = JSON.parse(spec.textContent);
+        fig.layout.template = TEMPLATE;
+        Plotly.newPlot(spec.previousElementSibling, fig.data, fig.layout, {responsive: true, displaylogo: false});
+    });
+}
+document.querySelectorAll(".tabs > input").forEach(function (radio) {
+    radio.addEventListener("change", function () {
+        renderPanel(document.getElementById("panel-" + radio.value));
+    });
+});
+renderPanel(document.getElementById("panel-0"));
+"""
+
+
+def json_script(value) -> str:
+    """JSON compacto seguro para embutir em <script>"""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).replace("</", "<\\/")
+
+
+def chart_image_url(spec: dict):
+    """Caminho relativo da imagem pré-renderizada da figura no bundle, ou None se ainda não existe"""
+    path = RENDERER.path(spec, CHART_IMAGE_FORMAT)
+    return f"img/charts/{path.name}" if path.exists() else None
+
+
+def plot_html(fig) -> str:
+    """Contêiner do gráfico com a figura serializada em JSON (o template compartilhado vai à parte)"""
+    full_spec = json.loads(fig.to_json())
+    spec, _ = split_template(full_spec)
+    image_url = chart_image_url(full_spec)
+    fallback = f"<noscript>{chart_image_html(image_url, 'Gráfico')}</noscript>" if image_url else ""
+    return f'<div class="plot">{fallback}</div><script type="application/json" data-plot>{json_script(spec)}</script>'
+
+
+def story_tab_html(data: dict) -> str:
+    """Aba Minha História"""
+    left = (
+        "<h3>Da Estratégia à Análise de Dados</h3>"
+        + bio_card_html(data["profile"])
+        + "<h3>Marcos da Carreira</h3>"
+        + "".join(milestone_card_html(milestone) for milestone in data["milestones"])
+    )
+    right = (
+        "<h3>Idiomas</h3>"
+        + plot_html(create_language_bars(data["languages"]))
+        + "<h3>Especializações</h3>"
+        + specializations_card_html()
+    )
+    return columns_html([left, right], [2, 1])
+
+
+def career_tab_html(data: dict, career: dict) -> str:
+    """Aba Trajetória"""
+    parts = [
+        "<h3>Evolução Profissional</h3>",
+        plot_html(create_timeline_chart(build_career_frame(career))),
+        columns_html([growth_card_html(), versatility_card_html()]),
+        "<h3>Detalhamento das Experiências</h3>",
+    ]
+    parts.extend(experience_card_html(exp) for exp in data["experiences"])
+    return "".join(parts)
+
+
+def skills_tab_html(data: dict) -> str:
+    """Aba Competências"""
+    skills_core, skills_tools = build_skill_sets(data["skills"])
+    metrics = [
+        metric_html(skill, format_percent(current), skill_delta_label(delta))
+        for skill, current, delta in build_skill_highlights(data["skills"])
+    ]
+    soft_skills = "".join(soft_skill_bar_html(skill, level) for skill, level in data["soft_skills"].items())
+    return "".join([
+        "<h3>Competências Técnicas</h3>",
+        columns_html(metrics),
+        columns_html([
+            "<h4>Perfil de Competências</h4>" + plot_html(create_skill_radar(skills_core)),
+            "<h4>Ferramentas & Tecnologias</h4>" + plot_html(create_progress_bars(skills_tools, "Proficiência Técnica")),
+        ]),
+        "<h4>Evolução das Habilidades</h4>",
+        plot_html(create_skill_evolution_chart(data["skills"], EVOLUTION_SKILLS, EVOLUTION_YEARS)),
+        "<h3>Habilidades Comportamentais</h3>",
+        columns_html([soft_skills, highlights_card_html()], [1, 2]),
+    ])
+
+
+def projects_tab_html(data: dict) -> str:
+    """Aba Projetos"""
+    parts = ["<h3>Projetos com Impacto</h3>"]
+    parts.extend(project_card_html(project, expanded=(i == 0)) for i, project in enumerate(data["projects"]))
+    parts.append("<h3>Áreas de Atuação</h3>")
+    parts.append(grid_html([area_card_html(area, skills) for area, skills in data["areas"].items()]))
+    return "".join(parts)
+
+
+def education_tab_html(data: dict) -> str:
+    """Aba Formação"""
+    return "".join([
+        "<h3>Formação Contínua</h3>",
+        "".join(education_card_html(edu) for edu in data["education"]),
+        "<h3>Certificações & Especializações</h3>",
+        grid_html([certification_card_html(cert) for cert in data["certifications"]]),
+        "<h3>Filosofia de Aprendizado</h3>",
+        philosophy_card_html(),
+    ])
+
+
+def tabs_html(tabs: list) -> str:
+    """Abas em CSS puro: um radio por aba controla qual painel fica visível"""
+    radios = "".join(
+        f'<input type="radio" name="tab" id="tab-{i}" value="{i}"{" checked" if i == 0 else ""}>'
+        for i in range(len(tabs))
+    )
+    labels = "".join(f'<label for="tab-{i}">{title}</label>' for i, (title, _) in enumerate(tabs))
+    panels = "".join(f'<section class="tab-panel" id="panel-{i}">{body}</section>' for i, (_, body) in enumerate(tabs))
+    rules = "".join(
+        f"#tab-{i}:checked ~ .panels #panel-{i} {{ display: block; }}"
+        f"#tab-{i}:checked ~ .tab-labels label[for=tab-{i}] {{ color: {TEXT}; border-bottom-color: {PRIMARY}; }}"
+        for i in range(len(tabs))
+    )
+    return f'<style>{rules}</style><div class="tabs">{radios}<nav class="tab-labels">{labels}</nav><div class="panels">{panels}</div></div>'
+
+
+def social_preview_html(data: dict, base_url=None) -> str:
+    """Metadados Open Graph; a imagem de prévia é o radar de competências, se já pré-renderizado"""
+    profile = data["profile"]
+    tags = [
+        f'<meta property="og:title" content="{html.escape(profile["name"])} | Analista de Dados">',
+        f'<meta property="og:description" content="{html.escape(profile["headline"])}">',
+    ]
+    skills_core, _ = build_skill_sets(data["skills"])
+    image_url = chart_image_url(json.loads(create_skill_radar(skills_core).to_json()))
+    if image_url:
+        # Redes sociais exigem URL absoluta: sem base_url a imagem fica relativa ao index.html
+        url = f"{base_url.rstrip('/')}/{image_url}" if base_url else image_url
+        tags += [f'<meta property="og:image" content="{url}">', '<meta name="twitter:card" content="summary_large_image">']
+    return "\n".join(tags)
+
+
+def render_page(data: dict, career: dict, stylesheet: str, plotly_src: str, manifest, base_url=None) -> str:
+    """Monta o index.html completo"""
+    profile = data["profile"]
+    sidebar = (
+        profile_picture_block_html(manifest)
+        + sidebar_header_html(profile)
+        + contact_card_html(profile)
+        + "".join(social_link_html(profile[key], label, background) for key, label, background in SOCIAL_LINKS)
+        + sidebar_footer_html(profile)
+    )
+    kpis = "".join(kpi_card_html(*kpi) for kpi in build_kpis(data, career, get_index(data)))
+    tabs = tabs_html([
+        ("📖 Minha História", story_tab_html(data)),
+        ("📈 Trajetória", career_tab_html(data, career)),
+        ("🛠️ Competências", skills_tab_html(data)),
+        ("🚀 Projetos", projects_tab_html(data)),
+        ("🎓 Formação", education_tab_html(data)),
+    ])
+    font_preload = (
+        f'<link rel="preload" href="fonts/{INTER_FONT_FILE}" as="font" type="font/woff2" crossorigin>'
+        if self_hosted_font_available() else ""
+    )
+    return f"""<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{profile['name']} | Analista de Dados</title>
+<meta name="description" content="{html.escape(profile['headline'])}">
+{social_preview_html(data, base_url)}
+{font_preload}
+<link rel="stylesheet" href="{stylesheet}">
+<style>{EXPORT_CSS}</style>
+<script src="{plotly_src}" defer></script>
+</head>
+<body>
+<div class="layout">
+<aside class="sidebar">{sidebar}</aside>
+<main class="main">
+{page_header_html()}
+<div class="story-grid">{kpis}</div>
+{tabs}
+<hr>
+{footer_html(profile)}
+</main>
+</div>
+<script type="application/json" id="plot-template">{json_script(DARK_TEMPLATE)}</script>
+<script>window.addEventListener("DOMContentLoaded", function () {{ {EXPORT_JS} }});</script>
+</body>
+</html>
+"""
+
+
+def _export_manifest(out_dir: Path):
+    """Copia as imagens de perfil para o bundle e reescreve as URLs do manifesto"""
+    manifest = load_profile_manifest()
+    if manifest is None:
+        return None
+    shutil.copytree(IMG_DIR, out_dir / "img", dirs_exist_ok=True, ignore=shutil.ignore_patterns(RENDER_DIR.name))
+    as_json = json.dumps(manifest).replace(f"{STATIC_URL}/img/", "img/")
+    return json.loads(as_json)
+
+
+def _copy_chart_images(page: str, out_dir: Path):
+    """Copia para o bundle apenas as imagens de gráficos referenciadas pela página"""
+    names = set(CHART_IMAGE_PATTERN.findall(page))
+    if names:
+        (out_dir / "img" / "charts").mkdir(parents=True, exist_ok=True)
+    for name in names:
+        shutil.copy2(RENDER_DIR / name, out_dir / "img" / "charts" / name)
+
+
+def export_site(out_dir=DEFAULT_OUT_DIR, plotly_cdn=False, today=None, base_url=None) -> Path:
+    """Gera o bundle estático em out_dir e retorna o caminho do index.html"""
+    import plotly
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    data = load_data()
+    today = today or date.today()
+    career = compute_career_model(data["experiences"], today)
+
+    font_url = None
+    if self_hosted_font_available():
+        shutil.copytree(FONTS_DIR, out_dir / "fonts", dirs_exist_ok=True)
+        font_url = f"../fonts/{INTER_FONT_FILE}"
+    stylesheet = write_stylesheet(out_dir / "css", font_url=font_url).relative_to(out_dir).as_posix()
+
+    if plotly_cdn:
+        plotly_src = PLOTLY_CDN_URL.format(version=plotly.offline.get_plotlyjs_version())
+    else:
+        (out_dir / PLOTLY_JS_FILE).write_text(plotly.offline.get_plotlyjs(), encoding="utf-8")
+        plotly_src = PLOTLY_JS_FILE
+
+    page = render_page(data, career, stylesheet, plotly_src, _export_manifest(out_dir), base_url)
+    _copy_chart_images(page, out_dir)
+    index = out_dir / "index.html"
+    index.write_text(page, encoding="utf-8")
+    return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exporta o painel como site estático")
+    parser.add_argument("--out", default=str(DEFAULT_OUT_DIR), help="pasta de saída (padrão: dist)")
+    parser.add_argument("--plotly-cdn", action="store_true", help="carrega o plotly.js da CDN em vez de copiá-lo")
+    parser.add_argument("--base-url", help="URL pública do site, para a imagem de prévia (og:image) absoluta")
+    args = parser.parse_args()
+
+    print(f"Painel exportado em {export_site(args.out, plotly_cdn=args.plotly_cdn, base_url=args.base_url)}")
@@ -0,0 +1,314 @@
+"""Construtores de figuras Plotly do painel.
+
+Fonte única dos gráficos para o app Streamlit e para a exportação estática.
+As figuras dependem apenas dos dados de entrada e das constantes de tema, o
+que permite indexá-las por hash de conteúdo (figure_content_hash).
+
+Plotly e pandas são importados dentro dos construtores: com as figuras em
+cache, uma sessão que não monta nenhum gráfico não paga esses imports. Só a
+timeline ainda usa plotly.express; as demais usam graph_objects.
+
+O tema é um template compacto (DARK_TEMPLATE) definido uma vez: só as partes
+do plotly_dark que barras, linhas e radar usam, já com as cores do painel.
+split_template separa o template da figura serializada para quem pode
+enviá-lo uma única vez por página (exportação estática).
+
+Perfil mobile: mobile_spec reduz os dados de hover e figure_image renderiza a
+figura serializada como imagem estática no servidor (requer kaleido, opcional).
+"""
+import hashlib
+import importlib.util
+import json
+import sys
+
+from painel_modelo import skills_frame
+from painel_tema import ACCENT, BORDER, CARD_BG, DARK_BG, PRIMARY, SECONDARY, TEXT, TEXT_LIGHT, THEME_KEY
+
+
+# Versão do formato das figuras serializadas (entra no hash de conteúdo)
+FIGURE_FORMAT = 2
+
+_AXIS = {
+    "gridcolor": BORDER,
+    "linecolor": BORDER,
+    "tickfont": {"size": 10, "color": TEXT_LIGHT},
+    "ticks": "",
+    "title": {"standoff": 15},
+    "zerolinecolor": "#283442",
+    "zerolinewidth": 2,
+    "automargin": True,
+}
+_POLAR_AXIS = {"gridcolor": "#506784", "linecolor": "#506784", "ticks": ""}
+
+# Tema escuro compartilhado por todas as figuras (subconjunto do plotly_dark + cores do painel)
+DARK_TEMPLATE = {
+    "layout": {
+        "autotypenumbers": "strict",
+        "colorway": [PRIMARY, SECONDARY, ACCENT, "#8c564b", "#e377c2", "#7f7f7f"],
+        "font": {"family": "Inter, sans-serif", "size": 12, "color": TEXT},
+        "hoverlabel": {"align": "left"},
+        "hovermode": "closest",
+        "paper_bgcolor": DARK_BG,
+        "plot_bgcolor": CARD_BG,
+        "margin": {"l": 20, "r": 20, "t": 40, "b": 20},
+        "legend": {
+            "bgcolor": CARD_BG,
+            "bordercolor": BORDER,
+            "borderwidth": 1,
+            "orientation": "h",
+            "yanchor": "bottom",
+            "y": 1.02,
+            "xanchor": "right",
+            "x": 1,
+        },
+        "title": {"x": 0.05},
+        "xaxis": _AXIS,
+        "yaxis": _AXIS,
+        "polar": {"bgcolor": DARK_BG, "angularaxis": _POLAR_AXIS, "radialaxis": _POLAR_AXIS},
+    }
+}
+
+
+def apply_dark_theme(fig):
+    """Aplica tema escuro consistente aos gráficos Plotly"""
+    # Atribuição (e não update_layout) para substituir o template padrão em vez de mesclar
+    fig.layout.template = DARK_TEMPLATE
+    return fig
+
+
+# Renderização de imagens estáticas (perfil mobile); sem kaleido, o app usa gráficos estáticos
+IMAGE_RENDERER_AVAILABLE = importlib.util.find_spec("kaleido") is not None
+MOBILE_IMAGE_FORMAT = "webp"
+MOBILE_IMAGE_WIDTH = 480
+DEFAULT_FIGURE_HEIGHT = 450
+
+
+def split_template(spec: dict):
+    """Separa o template da figura serializada: (figura sem template, template)"""
+    layout = dict(spec.get("layout", {}))
+    template = layout.pop("template", None)
+    return {**spec, "layout": layout}, template
+
+
+def mobile_spec(spec: dict) -> dict:
+    """Figura serializada com hover reduzido: sem customdata, apenas o rótulo e o nome da série"""
+    data = []
+    for trace in spec.get("data", []):
+        if "customdata" in trace:
+            trace = {key: value for key, value in trace.items() if key != "customdata"}
+            trace["hovertemplate"] = "%{y}<extra>%{fullData.name}</extra>"
+        data.append(trace)
+    return {**spec, "data": data}
+
+
+def figure_image(spec: dict, fmt=MOBILE_IMAGE_FORMAT, width=MOBILE_IMAGE_WIDTH, scale=2) -> bytes:
+    """Renderiza a figura serializada como imagem estática (PNG/WebP/SVG; requer kaleido)"""
+    import plotly.io as pio
+
+    height = spec.get("layout", {}).get("height", DEFAULT_FIGURE_HEIGHT)
+    return pio.to_image(spec, format=fmt, width=width, height=height, scale=scale)
+
+
+def create_timeline_chart(df):
+    """Cria gráfico de timeline profissional"""
+    import plotly.express as px
+
+    role_colors = {
+        "Analista de Dados": PRIMARY,
+        "Analista de Operações Internacionais": SECONDARY,
+        "Consultor Comercial": ACCENT,
+        "Founder | Head of Everything": "#8c564b",
+        "Field Representative": "#e377c2",
+        "Analista de F&I": TEXT_LIGHT
+    }
+    
+    fig = px.timeline(
+        df,
+        x_start="Início",
+        x_end="Fim",
+        y="Empresa",
+        color="Cargo",
+        color_discrete_map=role_colors,
+        custom_data=["Empresa", "Cargo", "Cidade", "Início", "Fim", "Duracao_str", "Desc"]
+    )
+    
+    fig.update_traces(
+        marker=dict(line=dict(color=CARD_BG, width=2)),
+        hovertemplate=(
+            "<b>%{customdata[0]}</b><br>"
+            "Cargo: %{customdata[1]}<br>"
+            "Local: %{customdata[2]}<br>"
+            "Período: %{customdata[3]|%b %Y} – %{customdata[4]|%b %Y}<br>"
+            "Duração: %{customdata[5]}<br>"
+            "<em>%{customdata[6]}</em><extra></extra>"
+        )
+    )
+    
+    fig.layout.margin = None  # margem do tema, não a do px
+    fig.update_yaxes(autorange="reversed", title=None, showgrid=False)
+    fig.update_xaxes(tickformat="%Y", dtick="M12", title=None)
+    
+    apply_dark_theme(fig)
+    fig.update_layout(
+        height=400,
+        legend=dict(
+            title="Evolução da Carreira",
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    
+    return fig
+
+
+def create_skill_radar(skills: dict):
+    """Cria gráfico radar de competências"""
+    import plotly.graph_objects as go
+
+    labels = list(skills.keys())
+    values = list(skills.values())
+    avg_value = sum(values) / len(values)
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatterpolar(
+        r=values,
+        theta=labels,
+        fill='toself',
+        fillcolor='rgba(46, 134, 222, 0.2)',
+        line=dict(color=PRIMARY, width=2),
+        name="Competências Atuais"
+    ))
+    
+    fig.add_trace(go.Scatterpolar(
+        r=[avg_value] * len(labels),
+        theta=labels,
+        line=dict(color=TEXT_LIGHT, width=1, dash='dash'),
+        name="Média"
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            bgcolor=CARD_BG,
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                gridcolor=BORDER,
+                linecolor=BORDER
+            ),
+            angularaxis=dict(
+                gridcolor=BORDER,
+                linecolor=BORDER
+            )
+        ),
+        showlegend=True
+    )
+    
+    apply_dark_theme(fig)
+    fig.update_layout(height=400)
+    
+    return fig
+
+
+def create_progress_bars(skills: dict, title="Progresso"):
+    """Cria gráfico de barras horizontais para habilidades"""
+    import plotly.graph_objects as go
+
+    ordered = sorted(skills.items(), key=lambda item: item[1])
+    levels = [level for _, level in ordered]
+    
+    fig = go.Figure(go.Bar(
+        x=levels,
+        y=[skill for skill, _ in ordered],
+        orientation='h',
+        text=levels,
+        hovertemplate="Nível=%{x}<br>Habilidade=%{y}<extra></extra>",
+        marker_color=PRIMARY,
+        texttemplate='%{x}%',
+        textposition='outside',
+        marker_line_color=PRIMARY,
+        marker_line_width=1
+    ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis=dict(title="Nível", range=[0, 100], showgrid=True, gridcolor=BORDER),
+        yaxis=dict(title="Habilidade", showgrid=False),
+        showlegend=False
+    )
+    
+    apply_dark_theme(fig)
+
+    return fig
+
+
+def create_language_bars(languages: dict):
+    """Cria gráfico de barras de proficiência em idiomas"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Bar(
+        x=list(languages.values()),
+        y=list(languages.keys()),
+        orientation='h',
+        hovertemplate="Proficiência=%{x}<br>Idioma=%{y}<extra></extra>",
+    ))
+    fig.update_traces(marker_color=PRIMARY, marker_line_color=PRIMARY, marker_line_width=1)
+    apply_dark_theme(fig)
+    fig.update_layout(height=300, showlegend=False, xaxis_title="Proficiência", yaxis_title="Idioma")
+
+    return fig
+
+
+def create_skill_evolution_chart(skills_data: dict, skills: list, years: list):
+    """Cria gráfico de linha com a evolução das habilidades ao longo dos anos"""
+    import plotly.graph_objects as go
+    from plotly.colors import qualitative
+
+    frame = skills_frame(skills_data)
+    frame = frame.loc[frame.index.isin(years), [skill for skill in skills if skill in frame.columns]]
+
+    # Uma linha por habilidade, nas cores padrão do Plotly (as mesmas do px.line)
+    fig = go.Figure()
+    for i, skill in enumerate(frame.columns):
+        levels = frame[skill].dropna()
+        fig.add_trace(go.Scatter(
+            x=[str(year) for year in levels.index],
+            y=levels.astype(int).tolist(),
+            mode="lines+markers",
+            name=skill,
+            legendgroup=skill,
+            line=dict(color=qualitative.Plotly[i % len(qualitative.Plotly)]),
+            hovertemplate=f"Habilidade={skill}<br>Ano=%{{x}}<br>Nível=%{{y}}<extra></extra>",
+        ))
+    fig.update_layout(
+        title=f"Crescimento das Principais Habilidades ({years[0]}-{years[-1]})",
+        xaxis_title="Ano",
+        yaxis_title="Nível",
+        legend_title_text="Habilidade",
+    )
+    apply_dark_theme(fig)
+    fig.update_layout(height=400)
+
+    return fig
+
+
+def _json_default(obj):
+    """Serializa objetos não nativos de JSON para o hash de conteúdo"""
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(obj, pd.DataFrame):
+        return obj.to_dict(orient="split")
+    return str(obj)
+
+
+def figure_content_hash(builder_name: str, args: tuple, kwargs: dict) -> str:
+    """Gera hash SHA-256 dos dados de entrada e das constantes de tema de uma figura"""
+    payload = json.dumps(
+        [builder_name, args, kwargs, THEME_KEY, FIGURE_FORMAT],
+        sort_keys=True,
+        default=_json_default,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
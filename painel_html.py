@@ -0,0 +1,488 @@
+"""Fragmentos HTML do painel.
+
+Fonte única da marcação dos cards, KPIs, sidebar e rodapé: o app Streamlit
+envia estes fragmentos com st.markdown e a exportação estática os monta em
+uma página HTML.
+"""
+import html
+import re
+
+from painel_imagens import profile_picture_html
+from painel_tema import ACCENT, ACCENT_BG, BORDER, CARD_BG, PRIMARY, SECONDARY, TEXT, TEXT_LIGHT
+
+# Foto original, usada apenas se as variantes de static/img ainda não foram geradas
+PROFILE_IMAGE_FALLBACK_URL = "https://raw.githubusercontent.com/murillomartins101/painel_profissional/main/profile.jpg"
+
+# Links da sidebar: (chave em PROFILE, rótulo, gradiente de fundo)
+SOCIAL_LINKS = [
+    ("linkedin", "🔗 LinkedIn", f"linear-gradient(90deg, {PRIMARY}, {SECONDARY})"),
+    ("github", "💻 GitHub", f"linear-gradient(90deg, #333333, {PRIMARY})"),
+    ("site", "📁 Website", f"linear-gradient(90deg, {ACCENT}, #e67e22)"),
+    ("instagram", "🥁 Instagram", "linear-gradient(90deg, #c0392b, #8e44ad)"),
+]
+
+
+def kpi_card_html(label: str, value: str, trend=None, highlight=False) -> str:
+    """KPI card com tema escuro"""
+    trend_html = ""
+    if trend:
+        trend_class = "positive" if trend > 0 else "negative"
+        trend_symbol = "↗️" if trend > 0 else "↘️"
+        trend_html = f'<span class="trend {trend_class}">{trend_symbol} {abs(trend)}%</span>'
+
+    css_class = "story-kpi highlight" if highlight else "story-kpi"
+
+    return f'''
+    <div class="{css_class}">
+        <small>{label}</small>
+        <b>{value}</b>
+        {trend_html}
+    </div>
+    '''
+
+
+def badge_html(text: str, block=False) -> str:
+    """Badge de tecnologia/habilidade (em bloco nas colunas laterais)"""
+    style = ' style="display: block; margin: 5px 0;"' if block else ""
+    return f'<span class="data-badge"{style}>{text}</span>'
+
+
+# --- SIDEBAR
+def profile_picture_block_html(manifest) -> str:
+    """Foto de perfil da sidebar: variantes do manifesto de imagens ou, sem ele, o arquivo original"""
+    style = (
+        f"border-radius: 50%; width: 150px; height: 150px; object-fit: cover; "
+        f"border: 4px solid {PRIMARY}; box-shadow: 0 4px 15px rgba(0,0,0,0.3); "
+        f"margin: 0 auto; display: block;"
+    )
+    if manifest is None:
+        picture = f'<img src="{PROFILE_IMAGE_FALLBACK_URL}" alt="Foto de Perfil" style="{style}">'
+    else:
+        picture = profile_picture_html(manifest, "Foto de Perfil", style)
+    return f"""
+    <div style="text-align: center; margin-bottom: 1.5rem;">
+        {picture}
+    </div>
+    """
+
+
+def sidebar_header_html(profile: dict) -> str:
+    """Nome e título da sidebar"""
+    return f"""
+    <div style="text-align: center; margin-bottom: 2rem;">
+        <h2 style="
+            font-size: 1.5rem;
+            font-weight: 700;
+            color: {TEXT};
+            margin-bottom: 0.5rem;
+            line-height: 1.2;
+        ">
+            {profile['name']}
+        </h2>
+        <p style="
+            font-size: 0.9rem;
+            color: {PRIMARY};
+            font-weight: 600;
+            margin-bottom: 1rem;
+            line-height: 1.4;
+        ">
+            Data Analyst | Data Science<br>
+            Marketing | Analytics
+        </p>
+    </div>
+    """
+
+
+def contact_card_html(profile: dict) -> str:
+    """Card de contato da sidebar"""
+    return f"""
+    <div style="
+        background: {CARD_BG};
+        border-radius: 10px;
+        padding: 1rem;
+        margin-bottom: 1.5rem;
+        border: 1px solid {BORDER};
+    ">
+        <p style="
+            color: {TEXT_LIGHT};
+            font-size: 0.85rem;
+            margin: 0.5rem 0;
+            line-height: 1.6;
+        ">
+            📍 {profile['location']}
+        </p>
+        <p style="
+            color: {TEXT_LIGHT};
+            font-size: 0.85rem;
+            margin: 0.5rem 0;
+            line-height: 1.6;
+        ">
+            ✉️ <a href="mailto:{profile['email']}" style="color: {TEXT}; text-decoration: none;">{profile['email']}</a>
+        </p>
+    </div>
+    """
+
+
+def social_link_html(url: str, label: str, background: str) -> str:
+    """Botão de rede social da sidebar"""
+    return f"""
+        <a href="{url}" target="_blank" class="sidebar-link" style="
+            background: {background};
+            color: #ffffff;
+        ">
+            {label}
+        </a>
+    """
+
+
+def sidebar_footer_html(profile: dict) -> str:
+    """Rodapé da sidebar"""
+    return f"""
+    <div style="
+        text-align: center;
+        padding-top: 1.5rem;
+        border-top: 1px solid {BORDER};
+        margin-top: 2rem;
+    ">
+        <p style="
+            color: {TEXT_LIGHT};
+            font-size: 0.75rem;
+            line-height: 1.4;
+        ">
+            Desenvolvido por<br>
+            <strong style="color: {TEXT};">{profile['name']}</strong><br>
+            © 2025
+        </p>
+    </div>
+    """
+
+
+def search_results_html(projects: list, experiences: list, education: list) -> str:
+    """Resultado da busca no perfil: projetos, experiências e formações encontrados"""
+    sections = [
+        ("🚀 Projetos", [project["title"] for project in projects]),
+        ("📈 Experiências", [f"{exp['role']} · {exp['company']}" for exp in experiences]),
+        ("🎓 Formação", [f"{edu['title']} · {edu['org']}" for edu in education]),
+    ]
+    found = [(title, names) for title, names in sections if names]
+    if not found:
+        return f'<p style="color: {TEXT_LIGHT}; font-size: 0.85rem;">Nenhum resultado.</p>'
+    return "".join(
+        f'<p style="margin: 0.75rem 0 0.25rem; color: {PRIMARY}; font-weight: 600; font-size: 0.85rem;">{title} ({len(names)})</p>'
+        + "".join(f'<div style="color: {TEXT}; font-size: 0.85rem; margin-bottom: 0.25rem;">{name}</div>' for name in names[:10])
+        + (f'<small style="color: {TEXT_LIGHT};">+{len(names) - 10}</small>' if len(names) > 10 else "")
+        for title, names in found
+    )
+
+
+# --- CONTEÚDO PRINCIPAL
+def page_header_html(is_mobile=False) -> str:
+    """Cabeçalho da página"""
+    return f"""
+<div class="main-header">
+    <h1 style="font-size: {'1.8rem' if is_mobile else '2.5rem'}; margin-bottom: 1rem;">Dashboard Profissional</h1>
+    <p style="font-size: {'0.9rem' if is_mobile else '1.2rem'}; color: {TEXT_LIGHT}; font-weight: 400;">
+        Um portfólio interativo focado em storytelling com dados
+    </p>
+</div>
+"""
+
+
+def bio_card_html(profile: dict) -> str:
+    """Card de bio com o foco atual"""
+    return f"""
+        <div class="data-card">
+            <p style="font-size: 16px; line-height: 1.7; color: {TEXT};">{profile['bio']}</p>
+            <div style="margin-top: 1.5rem; padding: 1.5rem; background: {ACCENT_BG}; border-radius: 8px; border-left: 4px solid {PRIMARY};">
+                <h4 style="color: {PRIMARY}; margin-bottom: 1rem;">🎯 Foco Atual</h4>
+                <div style="display: flex; flex-wrap: wrap; gap: 0.5rem;">
+                    <span class="data-badge">Python</span>
+                    <span class="data-badge secondary">Power BI</span>
+                    <span class="data-badge">SQL</span>
+                    <span class="data-badge accent">Machine Learning</span>
+                    <span class="data-badge">Data Storytelling</span>
+                    <span class="data-badge" style="background: rgba(155, 89, 182, 0.15); color: #9b59b6; border-color: rgba(155, 89, 182, 0.3);">Pensamento Analítico</span>
+                </div>
+            </div>
+        </div>
+        """
+
+
+def milestone_card_html(milestone: dict) -> str:
+    """Card de marco da carreira"""
+    return f"""
+            <div class="data-card" style="padding: 1rem; margin-bottom: 0.75rem;">
+                <div style="display: flex; justify-content: space-between; align-items: start; gap: 1rem;">
+                    <div style="flex: 0 0 120px;">
+                        <strong style="color: {PRIMARY}; font-size: 0.9rem;">{milestone['period']}</strong>
+                    </div>
+                    <div style="flex: 1;">
+                        <strong style="font-size: 1rem;">{milestone['event']}</strong><br>
+                        <small style="color: {TEXT_LIGHT}; font-size: 0.85rem;">{milestone['detail']}</small>
+                    </div>
+                </div>
+            </div>
+            """
+
+
+def specializations_card_html() -> str:
+    """Card de especializações"""
+    return """
+        <div class="data-card">
+            <div style="text-align: center;">
+                <div style="margin-bottom: 1rem;">
+                    <span class="data-badge secondary" style="font-size: 14px; padding: 8px 16px;">Data Analytics</span>
+                </div>
+                <div style="margin-bottom: 1rem;">
+                    <span class="data-badge" style="font-size: 14px; padding: 8px 16px;">Business Intelligence</span>
+                </div>
+                <div>
+                    <span class="data-badge accent" style="font-size: 14px; padding: 8px 16px;">Machine Learning</span>
+                </div>
+            </div>
+        </div>
+        """
+
+
+def insight_card_html(title: str, text: str, color: str) -> str:
+    """Card curto de insight da trajetória"""
+    return f"""
+        <div class="data-card">
+            <h4 style="color: {color};">{title}</h4>
+            <p style="font-size: 14px; color: {TEXT}; line-height: 1.6;">
+                {text}
+            </p>
+        </div>
+        """
+
+
+def growth_card_html() -> str:
+    """Card 'Padrão de Crescimento' da trajetória"""
+    return insight_card_html(
+        "📈 Padrão de Crescimento",
+        "Transição consistente de funções operacionais para estratégicas, com foco crescente em dados e analytics.",
+        SECONDARY,
+    )
+
+
+def versatility_card_html() -> str:
+    """Card 'Versatilidade' da trajetória"""
+    return insight_card_html(
+        "🔄 Versatilidade",
+        "Experiência diversificada em setores: financeiro, automotivo, marketing digital, tecnologia e music business",
+        ACCENT,
+    )
+
+
+def soft_skill_bar_html(skill: str, level: int) -> str:
+    """Barra de progresso de habilidade comportamental"""
+    return f"""
+            <div style="margin-bottom: 1rem;">
+                <div style="display: flex; justify-content: space-between; margin-bottom: 5px;">
+                    <span style="font-size: 14px; color: {TEXT};">{skill}</span>
+                    <span style="font-size: 14px; color: {PRIMARY}; font-weight: 600;">{level}%</span>
+                </div>
+                <div style="width: 100%; background: {BORDER}; height: 8px; border-radius: 4px; overflow: hidden;">
+                    <div style="width: {level}%; background: linear-gradient(90deg, {PRIMARY}, {SECONDARY}); height: 100%;"></div>
+                </div>
+            </div>
+            """
+
+
+def highlights_card_html() -> str:
+    """Card de destaques comportamentais"""
+    return f"""
+        <div class="data-card">
+            <h4 style="color: {PRIMARY};">💡 Destaques</h4>
+            <ul style="line-height: 1.8; color: {TEXT};">
+                <li>Forte capacidade de <strong>comunicação técnica</strong> para públicos diversos</li>
+                <li>Experiência em <strong>gestão de projetos complexos</strong> e multidisciplinares</li>
+                <li>Habilidade comprovada em <strong>storytelling com dados</strong></li>
+                <li>Adaptação rápida a novos <strong>desafios e tecnologias</strong></li>
+            </ul>
+        </div>
+        """
+
+
+def area_card_html(area: str, skills: list) -> str:
+    """Card de área de atuação"""
+    return f"""
+            <div class="data-card">
+                <h4 style="color: {PRIMARY}; margin-bottom: 1rem;">{area}</h4>
+                <div style="display: flex; flex-wrap: wrap; gap: 0.5rem;">
+                    {''.join([badge_html(skill) for skill in skills])}
+                </div>
+            </div>
+            """
+
+
+def education_card_html(edu: dict) -> str:
+    """Card de formação"""
+    year_color = SECONDARY if edu['year'] == '2025' else PRIMARY
+    return f"""
+        <div class="data-card" style="transition: all 0.3s ease;">
+            <div style="display: flex; justify-content: space-between; align-items: start; gap: 1rem;">
+                <div style="flex: 1;">
+                    <h4 style="margin: 0 0 8px 0; color: {TEXT}; font-size: 1.1rem;">{edu['title']}</h4>
+                    <p style="margin: 0; color: {PRIMARY}; font-weight: 600; font-size: 0.95rem;">{edu['org']}</p>
+                </div>
+                <div style="background: {year_color}; color: white; padding: 8px 16px; border-radius: 12px; font-size: 13px; font-weight: 600;">
+                    {edu['year']}
+                </div>
+            </div>
+        </div>
+        """
+
+
+def certification_card_html(cert: dict) -> str:
+    """Card de certificação"""
+    return f"""
+            <div class="data-card" style="padding: 1rem; text-align: center;">
+                <div style="font-size: 2rem; margin-bottom: 0.5rem;">{cert['icon']}</div>
+                <strong style="color: {TEXT}; font-size: 0.95rem;">{cert['name']}</strong><br>
+                <small style="color: {TEXT_LIGHT}; font-size: 0.85rem;">{cert['org']} • {cert['year']}</small>
+            </div>
+            """
+
+
+def philosophy_card_html() -> str:
+    """Card 'Filosofia de Aprendizado'"""
+    return f"""
+    <div class="data-card">
+        <p style="font-size: 16px; line-height: 1.8; color: {TEXT}; text-align: center; font-style: italic;">
+            “Vejo o lifelong learning como um modo de viver:
+            aprender continuamente é o que me move e sustenta meu propósito.
+            Busco evoluir como profissional e como pessoa, unindo curiosidade, conhecimento aplicado e impacto real em cada projeto que abraço.”
+        </p>
+    </div>
+    """
+
+
+def footer_html(profile: dict) -> str:
+    """Rodapé da página"""
+    return f"""
+<div style="text-align: center; color: {TEXT_LIGHT}; font-size: 14px; padding: 2rem 0;">
+    <strong style="color: {TEXT}; font-size: 1.1rem;">{profile['name']}</strong><br>
+    <p style="margin: 1rem 0; font-size: 0.95rem;">Data Analyst | Data Science | Marketing | Analytics</p>
+    <p style="margin: 0.5rem 0;">📍 {profile['location']} • ✉️ {profile['email']}</p>
+    <div style="margin-top: 1.5rem; display: flex; justify-content: center; gap: 2rem; flex-wrap: wrap;">
+        <a href="{profile['linkedin']}" style="color: {PRIMARY}; text-decoration: none; font-weight: 600; transition: all 0.3s ease;">
+            LinkedIn
+        </a>
+        <a href="{profile['github']}" style="color: {PRIMARY}; text-decoration: none; font-weight: 600; transition: all 0.3s ease;">
+            GitHub
+        </a>
+        <a href="{profile['site']}" style="color: {PRIMARY}; text-decoration: none; font-weight: 600; transition: all 0.3s ease;">
+            Website
+        </a>
+        <a href="{profile['instagram']}" style="color: {ACCENT}; text-decoration: none; font-weight: 600; transition: all 0.3s ease;">
+            Instagram
+        </a>
+    </div>
+    <p style="margin-top: 2rem; font-size: 0.85rem; color: {TEXT_LIGHT};">
+        © 2025 {profile['name']} • Desenvolvido com Streamlit & Python
+    </p>
+</div>
+"""
+
+
+# --- BLOCOS EM LOTE (uma lista inteira em um único fragmento)
+def compact_html(fragments) -> str:
+    """Junta fragmentos em um único bloco HTML, sem recuos nem linhas em branco (que o Markdown trataria como código)"""
+    return "\n".join(line.strip() for fragment in fragments for line in fragment.splitlines() if line.strip())
+
+
+def _inline_markdown(text: str) -> str:
+    """Converte marcações Markdown inline (negrito, itálico e links) em HTML"""
+    text = html.escape(text, quote=False)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    text = re.sub(r"(?<![\w])_(.+?)_(?![\w])", r"<em>\1</em>", text)
+    return re.sub(r"\[(.+?)\]\((\S+?)\)", r'<a href="\2" target="_blank">\1</a>', text)
+
+
+def markdown_html(text: str) -> str:
+    """Converte o subconjunto de Markdown usado nos dados (negrito, itálico, listas e links)"""
+    blocks = []
+    for block in re.split(r"\n\s*\n", text.strip()):
+        lines = [line.strip() for line in block.splitlines() if line.strip()]
+        if lines and all(line.startswith("- ") for line in lines):
+            blocks.append("<ul>" + "".join(f"<li>{_inline_markdown(line[2:])}</li>" for line in lines) + "</ul>")
+        else:
+            blocks.append(f"<p>{_inline_markdown(' '.join(lines))}</p>")
+    return "".join(blocks)
+
+
+def columns_html(parts: list, ratios=None) -> str:
+    """Colunas em grid CSS (equivalente a st.columns dentro de um fragmento)"""
+    ratios = ratios or [1] * len(parts)
+    template = " ".join(f"{ratio}fr" for ratio in ratios)
+    cells = "".join(f"<div>{part}</div>" for part in parts)
+    return f'<div class="data-cols" style="grid-template-columns: {template};">{cells}</div>'
+
+
+def grid_html(cards: list, columns=2) -> str:
+    """Distribui os cards em colunas alternadas, como o laço com cols[idx % 2]"""
+    return columns_html(["".join(cards[i::columns]) for i in range(columns)])
+
+
+def expander_html(title: str, body: str, expanded=False) -> str:
+    """Bloco expansível em <details> (equivalente a st.expander dentro de um fragmento)"""
+    return f'<details class="stExpander"{" open" if expanded else ""}><summary>{title}</summary>{body}</details>'
+
+
+def chart_image_html(url: str, alt: str) -> str:
+    """Gráfico como imagem estática pré-renderizada (perfil mobile e fallback da exportação)"""
+    return f'<img class="chart-img" src="{url}" alt="{html.escape(alt)}" loading="lazy" decoding="async">'
+
+
+def metric_html(label: str, value: str, delta=None) -> str:
+    """Métrica com rótulo, valor e variação (equivalente a st.metric: sem delta se None, seta pelo sinal)"""
+    down = bool(delta) and delta.startswith("-")
+    delta_html = f'<span class="delta{" down" if down else ""}">{"↓" if down else "↑"} {html.escape(delta)}</span>' if delta else ""
+    return f'<div class="stMetric"><small>{html.escape(label)}</small><b>{html.escape(value)}</b>{delta_html}</div>'
+
+
+def experience_card_title(exp: dict) -> str:
+    """Título do card de experiência em markdown (rótulo do botão que abre o corpo no app)"""
+    return f"**{exp['company']}** - {exp['role']}"
+
+
+def experience_card_body(exp: dict) -> str:
+    """Corpo do card de experiência: período, local, realizações e habilidades"""
+    details = (
+        f"<p><strong>Período:</strong> {exp['start']} - {exp['end'] if exp['end'] else 'Atual'}</p>"
+        f"<p><strong>Localização:</strong> {exp['city']}</p>"
+        "<p><strong>Principais Realizações:</strong></p>"
+        + "".join(f"<p>• {achievement}</p>" for achievement in exp["achievements"])
+    )
+    skills = "<p><strong>Habilidades:</strong></p>" + "".join(badge_html(skill, block=True) for skill in exp["skills"])
+    return columns_html([details, skills], [3, 1])
+
+
+def experience_card_html(exp: dict) -> str:
+    """Card expansível de experiência com o corpo já montado (exportação estática)"""
+    return expander_html(f"<strong>{exp['company']}</strong> - {exp['role']}", experience_card_body(exp))
+
+
+def project_card_title(project: dict) -> str:
+    """Título do card de projeto em markdown (rótulo do botão que abre o corpo no app)"""
+    return f"📊 {project['title']}"
+
+
+def project_card_body(project: dict, ratios=(3, 1)) -> str:
+    """Corpo do card de projeto: descrição, métricas, tecnologias e link"""
+    details = markdown_html(f"**Descrição:** {project['summary']}")
+    if project.get("metrics"):
+        details += "<p><strong>Resultados Mensuráveis:</strong></p>" + columns_html([
+            metric_html(metric.replace("_", " "), str(value)) for metric, value in project["metrics"].items()
+        ])
+    tags = "<p><strong>Tecnologias:</strong></p>" + "".join(badge_html(tag, block=True) for tag in project["tags"])
+    body = columns_html([details, tags], list(ratios))
+    if project.get("link"):
+        body += f'<p><a href="{project["link"]}" target="_blank">🔗 Ver projeto detalhado</a></p>'
+    return body
+
+
+def project_card_html(project: dict, expanded=False, ratios=(3, 1)) -> str:
+    """Card expansível de projeto com o corpo já montado (exportação estática)"""
+    return expander_html(f"📊 {project['title']}", project_card_body(project, ratios), expanded)
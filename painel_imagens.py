@@ -0,0 +1,129 @@
+"""Pipeline de imagens estáticas do painel.
+
+Gera, a partir de `profile.jpg`, versões quadradas 1x/2x/3x da foto de perfil
+em WebP e JPEG (e AVIF quando o Pillow instalado tiver o codec) dentro de
+`static/img/`, além de um placeholder borrado minúsculo para ser embutido no
+HTML. As URLs levam `?v=<hash>` do conteúdo: o servidor estático do Streamlit
+responde com Cache-Control de longa duração para requisições versionadas.
+
+Uso:
+    python painel_imagens.py
+"""
+import base64
+import hashlib
+import io
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+STATIC_DIR = ROOT / "static"
+IMG_DIR = STATIC_DIR / "img"
+PROFILE_SOURCE = ROOT / "profile.jpg"
+PROFILE_MANIFEST = IMG_DIR / "profile.json"
+
+# URL base dos arquivos servidos com server.enableStaticServing
+STATIC_URL = "app/static"
+
+PROFILE_DISPLAY_SIZE = 150
+PROFILE_DENSITIES = (1, 2, 3)
+PLACEHOLDER_SIZE = 16
+
+# Formatos em ordem de preferência do navegador; o último é o fallback do <img>
+IMAGE_FORMATS = (
+    ("avif", "AVIF", "image/avif", {"quality": 55}),
+    ("webp", "WEBP", "image/webp", {"quality": 80, "method": 6}),
+    ("jpg", "JPEG", "image/jpeg", {"quality": 82, "optimize": True, "progressive": True}),
+)
+
+
+def _supported_formats() -> list:
+    """Filtra os formatos cujo encoder está disponível no Pillow instalado"""
+    from PIL import features
+
+    supported = set(features.get_supported_modules()) | set(features.get_supported_codecs())
+    return [image_format for image_format in IMAGE_FORMATS if image_format[0] in supported]
+
+
+def _square_crop(image):
+    """Recorta a imagem no maior quadrado centralizado"""
+    width, height = image.size
+    side = min(width, height)
+    left = (width - side) // 2
+    top = (height - side) // 2
+    return image.crop((left, top, left + side, top + side))
+
+
+def build_placeholder(image) -> str:
+    """Gera um data URI JPEG minúsculo e borrado para o primeiro paint"""
+    from PIL import ImageFilter
+
+    thumb = image.resize((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE)).filter(ImageFilter.GaussianBlur(1))
+    buffer = io.BytesIO()
+    thumb.save(buffer, "JPEG", quality=40, optimize=True)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def build_profile_images(source=PROFILE_SOURCE, out_dir=IMG_DIR) -> dict:
+    """Gera as variantes redimensionadas da foto de perfil e grava o manifesto"""
+    from PIL import Image
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    with Image.open(source) as original:
+        square = _square_crop(original.convert("RGB"))
+
+    manifest = {
+        "size": PROFILE_DISPLAY_SIZE,
+        "placeholder": build_placeholder(square),
+        "sources": [],
+    }
+    for ext, pil_format, mime, options in _supported_formats():
+        srcset = []
+        for density in PROFILE_DENSITIES:
+            side = PROFILE_DISPLAY_SIZE * density
+            buffer = io.BytesIO()
+            square.resize((side, side), Image.LANCZOS).save(buffer, pil_format, **options)
+            content = buffer.getvalue()
+
+            filename = f"profile-{side}.{ext}"
+            (out_dir / filename).write_bytes(content)
+            version = hashlib.sha256(content).hexdigest()[:12]
+            srcset.append({"url": f"{STATIC_URL}/img/{filename}?v={version}", "density": density})
+        manifest["sources"].append({"type": mime, "srcset": srcset})
+
+    (out_dir / PROFILE_MANIFEST.name).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+def load_profile_manifest(path=PROFILE_MANIFEST):
+    """Lê o manifesto gerado por build_profile_images (None se ainda não gerado)"""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+def profile_picture_html(manifest: dict, alt: str, style: str) -> str:
+    """Monta o <picture> responsivo com placeholder borrado embutido"""
+    def srcset(source):
+        return ", ".join(f"{item['url']} {item['density']}x" for item in source["srcset"])
+
+    *alternatives, fallback = manifest["sources"]
+    size = manifest["size"]
+    sources_html = "".join(
+        f'<source type="{source["type"]}" srcset="{srcset(source)}">' for source in alternatives
+    )
+    return (
+        f"<picture>{sources_html}"
+        f'<img src="{fallback["srcset"][0]["url"]}" srcset="{srcset(fallback)}" '
+        f'width="{size}" height="{size}" alt="{alt}" decoding="async" fetchpriority="high" '
+        f'style="{style} background: url({manifest["placeholder"]}) center / cover no-repeat;">'
+        f"</picture>"
+    )
+
+
+if __name__ == "__main__":
+    result = build_profile_images()
+    formats = ", ".join(source["type"] for source in result["sources"])
+    print(f"Imagens de perfil geradas em {IMG_DIR} ({formats})")
@@ -0,0 +1,118 @@
+"""Índice invertido do conteúdo do painel.
+
+Construído uma vez por versão dos dados sobre tags, habilidades, empresas,
+cargos, títulos e textos de projetos, experiências e formação. Responde a
+buscas por termos (com prefixo, sem acento e sem diferenciar maiúsculas) e a
+filtros exatos por valor de campo, usados também pelos contadores de KPI.
+"""
+import bisect
+import re
+import threading
+import unicodedata
+
+# Campos indexados por tipo de item
+INDEX_FIELDS = {
+    "experiences": ("company", "role", "city", "achievements", "skills"),
+    "projects": ("title", "summary", "tags"),
+    "education": ("title", "org"),
+}
+
+# Campos com valores exatos (tags, habilidades, empresas...) para filtros e contagens
+FACET_FIELDS = {
+    "experiences": ("company", "role", "skills"),
+    "projects": ("tags",),
+    "education": ("org",),
+}
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+_last = (None, None)
+_last_lock = threading.Lock()
+
+
+def normalize(text: str) -> str:
+    """Minúsculas e sem acentos"""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> list:
+    """Quebra o texto normalizado em palavras"""
+    return TOKEN_PATTERN.findall(normalize(text))
+
+
+def _field_values(item: dict, field: str) -> list:
+    """Valores de texto de um campo (string ou lista de strings)"""
+    value = item.get(field) or []
+    return value if isinstance(value, list) else [str(value)]
+
+
+class SearchIndex:
+    """Índice invertido: palavra -> itens e (campo, valor) -> itens, por tipo"""
+
+    def __init__(self, data: dict):
+        self.postings = {}
+        self.facets = {}
+        for kind, fields in INDEX_FIELDS.items():
+            postings = {}
+            for i, item in enumerate(data[kind]):
+                for field in fields:
+                    for value in _field_values(item, field):
+                        for token in tokenize(value):
+                            postings.setdefault(token, set()).add(i)
+            self.postings[kind] = postings
+            self.facets[kind] = {
+                (field, normalize(value)): ids
+                for field in FACET_FIELDS[kind]
+                for value, ids in self._facet(data[kind], field).items()
+            }
+        self.vocabulary = {kind: sorted(postings) for kind, postings in self.postings.items()}
+
+    @staticmethod
+    def _facet(items: list, field: str) -> dict:
+        """Valor exato do campo -> índices dos itens"""
+        facet = {}
+        for i, item in enumerate(items):
+            for value in _field_values(item, field):
+                facet.setdefault(value, set()).add(i)
+        return facet
+
+    def _prefix_matches(self, kind: str, term: str) -> set:
+        """Itens com alguma palavra que começa com o termo"""
+        vocabulary = self.vocabulary[kind]
+        matches = set()
+        start = bisect.bisect_left(vocabulary, term)
+        for token in vocabulary[start:]:
+            if not token.startswith(term):
+                break
+            matches |= self.postings[kind][token]
+        return matches
+
+    def search(self, kind: str, query: str):
+        """Índices (ordenados) dos itens que contêm todos os termos da busca; None se a busca é vazia"""
+        terms = tokenize(query)
+        if not terms:
+            return None
+        result = None
+        for term in sorted(terms, key=len, reverse=True):
+            matches = self._prefix_matches(kind, term)
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+        return sorted(result)
+
+    def with_any(self, kind: str, field: str, values) -> set:
+        """Índices dos itens cujo campo tem algum dos valores exatos"""
+        ids = set()
+        for value in values:
+            ids |= self.facets[kind].get((field, normalize(value)), set())
+        return ids
+
+
+def get_index(data: dict) -> SearchIndex:
+    """Índice dos dados, reconstruído apenas quando load_data devolve um novo documento"""
+    global _last
+    with _last_lock:
+        if _last[0] is not data:
+            _last = (data, SearchIndex(data))
+        return _last[1]
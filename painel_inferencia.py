@@ -0,0 +1,218 @@
+"""Serviço de inferência com micro-batching para os modelos dos projetos.
+
+Cada requisição pontua um registro, mas o custo de uma chamada ao modelo
+(montar a matriz, percorrer as árvores) quase não muda entre 1 e algumas
+centenas de linhas. O MicroBatcher acumula os registros que chegam dentro de
+uma janela curta (PAINEL_BATCH_WAIT_MS, padrão 2 ms) ou até MAX_BATCH
+registros, pontua o lote em uma única chamada (uma matriz NumPy) e devolve a
+cada requisição o seu resultado por um Future. Os lotes são executados em um
+pool de threads (o predict do scikit-learn e do XGBoost libera o GIL), então
+lotes consecutivos se sobrepõem.
+
+A API é a mesma em processo (painel: um batcher compartilhado por todas as
+sessões) e por HTTP (serve):
+    POST /predict  {"instances": [{...}, ...]} -> {"scores": [...]}
+    GET  /health   modelo, métricas e contadores do batcher
+
+Uso:
+    python painel_inferencia.py [--port 8601] [--max-wait-ms 2] [--max-batch 256]
+"""
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+INFERENCE_PORT = int(os.environ.get("PAINEL_INFERENCE_PORT", "8601"))
+MAX_WAIT_MS = float(os.environ.get("PAINEL_BATCH_WAIT_MS", "2"))
+# Espera máxima de quem chama predict (s): um lote travado não prende a sessão ou a conexão para sempre
+PREDICT_TIMEOUT = float(os.environ.get("PAINEL_PREDICT_TIMEOUT_S", "5"))
+MAX_BATCH = 256
+WORKERS = min(8, os.cpu_count() or 1)
+
+_CLOSE = object()
+
+
+class MicroBatcher:
+    """Agrupa registros enviados por várias threads e os pontua em lotes com predict(lista) -> scores"""
+
+    def __init__(self, predict, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS, workers=WORKERS):
+        self.predict_batch = predict
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue = queue.SimpleQueue()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="painel-inferencia")
+        self._stats_lock = threading.Lock()
+        self._close_lock = threading.Lock()
+        self._closed = False
+        self.batches = 0
+        self.rows = 0
+        self._collector = threading.Thread(target=self._collect, name="painel-batcher", daemon=True)
+        self._collector.start()
+
+    def submit(self, record) -> Future:
+        """Enfileira um registro e retorna o Future do seu score (RuntimeError depois de close)"""
+        future = Future()
+        # Sob a trava: nenhum registro entra na fila depois do marcador de fechamento
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher encerrado")
+            self._queue.put((record, future))
+        return future
+
+    def predict(self, records, timeout=None) -> list:
+        """Scores dos registros (bloqueia até o lote de cada um ser pontuado)"""
+        futures = [self.submit(record) for record in records]
+        return [future.result(timeout) for future in futures]
+
+    def _collect(self):
+        """Thread coletora: fecha um lote por tamanho ou pela janela aberta no primeiro registro"""
+        while True:
+            item = self._queue.get()
+            if item is _CLOSE:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            closing = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+            self._pool.submit(self._run, batch)
+            if closing:
+                return
+
+    def _run(self, batch: list):
+        """Executado no pool: pontua o lote e resolve os Futures"""
+        records, futures = zip(*batch)
+        try:
+            scores = self.predict_batch(list(records))
+        except Exception as exc:
+            if len(batch) > 1:
+                # Um registro inválido não derruba as requisições que caíram no mesmo lote
+                for item in batch:
+                    self._run([item])
+                return
+            futures[0].set_exception(exc)
+            return
+        if len(scores) != len(records):
+            # zip truncaria em silêncio e os Futures sem score nunca seriam resolvidos
+            error = ValueError(f"predict retornou {len(scores)} scores para {len(records)} registros")
+            for future in futures:
+                future.set_exception(error)
+            return
+        with self._stats_lock:
+            self.batches += 1
+            self.rows += len(records)
+        for future, score in zip(futures, scores):
+            future.set_result(float(score))
+
+    def stats(self) -> dict:
+        """Lotes pontuados, registros e tamanho médio do lote"""
+        with self._stats_lock:
+            return {"batches": self.batches, "rows": self.rows, "mean_batch": self.rows / self.batches if self.batches else 0.0}
+
+    def close(self):
+        """Pontua o que já está na fila e encerra a coletora e o pool"""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_CLOSE)
+        self._collector.join()
+        self._pool.shutdown()
+
+
+class _InferenceHandler(BaseHTTPRequestHandler):
+    """POST /predict e GET /health sobre o batcher do servidor"""
+
+    def _send_json(self, status: int, value):
+        payload = json.dumps(value).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path != "/health":
+            self.send_error(404)
+            return
+        self._send_json(200, {**self.server.info, **self.server.batcher.stats()})
+
+    def do_POST(self):
+        if self.path != "/predict":
+            self.send_error(404)
+            return
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            instances = body.get("instances") if isinstance(body, dict) else None
+            if not isinstance(instances, list) or not all(isinstance(record, dict) for record in instances):
+                raise TypeError('corpo esperado: {"instances": [{...}, ...]}')
+        except (ValueError, TypeError) as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+        try:
+            scores = self.server.batcher.predict(instances, PREDICT_TIMEOUT)
+        except TimeoutError:
+            self._send_json(504, {"error": f"sem resposta do modelo em {PREDICT_TIMEOUT:g} s"})
+            return
+        except Exception as exc:
+            self._send_json(422, {"error": str(exc)})
+            return
+        self._send_json(200, {"scores": scores})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class InferenceServer(ThreadingHTTPServer):
+    """Servidor HTTP (uma thread por conexão) que encaminha as instâncias ao batcher"""
+
+    daemon_threads = True
+    # Fila de conexões do socket: com o padrão (5), rajadas de clientes concorrentes são recusadas
+    request_queue_size = 256
+
+    def __init__(self, address, batcher: MicroBatcher, info=None):
+        super().__init__(address, _InferenceHandler)
+        self.batcher = batcher
+        self.info = info or {}
+
+
+def serve(model, port=INFERENCE_PORT, host="127.0.0.1", max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS) -> InferenceServer:
+    """Sobe o servidor de inferência do modelo (score_records) em uma thread daemon"""
+    batcher = MicroBatcher(model.score_records, max_batch, max_wait_ms)
+    server = InferenceServer((host, port), batcher, {"model": model.meta, "metrics": model.metrics})
+    threading.Thread(target=server.serve_forever, name="painel-inferencia-http", daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    from painel_waze import MODEL_FILE, load_churn_model
+
+    parser = argparse.ArgumentParser(description="Servidor de inferência do modelo de churn do Waze")
+    parser.add_argument("--port", type=int, default=INFERENCE_PORT)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH)
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    churn_model = load_churn_model()
+    if churn_model is None:
+        parser.exit(1, f"modelo não encontrado em {MODEL_FILE} (python painel_waze.py --train xgboost)\n")
+    server = serve(churn_model, args.port, args.host, args.max_batch, args.max_wait_ms)
+    print(f"Inferência em http://{args.host}:{args.port}/predict")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+        server.batcher.close()
@@ -0,0 +1,265 @@
+"""Ingestão em blocos das bases de RH (turnover) e de telemetria do Waze.
+
+Os notebooks leem o CSV inteiro, copiam o DataFrame e só então removem
+duplicatas, o que multiplica o pico de memória. Aqui o CSV é lido por um
+gerador em blocos de tamanho fixo e cada bloco:
+- recebe tipos explícitos: inteiros estreitos (int8/int16/int32, com checagem
+  de faixa, já que o pandas trunca inteiros fora da faixa sem erro) e
+  categorias fixas (dicionário no Parquet);
+- tem as linhas repetidas removidas contra os blocos anteriores (hash de
+  8 bytes por linha distinta, o único estado que cresce com a base; ver
+  RowDeduplicator sobre colisões);
+- alimenta agregados incrementais (contagem, média, desvio, mínimo e máximo
+  por coluna numérica, frequência por categoria);
+- é gravado como um row group de um arquivo Parquet.
+
+A memória fica limitada ao tamanho do bloco, independente do tamanho do
+arquivo; as análises leem o Parquet de volta em lotes (iter_batches) ou só
+as colunas de que precisam. Exige pyarrow (requirements-ml.txt).
+
+Uso:
+    python painel_ingestao.py hr [--csv base.csv] [--chunksize 100000]
+    python painel_ingestao.py waze [--csv waze_dataset.csv] [--keep-duplicates]
+"""
+import argparse
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from painel_turnover import DATA_FILE as HR_FILE
+
+ROOT = Path(__file__).resolve().parent
+WAZE_FILE = Path(os.environ.get("PAINEL_WAZE_CSV") or ROOT / "data" / "waze_dataset.csv")
+INGEST_DIR = ROOT / "build" / "ingest"
+DEFAULT_CHUNKSIZE = 100_000
+
+# Tipos de cada base: inteiros estreitos, float32 para medidas contínuas e categorias fixas
+DATASETS = {
+    "hr": {
+        "file": HR_FILE,
+        "target": "Attrition",
+        "integers": {
+            "Age": "int8", "DailyRate": "int16", "DistanceFromHome": "int8", "Education": "int8",
+            "EmployeeCount": "int8", "EmployeeNumber": "int32", "EnvironmentSatisfaction": "int8",
+            "HourlyRate": "int16", "JobInvolvement": "int8", "JobLevel": "int8", "JobSatisfaction": "int8",
+            "MonthlyIncome": "int32", "MonthlyRate": "int32", "NumCompaniesWorked": "int8",
+            "PercentSalaryHike": "int8", "PerformanceRating": "int8", "RelationshipSatisfaction": "int8",
+            "StandardHours": "int16", "StockOptionLevel": "int8", "TotalWorkingYears": "int8",
+            "TrainingTimesLastYear": "int8", "WorkLifeBalance": "int8", "YearsAtCompany": "int8",
+            "YearsInCurrentRole": "int8", "YearsSinceLastPromotion": "int8", "YearsWithCurrManager": "int8",
+        },
+        "floats": {},
+        "categories": {
+            "Attrition": ["No", "Yes"],
+            "BusinessTravel": ["Non-Travel", "Travel_Frequently", "Travel_Rarely"],
+            "Department": ["Human Resources", "Research & Development", "Sales"],
+            "EducationField": ["Human Resources", "Life Sciences", "Marketing", "Medical", "Other", "Technical Degree"],
+            "Gender": ["Female", "Male"],
+            "JobRole": [
+                "Healthcare Representative", "Human Resources", "Laboratory Technician", "Manager",
+                "Manufacturing Director", "Research Director", "Research Scientist", "Sales Executive",
+                "Sales Representative",
+            ],
+            "MaritalStatus": ["Divorced", "Married", "Single"],
+            "Over18": ["Y"],
+            "OverTime": ["No", "Yes"],
+        },
+    },
+    "waze": {
+        "file": WAZE_FILE,
+        "target": "label",
+        "integers": {
+            "ID": "int32", "sessions": "int16", "drives": "int16", "n_days_after_onboarding": "int16",
+            "total_navigations_fav1": "int16", "total_navigations_fav2": "int16", "activity_days": "int8",
+            "driving_days": "int8",
+        },
+        "floats": {"total_sessions": "float32", "driven_km_drives": "float32", "duration_minutes_drives": "float32"},
+        "categories": {"label": ["churned", "retained"], "device": ["Android", "iPhone"]},
+    },
+}
+
+
+def read_chunks(path, dataset: str, chunksize=DEFAULT_CHUNKSIZE):
+    """Gera os blocos do CSV já com os tipos da base (um bloco em memória por vez)"""
+    import pandas as pd
+
+    spec = DATASETS[dataset]
+    # Inteiros lidos como int64 e estreitados com checagem; categorias como texto e validadas
+    dtypes = {**dict.fromkeys(spec["integers"], "int64"), **spec["floats"], **dict.fromkeys(spec["categories"], "object")}
+    reader = pd.read_csv(path, dtype=dtypes, chunksize=chunksize)
+    for number, chunk in enumerate(reader):
+        yield _apply_types(chunk, spec, f"{path} (bloco {number})")
+
+
+def _apply_types(chunk, spec: dict, where: str):
+    """Estreita os inteiros e converte as categorias, com erro em vez de truncar ou perder valores"""
+    import numpy as np
+    import pandas as pd
+
+    for column, dtype in spec["integers"].items():
+        values = chunk[column]
+        limits = np.iinfo(dtype)
+        if len(values) and (values.min() < limits.min or values.max() > limits.max):
+            raise ValueError(f"{where}: {column} fora da faixa de {dtype} ({values.min()}..{values.max()})")
+        chunk[column] = values.astype(dtype)
+    for column, categories in spec["categories"].items():
+        values = pd.Categorical(chunk[column], categories=categories)
+        unknown = chunk[column].notna() & (values.codes == -1)
+        if unknown.any():
+            raise ValueError(f"{where}: categoria desconhecida em {column}: {sorted(set(chunk[column][unknown]))[:5]}")
+        chunk[column] = values
+    return chunk
+
+
+class RowDeduplicator:
+    """Remove linhas já vistas em blocos anteriores (hash de 8 bytes por linha distinta, ordenado).
+
+    Duas linhas diferentes com o mesmo hash de 64 bits seriam tratadas como
+    duplicatas e a segunda seria descartada. A chance de alguma colisão entre
+    n linhas distintas é de no máximo n² / 2⁶⁵ (~3e-4 para 10⁸ linhas); o
+    resumo da ingestão registra esse limite (hash_collision_bound), e
+    --keep-duplicates desliga a remoção.
+    """
+
+    def __init__(self):
+        import numpy as np
+
+        self.seen = np.empty(0, dtype=np.uint64)
+
+    def __call__(self, chunk):
+        import numpy as np
+        import pandas as pd
+
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        # Hashes distintos do bloco (ordenados) e a primeira linha de cada um
+        unique, first = np.unique(hashes, return_index=True)
+        position = np.searchsorted(self.seen, unique)
+        repeated = np.zeros(len(unique), dtype=bool)
+        inside = position < len(self.seen)
+        repeated[inside] = self.seen[position[inside]] == unique[inside]
+        keep = np.zeros(len(hashes), dtype=bool)
+        keep[first[~repeated]] = True
+        # Intercalação dos novos hashes (já ordenados) no conjunto visto: cópia linear, sem reordenar tudo
+        self.seen = np.insert(self.seen, position[~repeated], unique[~repeated])
+        return chunk[keep]
+
+    def collision_bound(self) -> float:
+        """Limite superior da probabilidade de uma colisão de hash entre as linhas distintas vistas"""
+        return len(self.seen) ** 2 / 2 ** 65
+
+
+class RunningStats:
+    """Agregados incrementais por coluna: numéricas (contagem, média, M2, extremos) e frequência das categorias"""
+
+    def __init__(self):
+        self.rows = 0
+        self.numeric = {}
+        self.counts = {}
+
+    def update(self, chunk):
+        """Acumula um bloco (média e variância combinadas por blocos, estáveis numericamente)"""
+        self.rows += len(chunk)
+        for column in chunk.columns:
+            values = chunk[column]
+            if values.dtype.kind not in "biuf":
+                counts = self.counts.setdefault(column, {})
+                for value, count in values.value_counts(dropna=False).items():
+                    key = "null" if value != value else str(value)
+                    counts[key] = counts.get(key, 0) + int(count)
+                continue
+            values = values.dropna().astype("float64")
+            stats = self.numeric.setdefault(column, {"count": 0, "mean": 0.0, "m2": 0.0, "min": None, "max": None})
+            if values.empty:
+                continue
+            count, mean = len(values), float(values.mean())
+            total = stats["count"] + count
+            delta = mean - stats["mean"]
+            stats["m2"] += float(((values - mean) ** 2).sum()) + delta * delta * stats["count"] * count / total
+            stats["mean"] += delta * count / total
+            stats["count"] = total
+            low, high = float(values.min()), float(values.max())
+            stats["min"] = low if stats["min"] is None else min(stats["min"], low)
+            stats["max"] = high if stats["max"] is None else max(stats["max"], high)
+
+    def summary(self) -> dict:
+        """Média, desvio padrão amostral, extremos e nulos por coluna numérica; frequências por categoria"""
+        numeric = {
+            column: {
+                "count": stats["count"], "nulls": self.rows - stats["count"],
+                "mean": stats["mean"] if stats["count"] else None,
+                "std": (stats["m2"] / (stats["count"] - 1)) ** 0.5 if stats["count"] > 1 else None,
+                "min": stats["min"], "max": stats["max"],
+            }
+            for column, stats in self.numeric.items()
+        }
+        return {"rows": self.rows, "numeric": numeric, "categories": self.counts}
+
+
+def ingest(dataset: str, path=None, out_dir=INGEST_DIR, chunksize=DEFAULT_CHUNKSIZE, dedupe=True) -> dict:
+    """Converte o CSV da base em Parquet bloco a bloco e grava o resumo incremental ao lado"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path or DATASETS[dataset]["file"])
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    target = out_dir / f"{dataset}.parquet"
+
+    stats, deduplicate = RunningStats(), RowDeduplicator() if dedupe else None
+    read = duplicates = 0
+    fd, tmp = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+    os.close(fd)
+    writer = None
+    try:
+        for chunk in read_chunks(path, dataset, chunksize):
+            read += len(chunk)
+            if deduplicate is not None:
+                kept = deduplicate(chunk)
+                duplicates += len(chunk) - len(kept)
+                chunk = kept
+            stats.update(chunk)
+            if chunk.empty and writer is not None:
+                continue
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp, table.schema)
+            writer.write_table(table)
+        if writer is None:
+            raise ValueError(f"{path}: arquivo sem linhas")
+        writer.close()
+        os.replace(tmp, target)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        os.unlink(tmp)
+        raise
+
+    summary = {"dataset": dataset, "source": str(path), "target": DATASETS[dataset]["target"], "rows_read": read, "duplicates": duplicates}
+    if deduplicate is not None:
+        summary["hash_collision_bound"] = deduplicate.collision_bound()
+    summary.update(stats.summary())
+    (out_dir / f"{dataset}.summary.json").write_text(json.dumps(summary, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    summary["parquet"] = str(target)
+    return summary
+
+
+def iter_batches(path, columns=None, batch_size=DEFAULT_CHUNKSIZE):
+    """Lê um Parquet da ingestão de volta em DataFrames de até batch_size linhas"""
+    import pyarrow.parquet as pq
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=columns):
+        yield batch.to_pandas()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingestão em blocos das bases de RH e Waze para Parquet")
+    parser.add_argument("dataset", choices=sorted(DATASETS))
+    parser.add_argument("--csv", help="CSV de entrada (padrão: o caminho configurado da base)")
+    parser.add_argument("--out", default=str(INGEST_DIR))
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--keep-duplicates", action="store_true", help="não remove linhas repetidas")
+    args = parser.parse_args()
+
+    result = ingest(args.dataset, args.csv, args.out, args.chunksize, dedupe=not args.keep_duplicates)
+    print(f"{result['rows']} linhas em {result['parquet']} ({result['duplicates']} duplicadas removidas)")
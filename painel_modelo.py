@@ -0,0 +1,280 @@
+"""Dados derivados do painel: experiências, KPIs e conjuntos de habilidades.
+
+Funções puras (sem Streamlit), compartilhadas pelo app e pela exportação
+estática. numpy e pandas são importados apenas pelas funções que montam
+tabelas, para que o resumo de carreira e os KPIs não os carreguem.
+"""
+import math
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
+from dateutil.relativedelta import relativedelta
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Habilidades e anos exibidos no gráfico de evolução
+EVOLUTION_SKILLS = ["Python", "Power BI", "SQL", "Machine Learning", "Data Storytelling"]
+EVOLUTION_YEARS = [2019, 2021, 2023, 2024, 2025]
+
+# Habilidades destacadas nas métricas da aba Competências e ano base do delta
+HIGHLIGHT_SKILLS = ["Python", "Power BI", "Machine Learning"]
+HIGHLIGHT_BASE_YEAR = 2019
+
+# Exibido no lugar de valores que não podem ser calculados (sem registro ou base zero)
+MISSING_VALUE = "—"
+
+# Tags que caracterizam um projeto de dados
+DATA_TAGS = ["Python", "SQL", "Machine Learning", "Data", "Analytics", "EDA", "XGBoost", "Scikit-learn"]
+
+
+def ym_to_date(ym: str) -> datetime:
+    """Converte string YYYY-MM para datetime"""
+    return datetime.strptime(f"{ym}-01", "%Y-%m-%d")
+
+
+def format_duration(rd: relativedelta) -> str:
+    """Formata relativedelta em string legível"""
+    years, months = rd.years, rd.months
+    parts = []
+    if years:
+        parts.append(f"{years} ano{'s' if years > 1 else ''}")
+    if months:
+        parts.append(f"{months} mes{'es' if months > 1 else ''}")
+    return " e ".join(parts) if parts else "0 meses"
+
+
+def experience_rows(experiences, today=None) -> list:
+    """Datas, duração e textos de cada experiência (linhas da timeline, sem pandas)"""
+    rows = []
+    today = today or datetime.today()
+
+    for exp in experiences:
+        start = ym_to_date(exp["start"])
+        end = ym_to_date(exp["end"]) if exp["end"] else today
+        duration = relativedelta(end, start)
+
+        rows.append({
+            "Empresa": exp["company"],
+            "Cargo": exp["role"],
+            "Início": start,
+            "Fim": end,
+            "Cidade": exp.get("city", ""),
+            "Duração": duration,
+            "Duracao_str": format_duration(duration),
+            "Desc": " • ".join(exp.get("achievements", []))
+        })
+    return rows
+
+
+def build_experience_df(experiences, today=None):
+    """Constrói DataFrame de experiências profissionais"""
+    import pandas as pd
+
+    return pd.DataFrame(experience_rows(experiences, today)).sort_values("Início", ascending=False)
+
+
+def round_experience_years(total_duration: relativedelta) -> int:
+    """Arredonda uma duração para anos completos (6+ meses contam como 1 ano)"""
+    return total_duration.years + (1 if total_duration.months >= 6 else 0)
+
+
+def count_unique_companies(experiences):
+    """Conta o número de empresas únicas"""
+    return len(set(exp["company"] for exp in experiences))
+
+
+def compute_career_model(experiences, today: date) -> dict:
+    """Modelo de carreira na data de referência: datas, durações e textos de cada experiência e KPIs (sem pandas)"""
+    today_dt = datetime.combine(today, datetime.min.time())
+    rows = experience_rows(experiences, today_dt)
+    earliest_start = min((row["Início"] for row in rows), default=None)
+
+    return {
+        "today": today,
+        "experiences": rows,
+        "earliest_start": earliest_start,
+        "total_years": round_experience_years(relativedelta(today_dt, earliest_start)) if earliest_start else 0,
+        "num_companies": count_unique_companies(experiences),
+    }
+
+
+def build_career_frame(career: dict):
+    """DataFrame da timeline a partir das linhas do modelo de carreira (sem recalcular datas)"""
+    import pandas as pd
+
+    return pd.DataFrame(career["experiences"]).sort_values("Início", ascending=False)
+
+
+def count_data_projects(index) -> int:
+    """Conta projetos relacionados a dados (alguma tag de DATA_TAGS, pelo índice)"""
+    return len(index.with_any("projects", "tags", DATA_TAGS))
+
+
+def count_certifications(index, education: list) -> int:
+    """Conta certificações (formações com 'Certificate' no título; o índice só pré-seleciona os candidatos)"""
+    # A busca do índice cobre título e instituição sem diferenciar maiúsculas: o critério original filtra
+    candidates = index.search("education", "Certificate") or []
+    return sum(1 for i in candidates if "Certificate" in education[i].get("title", ""))
+
+
+def build_kpis(data: dict, career: dict, index) -> list:
+    """Lista os KPIs do topo do painel como (rótulo, valor, tendência, destaque)"""
+    num_certifications = count_certifications(index, data["education"])
+    return [
+        ("Experiência", f"{career['total_years']}+ anos", None, True),
+        ("Projetos Data", f"{count_data_projects(index)}+", None, False),
+        ("Certificações", f"{num_certifications}", num_certifications, False),
+        ("Idiomas", f"{len(data['languages'])}", None, False),
+    ]
+
+
+def build_skill_sets(skills_data: dict) -> tuple:
+    """Deriva de SKILLS_DATA as competências (radar) e as ferramentas (barras)"""
+    skills_core = {
+        "Business Strategy & Growth": 94,
+        "Data Storytelling & Comunicação": skills_data["Data Storytelling"]["current"],
+        "Python (Pandas, Scikit-learn, Plotly)": skills_data["Python"]["current"],
+        "Power BI & Data Visualization": skills_data["Power BI"]["current"],
+        "Estatística Aplicada": 60,
+        "Machine Learning": skills_data["Machine Learning"]["current"],
+        "SQL & Databricks": skills_data["SQL"]["current"],
+        "Project Management (Agile & Cross-functional)": 80,
+        "Marketing Analytics": 88
+    }
+    skills_tools = {
+        "Python": skills_data["Python"]["current"],
+        "SQL": skills_data["SQL"]["current"],
+        "Power BI": skills_data["Power BI"]["current"],
+        "Streamlit": skills_data["Streamlit"]["current"],
+        "AWS": skills_data["AWS"]["current"],
+        "Databricks": skills_data["Databricks"]["current"]
+    }
+    return skills_core, skills_tools
+
+
+def skills_frame(skills_data: dict) -> "pd.DataFrame":
+    """Histórico das habilidades como tabela larga ano × habilidade (NaN nos anos sem registro)"""
+    import pandas as pd
+
+    history = {skill: data["history"] for skill, data in skills_data.items()}
+    return pd.DataFrame.from_dict(history, orient="index", dtype=float).T.sort_index()
+
+
+def _interpolate_inside(frame: "pd.DataFrame") -> "pd.DataFrame":
+    """Interpolação linear pelos anos entre registros de cada coluna, todas as colunas de uma vez"""
+    import numpy as np
+    import pandas as pd
+
+    years = frame.index.to_numpy(dtype=float)
+    values = frame.to_numpy()
+    observed = ~np.isnan(values)
+    rows = np.arange(len(years))[:, None]
+
+    # Último e próximo registro observado de cada célula (-1 / n quando não há)
+    previous = np.maximum.accumulate(np.where(observed, rows, -1), axis=0)
+    following = np.minimum.accumulate(np.where(observed, rows, len(years))[::-1], axis=0)[::-1]
+    inside = (previous >= 0) & (following < len(years))
+
+    prev_idx, next_idx = np.clip(previous, 0, None), np.clip(following, None, len(years) - 1)
+    columns = np.arange(values.shape[1])
+    prev_val, next_val = values[prev_idx, columns], values[next_idx, columns]
+    span = years[next_idx] - years[prev_idx]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = np.where(span > 0, (years[:, None] - years[prev_idx]) / span, 0.0)
+    filled = np.where(inside, prev_val + (next_val - prev_val) * weight, np.nan)
+    return pd.DataFrame(filled, index=frame.index, columns=frame.columns)
+
+
+def interpolate_years(frame: "pd.DataFrame", years) -> "pd.DataFrame":
+    """Reindexa para os anos pedidos, interpolando linearmente os anos ausentes entre registros"""
+    import pandas as pd
+
+    index = frame.index.union(pd.Index(years))
+    return _interpolate_inside(frame.reindex(index)).loc[list(years)]
+
+
+def growth_rates(frame: "pd.DataFrame") -> "pd.Series":
+    """Crescimento médio anual composto entre o primeiro e o último registro (NaN sem base positiva)"""
+    import numpy as np
+    import pandas as pd
+
+    years = frame.index.to_numpy(dtype=float)
+    values = frame.to_numpy()
+    observed = ~np.isnan(values)
+    first = observed.argmax(axis=0)
+    last = len(years) - 1 - observed[::-1].argmax(axis=0)
+    columns = np.arange(values.shape[1])
+    span = years[last] - years[first]
+    base = values[first, columns]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = (values[last, columns] / base) ** (1 / span) - 1
+    # Primeiro registro zero (ou negativo) não tem taxa composta: seria inf
+    return pd.Series(np.where((span > 0) & (base > 0), rates, np.nan), index=frame.columns)
+
+
+def forecast_skills(frame: "pd.DataFrame", year: int) -> "pd.Series":
+    """Projeção linear (mínimos quadrados) do nível de cada habilidade no ano pedido, limitada a 0-100.
+
+    Cada habilidade é ajustada só nos anos em que foi registrada (mínimos
+    quadrados mascarados, todas as colunas de uma vez): preencher os anos sem
+    registro com valores constantes puxaria as inclinações para zero. Com um
+    único ano registrado a projeção é o próprio valor; sem registros, NaN.
+    """
+    import numpy as np
+    import pandas as pd
+
+    years = frame.index.to_numpy(dtype=float)[:, None]
+    values = frame.to_numpy()
+    observed = ~np.isnan(values)
+    count = observed.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_year = np.where(observed, years, 0).sum(axis=0) / count
+        mean_value = np.where(observed, values, 0).sum(axis=0) / count
+        dx = np.where(observed, years - mean_year, 0)
+        dy = np.where(observed, values - mean_value, 0)
+        variance = (dx * dx).sum(axis=0)
+        slope = np.where(variance > 0, (dx * dy).sum(axis=0) / variance, 0.0)
+    return pd.Series(np.clip(mean_value + slope * (year - mean_year), 0, 100), index=frame.columns)
+
+
+def build_skill_outlook(skills_data: dict, skills=HIGHLIGHT_SKILLS, base_year=HIGHLIGHT_BASE_YEAR) -> "pd.DataFrame":
+    """Nível atual, delta desde o ano base, crescimento anual e projeção do próximo ano, por habilidade"""
+    import pandas as pd
+
+    frame = skills_frame(skills_data)
+    current = pd.Series({skill: data["current"] for skill, data in skills_data.items()}, dtype=float)
+    next_year = int(frame.index.max()) + 1
+    outlook = pd.DataFrame({
+        "current": current,
+        "delta": current - interpolate_years(frame, [base_year]).iloc[0],
+        "growth_rate": growth_rates(frame),
+        "forecast": forecast_skills(frame, next_year),
+    })
+    outlook.attrs["forecast_year"] = next_year
+    return outlook.loc[list(skills)]
+
+
+def build_skill_highlights(skills_data: dict, skills=HIGHLIGHT_SKILLS, base_year=HIGHLIGHT_BASE_YEAR) -> list:
+    """Lista (habilidade, nível atual, delta desde o ano base; NaN sem registro no período) para as métricas de destaque"""
+    outlook = build_skill_outlook(skills_data, skills, base_year)
+    return [
+        (skill, int(row.current), float(row.delta))
+        for skill, row in zip(outlook.index, outlook.itertuples(index=False))
+    ]
+
+
+def skill_delta_label(delta, base_year=HIGHLIGHT_BASE_YEAR):
+    """Rótulo do delta desde o ano base ("+47% desde 2019"); None sem registro no ano base"""
+    if delta is None or not math.isfinite(delta):
+        return None
+    return f"{format_percent(delta, signed=True)} desde {base_year}"
+
+
+def format_percent(value, signed=False, fraction=False) -> str:
+    """Percentual para exibição ("85%", "+47%"); MISSING_VALUE para NaN ou infinito"""
+    if value is None or not math.isfinite(value):
+        return MISSING_VALUE
+    if fraction:
+        value *= 100
+    return f"{value:+.0f}%" if signed else f"{value:.0f}%"
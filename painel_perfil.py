@@ -0,0 +1,224 @@
+"""Instrumentação opcional do painel (PAINEL_PROFILE=1).
+
+Mede o tempo de cada seção do script e de cada construtor de figura, e soma
+os bytes das mensagens enviadas ao navegador em cada seção (em seções
+aninhadas, o tempo inclui o das internas e os bytes contam só na mais
+interna). Os resultados do último rerun alimentam o painel de depuração do
+app. Os agregados do processo ficam disponíveis em JSON e no formato texto
+do Prometheus por um servidor HTTP próprio (PAINEL_METRICS_PORT, padrão 9464).
+
+Com a instrumentação desligada, `profile_section` e `profile_builder`
+devolvem um contexto nulo e não há custo mensurável.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PROFILING = os.environ.get("PAINEL_PROFILE", "0") == "1"
+METRICS_PORT = int(os.environ.get("PAINEL_METRICS_PORT", "9464"))
+METRICS_PREFIX = "painel"
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+# Rerun em andamento na thread do script (cada sessão roda em sua própria thread)
+_local = threading.local()
+
+# Agregados do processo: (tipo, nome) -> {"count", "seconds", "max_seconds", "messages", "bytes"}
+_totals = {}
+_totals_lock = threading.Lock()
+
+# Medidores externos (ex.: contadores do cache): nome -> função que retorna {métrica: valor}
+_gauges = {}
+_server = None
+_server_failed = False
+_server_lock = threading.Lock()
+
+
+def _record(kind: str, name: str, seconds: float, messages=0, size=0):
+    """Acumula uma medição nos agregados do processo"""
+    with _totals_lock:
+        stats = _totals.setdefault((kind, name), {"count": 0, "seconds": 0.0, "max_seconds": 0.0, "messages": 0, "bytes": 0})
+        stats["count"] += 1
+        stats["seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+        stats["messages"] += messages
+        stats["bytes"] += size
+
+
+def _script_context():
+    """Contexto do script Streamlit atual (None fora de um rerun)"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    return get_script_run_ctx(suppress_warning=True)
+
+
+def start_run():
+    """Inicia a medição de um rerun"""
+    if not PROFILING:
+        return
+    _local.run = {"start": time.perf_counter(), "rows": []}
+
+
+@contextlib.contextmanager
+def _timed_section(name: str):
+    """Mede tempo, mensagens e bytes enviados dentro da seção (bytes só na seção mais interna)"""
+    counter = {"messages": 0, "bytes": 0}
+    # Pilha das seções abertas na thread do script: a mais interna recebe as mensagens
+    stack = getattr(_local, "sections", None)
+    if stack is None:
+        stack = _local.sections = []
+    ctx = _script_context() if not stack else None
+    # _enqueue é interno do Streamlit: sem ele, mede só o tempo
+    enqueue = ctx._enqueue if ctx is not None and hasattr(ctx, "_enqueue") else None
+
+    def counting_enqueue(msg):
+        if stack:
+            stack[-1]["messages"] += 1
+            stack[-1]["bytes"] += msg.ByteSize()
+        enqueue(msg)
+
+    # Só a seção mais externa troca o _enqueue; as aninhadas usam a mesma contagem
+    if enqueue is not None:
+        ctx._enqueue = counting_enqueue
+    stack.append(counter)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        stack.pop()
+        if enqueue is not None:
+            ctx._enqueue = enqueue
+        _record("section", name, seconds, counter["messages"], counter["bytes"])
+        run = getattr(_local, "run", None)
+        if run is not None:
+            run["rows"].append({"seção": name, "ms": seconds * 1000, "mensagens": counter["messages"], "bytes": counter["bytes"]})
+
+
+def profile_section(name: str):
+    """Contexto que mede uma seção do script (nulo com a instrumentação desligada)"""
+    return _timed_section(name) if PROFILING else _NULL_CONTEXT
+
+
+@contextlib.contextmanager
+def _timed_builder(name: str):
+    """Mede a execução de um construtor de figura"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record("builder", name, time.perf_counter() - start)
+
+
+def profile_builder(name: str):
+    """Contexto que mede um construtor de figura (executado apenas em cache miss)"""
+    return _timed_builder(name) if PROFILING else _NULL_CONTEXT
+
+
+def finish_run():
+    """Encerra a medição do rerun e retorna as linhas por seção (None se desligada)"""
+    run = getattr(_local, "run", None)
+    if not PROFILING or run is None:
+        return None
+    _local.run = None
+    seconds = time.perf_counter() - run["start"]
+    _record("run", "total", seconds)
+    return run["rows"] + [{"seção": "total", "ms": seconds * 1000, "mensagens": None, "bytes": None}]
+
+
+def register_gauges(name: str, source):
+    """Registra uma fonte de medidores publicada junto com as métricas do processo"""
+    _gauges[name] = source
+
+
+def metrics_snapshot() -> dict:
+    """Agregados do processo em formato serializável"""
+    with _totals_lock:
+        items = sorted(_totals.items())
+        snapshot = {}
+        for (kind, name), stats in items:
+            snapshot.setdefault(kind, {})[name] = dict(stats)
+    return snapshot
+
+
+def gauges_snapshot() -> dict:
+    """Valores atuais dos medidores registrados"""
+    return {name: source() for name, source in sorted(_gauges.items())}
+
+
+def metrics_json() -> str:
+    """Agregados do processo em JSON"""
+    return json.dumps({**metrics_snapshot(), "gauges": gauges_snapshot()}, ensure_ascii=False, indent=2)
+
+
+def _label(value: str) -> str:
+    """Escapa um valor de label do Prometheus"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def metrics_prometheus() -> str:
+    """Agregados do processo no formato texto do Prometheus"""
+    series = [
+        ("seconds_total", "counter", "Tempo acumulado em segundos", "seconds"),
+        ("count_total", "counter", "Número de execuções", "count"),
+        ("max_seconds", "gauge", "Maior duração observada em segundos", "max_seconds"),
+        ("messages_total", "counter", "Mensagens enviadas ao navegador", "messages"),
+        ("bytes_total", "counter", "Bytes enviados ao navegador", "bytes"),
+    ]
+    snapshot = metrics_snapshot()
+    lines = []
+    for suffix, metric_type, help_text, field in series:
+        metric = f"{METRICS_PREFIX}_{suffix}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+        for kind, names in snapshot.items():
+            for name, stats in names.items():
+                lines.append(f'{metric}{{kind="{kind}",name="{_label(name)}"}} {stats[field]}')
+    for name, values in gauges_snapshot().items():
+        for key, value in values.items():
+            metric = f"{METRICS_PREFIX}_{name}_{key}"
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {value}")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serve /metrics (Prometheus) e /metrics.json"""
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            body, content_type = metrics_prometheus(), "text/plain; version=0.0.4; charset=utf-8"
+        elif self.path == "/metrics.json":
+            body, content_type = metrics_json(), "application/json; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+        payload = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port=METRICS_PORT):
+    """Sobe o servidor de métricas em uma thread daemon (uma tentativa por processo)"""
+    global _server, _server_failed
+    if not PROFILING:
+        return None
+    with _server_lock:
+        if _server is None and not _server_failed:
+            try:
+                _server = ThreadingHTTPServer(("127.0.0.1", port), _MetricsHandler)
+            except OSError:
+                # Porta ocupada (ex.: outro worker): não tenta de novo a cada rerun
+                _server_failed = True
+                return None
+            threading.Thread(target=_server.serve_forever, name="painel-metrics", daemon=True).start()
+    return _server
@@ -0,0 +1,150 @@
+"""Serviço de renderização dos gráficos em imagens estáticas.
+
+Converte o JSON das figuras (o mesmo guardado no cache compartilhado) em
+PNG, WebP ou SVG com o renderizador local do Plotly (kaleido, opcional), em
+um pool de processos. As imagens ficam em static/img/charts/, um cache em
+disco endereçado pelo conteúdo: o nome do arquivo é o hash da figura
+serializada + formato + tamanho. Cada figura é renderizada uma vez por versão
+dos dados, o arquivo é compartilhado entre workers e servido como estático
+(URL imutável, Cache-Control de longa duração).
+
+As sessões do app nunca renderizam: cached_url só consulta o disco e, em
+miss, submit agenda a renderização no pool (a sessão usa o gráfico estático
+até a imagem existir). O pré-cálculo renderiza tudo antes do deploy.
+
+Uso:
+    python painel_render.py [--formats png webp svg] [--workers 2] [--prune]
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from painel_figuras import IMAGE_RENDERER_AVAILABLE, MOBILE_IMAGE_WIDTH, figure_image
+from painel_imagens import IMG_DIR, STATIC_DIR, STATIC_URL
+
+# Dentro de static/ para que as imagens sejam servidas pelo Streamlit (server.enableStaticServing)
+RENDER_DIR = IMG_DIR / "charts"
+RENDER_WORKERS = int(os.environ.get("PAINEL_RENDER_WORKERS", "2"))
+FORMATS = ("png", "webp", "svg")
+DEFAULT_SCALE = 2
+
+
+def image_key(spec: dict, fmt: str, width: int, scale=DEFAULT_SCALE) -> str:
+    """Hash SHA-256 da figura serializada e dos parâmetros da imagem"""
+    payload = json.dumps([spec, fmt, width, scale], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _render_to_file(spec: dict, fmt: str, width: int, scale: int, path: str) -> str:
+    """Executado no worker: renderiza a imagem e a grava de forma atômica"""
+    image = figure_image(spec, fmt, width, scale)
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(image)
+    os.replace(tmp, path)
+    return path
+
+
+class RenderService:
+    """Pool de renderização com cache em disco endereçado pelo conteúdo"""
+
+    def __init__(self, directory=RENDER_DIR, workers=RENDER_WORKERS):
+        self.directory = Path(directory)
+        self.workers = workers
+        self._pool = None
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def path(self, spec: dict, fmt: str, width=MOBILE_IMAGE_WIDTH, scale=DEFAULT_SCALE) -> Path:
+        """Arquivo da imagem no cache (existindo ou não)"""
+        return self.directory / f"{image_key(spec, fmt, width, scale)}.{fmt}"
+
+    def cached_url(self, spec: dict, fmt: str, width=MOBILE_IMAGE_WIDTH, scale=DEFAULT_SCALE):
+        """URL estática da imagem já renderizada, ou None; nunca renderiza"""
+        path = self.path(spec, fmt, width, scale)
+        if not path.exists():
+            return None
+        return f"{STATIC_URL}/{path.relative_to(STATIC_DIR).as_posix()}"
+
+    def submit(self, spec: dict, fmt: str, width=MOBILE_IMAGE_WIDTH, scale=DEFAULT_SCALE):
+        """Agenda a renderização no pool (uma vez por imagem); None se já está no disco ou sem renderizador"""
+        path = self.path(spec, fmt, width, scale)
+        if not IMAGE_RENDERER_AVAILABLE or path.exists():
+            return None
+        with self._lock:
+            future = self._pending.get(path)
+            if future is None:
+                if self._pool is None:
+                    # spawn: os workers não herdam as threads do servidor Streamlit
+                    context = multiprocessing.get_context("spawn")
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+                future = self._pool.submit(_render_to_file, spec, fmt, width, scale, str(path))
+                self._pending[path] = future
+                future.add_done_callback(lambda _, path=path: self._pending.pop(path, None))
+        return future
+
+    def render_all(self, specs, formats=FORMATS, width=MOBILE_IMAGE_WIDTH, scale=DEFAULT_SCALE) -> list:
+        """Renderiza as figuras nos formatos pedidos, em paralelo, e retorna os arquivos (bloqueia até o fim)"""
+        jobs = [(spec, fmt) for spec in specs for fmt in formats]
+        futures = [self.submit(spec, fmt, width, scale) for spec, fmt in jobs]
+        for future in futures:
+            if future is not None:
+                future.result()
+        return [self.path(spec, fmt, width, scale) for spec, fmt in jobs]
+
+    def prune(self, keep) -> int:
+        """Remove as imagens fora de keep (versões anteriores dos dados) e retorna quantas saíram"""
+        keep = {Path(path).name for path in keep}
+        removed = 0
+        for path in self.directory.glob("*.*"):
+            if path.name not in keep:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def shutdown(self):
+        """Encerra o pool de workers"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+# Serviço do processo, compartilhado por todas as sessões
+RENDERER = RenderService()
+
+
+def prerender(formats=FORMATS, workers=RENDER_WORKERS, prune=False) -> list:
+    """Renderiza todas as figuras do app (todas as abas) e retorna os arquivos gerados"""
+    from painel_artefatos import collect_cache_entries
+
+    specs = [json.loads(value) for namespace, _, value, _ in collect_cache_entries() if namespace == "figure"]
+    service = RenderService(workers=workers)
+    try:
+        paths = service.render_all(specs, formats)
+    finally:
+        service.shutdown()
+    if prune:
+        service.prune(paths)
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pré-renderiza os gráficos do painel como imagens estáticas")
+    parser.add_argument("--formats", nargs="+", default=list(FORMATS), choices=FORMATS)
+    parser.add_argument("--workers", type=int, default=RENDER_WORKERS)
+    parser.add_argument("--prune", action="store_true", help="remove imagens de versões anteriores dos dados")
+    args = parser.parse_args()
+
+    if not IMAGE_RENDERER_AVAILABLE:
+        parser.exit(1, "kaleido não está instalado: pip install kaleido\n")
+    paths = prerender(args.formats, args.workers, args.prune)
+    print(f"{len(paths)} imagens em {RENDER_DIR}")
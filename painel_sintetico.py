@@ -0,0 +1,141 @@
+"""Gerador de dados sintéticos para testes de escala do painel.
+
+Produz um documento no schema de data/perfil.json com N experiências,
+projetos, formações, certificações, marcos e habilidades, para medir como o
+painel se comporta com listas grandes (ex.: um diretório de equipe). O app
+lê o arquivo gerado quando PAINEL_DATA_FILE aponta para ele.
+
+Uso:
+    python painel_sintetico.py 1000 [--out data/sintetico-1000.json] [--seed 0]
+    PAINEL_DATA_FILE=data/sintetico-1000.json streamlit run dashboard_painel_oficial.py
+"""
+import argparse
+import json
+import random
+from pathlib import Path
+
+from painel_dados import SCHEMA_VERSION, validate_data
+from painel_modelo import EVOLUTION_SKILLS, EVOLUTION_YEARS, HIGHLIGHT_BASE_YEAR
+
+# Habilidades referenciadas diretamente pelo painel (radar, barras e métricas)
+BASE_SKILLS = EVOLUTION_SKILLS + ["Streamlit", "AWS", "Databricks"]
+SKILL_YEARS = sorted({HIGHLIGHT_BASE_YEAR, *EVOLUTION_YEARS})
+
+ACHIEVEMENTS_PER_EXPERIENCE = 4
+SKILLS_PER_EXPERIENCE = 5
+TAGS_PER_PROJECT = 4
+METRICS_PER_PROJECT = 3
+
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Wonka", "Tyrell", "Cyberdyne", "Soylent"]
+ROLES = ["Analista de Dados", "Cientista de Dados", "Engenheiro de Dados", "Analista de BI", "Product Analyst"]
+CITIES = ["São Paulo", "Rio de Janeiro", "Belo Horizonte", "Curitiba", "Recife", "Porto Alegre"]
+TAGS = ["Python", "SQL", "Power BI", "Machine Learning", "EDA", "Dashboard", "Marketing", "Streamlit", "AWS"]
+ICONS = ["📊", "🎓", "📈", "🤖", "☁️"]
+
+
+def _history(rng: random.Random) -> dict:
+    """Histórico crescente de níveis por ano"""
+    level = rng.randint(10, 40)
+    history = {}
+    for year in SKILL_YEARS:
+        level = min(100, level + rng.randint(0, 15))
+        history[str(year)] = level
+    return history
+
+
+def _skill(rng: random.Random) -> dict:
+    """Habilidade com nível atual igual ao último ano do histórico"""
+    history = _history(rng)
+    return {"current": history[str(SKILL_YEARS[-1])], "history": history}
+
+
+def _experience(rng: random.Random, i: int, skill_names: list) -> dict:
+    """Experiência profissional sintética"""
+    # Meses contados desde o ano 0: o fim é o início mais uma duração não negativa
+    start = rng.randint(2000 * 12, 2024 * 12 + 11)
+    end = start + rng.randint(0, 71)
+    return {
+        "company": f"{rng.choice(COMPANIES)} {i:05d}",
+        "role": rng.choice(ROLES),
+        "start": f"{start // 12}-{start % 12 + 1:02d}",
+        "end": None if end // 12 > 2025 or rng.random() < 0.05 else f"{end // 12}-{end % 12 + 1:02d}",
+        "city": rng.choice(CITIES),
+        "achievements": [f"Entrega {j + 1} da experiência {i}: redução de custos e automação de relatórios" for j in range(ACHIEVEMENTS_PER_EXPERIENCE)],
+        "skills": rng.sample(skill_names, SKILLS_PER_EXPERIENCE),
+    }
+
+
+def _project(rng: random.Random, i: int) -> dict:
+    """Projeto sintético com métricas e tags"""
+    return {
+        "title": f"Projeto {i:05d}",
+        "summary": f"Estudo de **caso {i}** com EDA, modelagem e _dashboard_ executivo.",
+        "tags": rng.sample(TAGS, TAGS_PER_PROJECT),
+        "metrics": {f"Métrica_{j + 1}": f"{rng.randint(1, 99)}%" for j in range(METRICS_PER_PROJECT)},
+        "link": f"https://example.com/projetos/{i}",
+    }
+
+
+def generate_data(n: int, seed=0) -> dict:
+    """Gera um documento válido no schema atual com N itens em cada lista"""
+    rng = random.Random(seed)
+    skills = {name: _skill(rng) for name in BASE_SKILLS}
+    skills.update({f"Skill {i:05d}": _skill(rng) for i in range(max(0, n - len(BASE_SKILLS)))})
+    skill_names = list(skills)
+
+    data = {
+        "schema_version": SCHEMA_VERSION,
+        "profile": {
+            "name": "Pessoa Sintética",
+            "headline": "Data Analyst | Teste de Escala",
+            "location": "São Paulo, Brasil",
+            "email": "pessoa@example.com",
+            "site": "https://example.com",
+            "linkedin": "https://www.linkedin.com/in/example",
+            "github": "https://github.com/example",
+            "instagram": "https://www.instagram.com/example",
+            "bio": f"Perfil sintético com {n} itens por lista para testes de escala do painel.",
+        },
+        "experiences": [_experience(rng, i, skill_names) for i in range(n)],
+        "projects": [_project(rng, i) for i in range(n)],
+        "education": [
+            {"title": f"Curso {i:05d} Certificate" if i % 2 else f"Curso {i:05d}", "org": rng.choice(COMPANIES), "year": str(rng.randint(2005, 2025))}
+            for i in range(n)
+        ],
+        "skills": skills,
+        "languages": {"Português": 100, "Inglês": rng.randint(50, 100), "Espanhol": rng.randint(20, 90)},
+        "milestones": [
+            {"period": f"{2000 + i % 26}", "event": f"Marco {i:05d}", "detail": f"{rng.choice(COMPANIES)} - {rng.choice(ROLES)}"}
+            for i in range(n)
+        ],
+        "certifications": [
+            {"name": f"Certificação {i:05d}", "org": rng.choice(COMPANIES), "year": rng.randint(2010, 2025), "icon": rng.choice(ICONS)}
+            for i in range(n)
+        ],
+        "soft_skills": {"Comunicação": 90, "Liderança": 80, "Trabalho em Equipe": 95},
+        "areas": {f"Área {i:03d}": rng.sample(TAGS, 3) for i in range(min(n, 20))},
+    }
+    return data
+
+
+def write_data(n: int, path, seed=0) -> Path:
+    """Gera, valida e grava o documento sintético"""
+    data = generate_data(n, seed)
+    errors = validate_data(data)
+    if errors:
+        raise ValueError("; ".join(errors[:5]))
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera dados sintéticos para testes de escala do painel")
+    parser.add_argument("n", type=int, help="itens por lista (experiências, projetos, formações...)")
+    parser.add_argument("--out", help="arquivo de saída (padrão: data/sintetico-<n>.json)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    out = args.out or Path(__file__).resolve().parent / "data" / f"sintetico-{args.n}.json"
+    print(f"Dados sintéticos gravados em {write_data(args.n, out, args.seed)}")
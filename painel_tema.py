@@ -0,0 +1,410 @@
+"""Tema visual do painel: paleta de cores e folha de estilo compilada.
+
+A folha de estilo é montada, minificada e gravada uma única vez por processo
+em `static/css/tema.<hash>.css`; o app a referencia por um <link>, então cada
+rerun envia só a tag e o navegador baixa o CSS uma vez (o hash no nome muda
+com o conteúdo). O app/static do Streamlit entrega .css e .woff2 como
+text/plain com nosniff, o que faz o navegador recusar a folha de estilo: os
+arquivos de static/ são servidos pela rota de componentes, com o Content-Type
+do tipo do arquivo.
+
+A fonte Inter é auto-hospedada em `static/fonts` (sem @import do Google Fonts
+no caminho crítico) depois de `--fonts`; sem o arquivo, o CSS recorre à Inter
+instalada localmente e depois à Source Sans Pro que o próprio Streamlit serve.
+
+Uso:
+    python painel_tema.py            # grava static/css/tema.<hash>.css
+    python painel_tema.py --fonts    # baixa a fonte Inter para static/fonts
+"""
+import argparse
+import functools
+import hashlib
+import mimetypes
+import os
+import re
+import tempfile
+import urllib.request
+
+from painel_imagens import STATIC_DIR
+
+CSS_DIR = STATIC_DIR / "css"
+FONTS_DIR = STATIC_DIR / "fonts"
+
+# Nome da rota de componentes que serve static/ (URL: component/painel_tema.<nome>/...)
+STATIC_ROUTE_NAME = "static"
+
+# --- CORES E TEMAS
+DARK_BG = "#0f1116"
+CARD_BG = "#1e1e1e"
+ACCENT_BG = "#262626"
+PRIMARY = "#2e86de"
+SECONDARY = "#10ac84"
+ACCENT = "#ff9f43"
+NEUTRAL = "#bdc3c7"
+TEXT = "#ecf0f1"
+TEXT_LIGHT = "#95a5a6"
+NEGATIVE = "#ee5253"
+BORDER = "#34495e"
+
+# Constantes de tema que influenciam os gráficos (entram na chave do cache de figuras)
+THEME_KEY = (DARK_BG, CARD_BG, ACCENT_BG, PRIMARY, SECONDARY, ACCENT, NEUTRAL, TEXT, TEXT_LIGHT, BORDER)
+
+# Fonte Inter variável (cobre os pesos 300-700 em um único arquivo)
+INTER_FONT_FILE = "InterVariable.woff2"
+INTER_FONT_SOURCE = "https://rsms.me/inter/font-files/InterVariable.woff2"
+
+
+def self_hosted_font_available() -> bool:
+    """Indica se a fonte Inter já foi baixada para static/fonts"""
+    return (FONTS_DIR / INTER_FONT_FILE).exists()
+
+
+def font_face_css(font_url=None) -> str:
+    """Declara a fonte Inter local (arquivo auto-hospedado quando disponível)"""
+    sources = ["local('Inter')", "local('Inter Variable')"]
+    if font_url:
+        sources.append(f"url('{font_url}') format('woff2')")
+    return (
+        "@font-face {\n"
+        "    font-family: 'Inter';\n"
+        "    font-style: normal;\n"
+        "    font-weight: 300 700;\n"
+        "    font-display: swap;\n"
+        f"    src: {', '.join(sources)};\n"
+        "}\n"
+    )
+
+
+def build_css(font_url=None) -> str:
+    """Monta a folha de estilo do painel a partir da paleta"""
+    font_face = font_face_css(font_url)
+    return f"""{font_face}
+* {{
+    font-family: 'Inter', 'Source Sans Pro', system-ui, sans-serif;
+}}
+
+[data-testid="stAppViewContainer"] {{
+    background: {DARK_BG};
+    color: {TEXT};
+}}
+
+[data-testid="stSidebar"] {{
+    background: {ACCENT_BG};
+}}
+
+[data-testid="stSidebar"] > div:first-child {{
+    background: {ACCENT_BG};
+}}
+
+/* Remove padding padrão do Streamlit no sidebar */
+section[data-testid="stSidebar"] > div {{
+    padding-top: 2rem;
+    padding-left: 1rem;
+    padding-right: 1rem;
+}}
+
+.sidebar-link {{
+    display: block;
+    text-decoration: none;
+    font-weight: 600;
+    border-radius: 8px;
+    padding: 0.75rem 1rem;
+    font-size: 0.9rem;
+    text-align: center;
+    transition: all 0.3s ease;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.2);
+    margin-bottom: 10px;
+}}
+
+.sidebar-link:hover {{
+    transform: translateY(-2px);
+    box-shadow: 0 4px 12px rgba(0,0,0,0.3);
+}}
+
+.data-card {{
+    background: {CARD_BG};
+    border-radius: 12px;
+    border: 1px solid {BORDER};
+    padding: 1.5rem;
+    margin-bottom: 1.5rem;
+    box-shadow: 0 4px 20px rgba(0,0,0,0.3);
+    transition: all 0.3s ease;
+}}
+
+.data-card:hover {{
+    transform: translateY(-2px);
+    box-shadow: 0 6px 25px rgba(0,0,0,0.4);
+}}
+
+.story-kpi {{
+    background: {CARD_BG};
+    padding: 1.5rem;
+    border-radius: 12px;
+    border-left: 4px solid {PRIMARY};
+    box-shadow: 0 4px 20px rgba(0,0,0,0.3);
+    margin-bottom: 1rem;
+    text-align: center;
+    transition: all 0.3s ease;
+}}
+
+.story-kpi:hover {{
+    transform: translateY(-2px);
+}}
+
+.story-kpi b {{
+    font-size: 28px;
+    color: {TEXT};
+    font-weight: 700;
+    display: block;
+}}
+
+.story-kpi small {{
+    font-size: 12px;
+    color: {TEXT_LIGHT};
+    text-transform: uppercase;
+    font-weight: 600;
+    letter-spacing: 0.5px;
+    display: block;
+    margin-bottom: 0.5rem;
+}}
+
+.story-kpi .trend {{
+    font-size: 12px;
+    margin-top: 0.5rem;
+    display: block;
+}}
+
+.story-kpi .trend.positive {{
+    color: {SECONDARY};
+}}
+
+.story-kpi .trend.negative {{
+    color: #e74c3c;
+}}
+
+.story-kpi.highlight {{
+    border-left-color: {SECONDARY};
+    background: linear-gradient(135deg, {CARD_BG}, {ACCENT_BG});
+}}
+
+.data-badge {{
+    display: inline-block;
+    padding: 6px 14px;
+    background: rgba(46,134,222,0.15);
+    color: {PRIMARY};
+    border-radius: 20px;
+    font-size: 12px;
+    font-weight: 600;
+    margin: 3px 5px;
+    border: 1px solid rgba(46,134,222,0.3);
+    backdrop-filter: blur(10px);
+}}
+
+.data-badge.secondary {{
+    background: rgba(16,172,132,0.15);
+    color: {SECONDARY};
+    border-color: rgba(16,172,132,0.3);
+}}
+
+.data-badge.accent {{
+    background: rgba(255,159,67,0.15);
+    color: {ACCENT};
+    border-color: rgba(255,159,67,0.3);
+}}
+
+.story-grid {{
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 1rem;
+    margin: 2rem 0;
+}}
+
+.main-header {{
+    background: linear-gradient(135deg, {DARK_BG} 0%, {ACCENT_BG} 100%);
+    border-bottom: 1px solid {BORDER};
+    padding: 3rem 0 2rem 0;
+    margin-bottom: 2rem;
+    text-align: center;
+}}
+
+.stMetric {{
+    background: {CARD_BG} !important;
+    border: 1px solid {BORDER} !important;
+    border-radius: 12px !important;
+    padding: 1rem !important;
+}}
+
+.stExpander {{
+    background: {CARD_BG} !important;
+    border: 1px solid {BORDER} !important;
+    border-radius: 12px !important;
+}}
+
+/* Equivalentes de st.columns, st.expander e st.metric nos fragmentos em lote */
+.data-cols {{
+    display: grid;
+    gap: 1rem;
+    align-items: start;
+}}
+
+details.stExpander {{
+    margin-bottom: 1rem;
+    padding: 0 1rem;
+}}
+
+details.stExpander > summary {{
+    cursor: pointer;
+    padding: 0.75rem 0;
+}}
+
+.stMetric small {{
+    display: block;
+    color: {TEXT_LIGHT};
+}}
+
+.stMetric b {{
+    display: block;
+    font-size: 1.75rem;
+}}
+
+.stMetric .delta {{
+    color: {SECONDARY};
+    font-size: 0.85rem;
+}}
+
+.stMetric .delta.down {{
+    color: {NEGATIVE};
+}}
+
+::-webkit-scrollbar {{
+    width: 8px;
+}}
+
+::-webkit-scrollbar-track {{
+    background: {DARK_BG};
+}}
+
+::-webkit-scrollbar-thumb {{
+    background: {PRIMARY};
+    border-radius: 4px;
+}}
+
+::-webkit-scrollbar-thumb:hover {{
+    background: {SECONDARY};
+}}
+
+.chart-img {{
+    display: block;
+    width: 100%;
+    height: auto;
+    border-radius: 12px;
+}}
+
+@media (max-width: 1024px) {{
+    .story-grid {{
+        grid-template-columns: repeat(2, 1fr);
+    }}
+}}
+
+@media (max-width: 640px) {{
+    .story-grid {{
+        grid-template-columns: 1fr;
+    }}
+    
+    .data-card, .story-kpi {{
+        padding: 1rem;
+    }}
+    
+    .story-kpi b {{
+        font-size: 22px;
+    }}
+    
+    .data-cols {{
+        grid-template-columns: 1fr !important;
+    }}
+}}
+"""
+
+
+def minify_css(css: str) -> str:
+    """Remove comentários e espaços redundantes do CSS"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def mobile_css(css: str) -> str:
+    """Versão enxuta do CSS minificado para o perfil mobile: sem hover, transições nem scrollbar customizada"""
+    css = re.sub(r"(?<=})[^{}@]*(?::hover|::-webkit-scrollbar)[^{}]*\{[^{}]*\}", "", css)
+    return re.sub(r"transition:[^;}]*;?", "", css)
+
+
+def compile_stylesheet(font_url=None, mobile=False) -> tuple:
+    """Compila a folha de estilo minificada e retorna (css, fingerprint)"""
+    css = minify_css(build_css(font_url))
+    if mobile:
+        css = mobile_css(css)
+    return css, hashlib.sha256(css.encode("utf-8")).hexdigest()[:10]
+
+
+def static_route() -> str:
+    """Registra static/ na rota de componentes do runtime atual e retorna o prefixo das URLs"""
+    import streamlit.components.v1 as components
+
+    mimetypes.add_type("font/woff2", ".woff2")
+    component = components.declare_component(STATIC_ROUTE_NAME, path=str(STATIC_DIR))
+    return f"component/{component.name}"
+
+
+def write_stylesheet(out_dir=CSS_DIR, font_url=None, mobile=False):
+    """Grava a folha de estilo compilada como tema.<fingerprint>.css (de forma atômica) e retorna o caminho"""
+    css, fingerprint = compile_stylesheet(font_url, mobile)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"tema.{fingerprint}.css"
+    if not path.exists():
+        fd, tmp = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(css)
+        os.replace(tmp, path)
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _app_stylesheet(mobile=False) -> tuple:
+    """Grava a folha de estilo do app (uma vez por processo e perfil) e retorna (arquivo, fonte pré-carregada)"""
+    # No perfil mobile a fonte Inter não é baixada (fontes do sistema) e o CSS é o enxuto
+    font_file = f"fonts/{INTER_FONT_FILE}" if self_hosted_font_available() and not mobile else None
+    path = write_stylesheet(font_url=f"../{font_file}" if font_file else None, mobile=mobile)
+    return f"css/{path.name}", font_file
+
+
+def theme_link_tag(mobile=False) -> str:
+    """HTML do tema para o Streamlit: preload da fonte + <link> para a folha de estilo gravada em static/css"""
+    stylesheet, font_file = _app_stylesheet(mobile)
+    prefix = static_route()
+    preload = (
+        f'<link rel="preload" href="{prefix}/{font_file}" as="font" type="font/woff2" crossorigin>'
+        if font_file else ""
+    )
+    return f'{preload}<link rel="stylesheet" href="{prefix}/{stylesheet}">'
+
+
+def download_fonts(dest=FONTS_DIR):
+    """Baixa a fonte Inter para auto-hospedagem"""
+    dest.mkdir(parents=True, exist_ok=True)
+    path = dest / INTER_FONT_FILE
+    with urllib.request.urlopen(INTER_FONT_SOURCE, timeout=30) as response:
+        path.write_bytes(response.read())
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compila o tema do painel")
+    parser.add_argument("--fonts", action="store_true", help="baixa a fonte Inter para static/fonts")
+    args = parser.parse_args()
+
+    if args.fonts:
+        print(f"Fonte salva em {download_fonts()}")
+    print(f"Folha de estilo gerada em {write_stylesheet(font_url=f'../fonts/{INTER_FONT_FILE}')}")
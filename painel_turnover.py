@@ -0,0 +1,262 @@
+"""Motor de score de turnover extraído do Case_Turnover.ipynb.
+
+Empacota o pipeline do notebook como módulo importável:
+- mesmo pré-processamento (mapeamento das escalas ordinais para rótulos e
+  pd.get_dummies com drop_first);
+- treino com SMOTE no conjunto de treino e RandomForest (abordagem I do
+  notebook) ou XGBoost (modelo escolhido pelo PyCaret, sem o PyCaret);
+- avaliação no holdout (AUC, acurácia, recall e Lift@10%).
+
+O modelo ajustado é gravado com as colunas de treino, as categorias de cada
+variável e um perfil de referência (medianas e modas), então o score não
+depende mais do CSV: o app carrega o arquivo uma vez por processo e pontua
+lotes de milhares de linhas em uma chamada (encoding vetorizado + um único
+predict_proba), inclusive linhas parciais de simulações "e se".
+
+Treino e score exigem scikit-learn, imbalanced-learn e joblib
+(requirements-ml.txt); XGBoost é opcional.
+
+Uso:
+    python painel_turnover.py train --csv data/WA_Fn-UseC_-HR-Employee-Attrition.csv [--model xgboost]
+    python painel_turnover.py score funcionarios.csv [--out scores.csv]
+"""
+import argparse
+import hashlib
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+DATA_FILE = Path(os.environ.get("PAINEL_TURNOVER_CSV") or ROOT / "data" / "WA_Fn-UseC_-HR-Employee-Attrition.csv")
+MODEL_FILE = Path(os.environ.get("PAINEL_TURNOVER_MODEL") or ROOT / "build" / "turnover-model.joblib")
+
+TARGET = "Attrition"
+POSITIVE_CLASS = "Yes"
+
+# Escalas ordinais da base descritas como rótulos (mapeamento do notebook)
+CATEGORY_MAPPING = {
+    "Education": {1: "Below College", 2: "College", 3: "Bachelor", 4: "Master", 5: "Doctor"},
+    "EnvironmentSatisfaction": {1: "Low", 2: "Medium", 3: "High", 4: "Very High"},
+    "JobInvolvement": {1: "Low", 2: "Medium", 3: "High", 4: "Very High"},
+    "JobSatisfaction": {1: "Low", 2: "Medium", 3: "High", 4: "Very High"},
+    "PerformanceRating": {1: "Low", 2: "Good", 3: "Excellent", 4: "Outstanding"},
+    "RelationshipSatisfaction": {1: "Low", 2: "Medium", 3: "High", 4: "Very High"},
+    "WorkLifeBalance": {1: "Bad", 2: "Good", 3: "Better", 4: "Best"},
+}
+
+# Identificador e colunas constantes da base (não carregam sinal)
+DROP_COLUMNS = ["EmployeeCount", "EmployeeNumber", "Over18", "StandardHours"]
+
+TEST_SIZE = 0.2
+RANDOM_STATE = 42
+# Limiar de alerta sugerido no notebook: risco de saída já a partir de 0,3
+RISK_THRESHOLD = 0.3
+LIFT_FRACTION = 0.10
+SCORE_CHUNKSIZE = 50_000
+
+
+def prepare_frame(frame):
+    """Aplica o mapeamento das escalas ordinais e remove identificador e colunas constantes"""
+    frame = frame.drop(columns=[column for column in DROP_COLUMNS if column in frame.columns])
+    for column, mapping in CATEGORY_MAPPING.items():
+        if column in frame.columns and frame[column].dtype.kind in "iuf":
+            frame[column] = frame[column].map(mapping)
+    return frame
+
+
+def load_training_data(path=DATA_FILE):
+    """Lê a base de RH e aplica o pré-processamento do notebook (sem duplicatas)"""
+    import pandas as pd
+
+    return prepare_frame(pd.read_csv(path)).drop_duplicates()
+
+
+def lift_at(y_true, scores, fraction=LIFT_FRACTION) -> float:
+    """Taxa de positivos entre os fraction mais bem pontuados dividida pela taxa geral"""
+    import numpy as np
+
+    y_true = np.asarray(y_true)
+    top = np.argsort(-np.asarray(scores))[:max(1, int(len(y_true) * fraction))]
+    base_rate = y_true.mean()
+    return float(y_true[top].mean() / base_rate) if base_rate else float("nan")
+
+
+def build_estimator(model: str, params=None, n_jobs=-1):
+    """Classificador do notebook: RandomForest (abordagem I), XGBoost (escolhido pelo PyCaret) ou GradientBoosting"""
+    params = params or {}
+    if model == "random_forest":
+        from sklearn.ensemble import RandomForestClassifier
+
+        return RandomForestClassifier(random_state=RANDOM_STATE, n_jobs=n_jobs, **params)
+    if model == "xgboost":
+        from xgboost import XGBClassifier
+
+        return XGBClassifier(random_state=RANDOM_STATE, n_jobs=n_jobs, eval_metric="logloss", **params)
+    if model == "gradient_boosting":
+        from sklearn.ensemble import GradientBoostingClassifier
+
+        return GradientBoostingClassifier(random_state=RANDOM_STATE, **params)
+    raise ValueError(f"modelo desconhecido: {model}")
+
+
+class TurnoverModel:
+    """Modelo ajustado + metadados necessários para pontuar linhas cruas da base de RH"""
+
+    def __init__(self, estimator, categories: dict, feature_columns: list, reference_profile: dict,
+                 metrics: dict, meta: dict):
+        self.estimator = estimator
+        self.categories = categories
+        self.feature_columns = feature_columns
+        self.reference_profile = reference_profile
+        self.metrics = metrics
+        self.meta = meta
+
+    def encode(self, frame):
+        """Dummies com as categorias do treino, na ordem das colunas do modelo (colunas ausentes = perfil de referência)"""
+        import pandas as pd
+
+        frame = prepare_frame(frame.copy())
+        for column, value in self.reference_profile.items():
+            if column not in frame.columns:
+                frame[column] = value
+        for column, categories in self.categories.items():
+            frame[column] = pd.Categorical(frame[column], categories=categories)
+        encoded = pd.get_dummies(frame, columns=list(self.categories), drop_first=True, dtype=int)
+        return encoded.reindex(columns=self.feature_columns, fill_value=0)
+
+    def score(self, frame):
+        """Probabilidade de saída de cada linha (lote inteiro em uma chamada ao modelo)"""
+        return self.estimator.predict_proba(self.encode(frame))[:, 1]
+
+    def score_records(self, records: list) -> list:
+        """Probabilidades para registros em dicionário (ex.: simulações do painel)"""
+        import pandas as pd
+
+        return self.score(pd.DataFrame.from_records(records)).tolist()
+
+
+def encode_training_data(path=DATA_FILE) -> dict:
+    """Base pré-processada e codificada: matriz de dummies, alvo, categorias e perfil de referência"""
+    import pandas as pd
+
+    data = load_training_data(path)
+    y = (data.pop(TARGET) == POSITIVE_CLASS).astype(int)
+    categories = {
+        column: sorted(data[column].dropna().unique())
+        for column in data.columns if data[column].dtype == object
+    }
+    reference_profile = {
+        column: data[column].mode().iloc[0] if column in categories else data[column].median()
+        for column in data.columns
+    }
+    encoded = pd.get_dummies(data, columns=list(categories), drop_first=True, dtype=int)
+    return {"X": encoded, "y": y, "categories": categories, "reference_profile": reference_profile}
+
+
+def holdout_split(X, y) -> tuple:
+    """Split treino/teste do notebook (80/20, random_state=42)"""
+    from sklearn.model_selection import train_test_split
+
+    return train_test_split(X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE)
+
+
+def evaluate(y_true, scores) -> dict:
+    """AUC, acurácia e recall no limiar de risco e Lift@10%"""
+    from sklearn.metrics import accuracy_score, recall_score, roc_auc_score
+
+    predicted = (scores >= RISK_THRESHOLD).astype(int)
+    return {
+        "AUC": float(roc_auc_score(y_true, scores)),
+        "Accuracy": float(accuracy_score(y_true, predicted)),
+        "Recall": float(recall_score(y_true, predicted)),
+        "Lift@10%": lift_at(y_true, scores),
+    }
+
+
+def train(path=DATA_FILE, model="random_forest", params=None) -> TurnoverModel:
+    """Treina o pipeline do notebook (split 80/20, SMOTE no treino) e avalia no holdout"""
+    from imblearn.over_sampling import SMOTE
+
+    encoded = encode_training_data(path)
+    X_train, X_test, y_train, y_test = holdout_split(encoded["X"], encoded["y"])
+    X_resampled, y_resampled = SMOTE(random_state=RANDOM_STATE).fit_resample(X_train, y_train)
+
+    estimator = build_estimator(model, params)
+    estimator.fit(X_resampled, y_resampled)
+
+    metrics = {**evaluate(y_test, estimator.predict_proba(X_test)[:, 1]), "threshold": RISK_THRESHOLD}
+    meta = {
+        "model": model,
+        "params": params or {},
+        "trained": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "data_sha256": hashlib.sha256(Path(path).read_bytes()).hexdigest(),
+        "rows": len(encoded["X"]),
+    }
+    return TurnoverModel(
+        estimator, encoded["categories"], list(encoded["X"].columns), encoded["reference_profile"], metrics, meta
+    )
+
+
+def save_model(model: TurnoverModel, path=MODEL_FILE) -> Path:
+    """Grava o modelo ajustado com joblib"""
+    import joblib
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(model, path)
+    return path
+
+
+def load_model(path=MODEL_FILE):
+    """Modelo gravado, ou None se ainda não foi treinado ou as dependências de ML não estão instaladas"""
+    try:
+        import joblib
+    except ImportError:
+        return None
+    if not Path(path).exists():
+        return None
+    return joblib.load(path)
+
+
+def main(argv=None):
+    """CLI: train grava o modelo, score pontua um CSV em blocos"""
+    parser = argparse.ArgumentParser(description="Treina e aplica o modelo de turnover do Case_Turnover.ipynb")
+    commands = parser.add_subparsers(dest="command", required=True)
+    train_parser = commands.add_parser("train", help="treina e grava o modelo")
+    train_parser.add_argument("--csv", default=str(DATA_FILE), help="base de RH (WA_Fn-UseC_-HR-Employee-Attrition.csv)")
+    train_parser.add_argument("--model", default="random_forest", choices=["random_forest", "xgboost", "gradient_boosting"])
+    train_parser.add_argument("--out", default=str(MODEL_FILE))
+    score_parser = commands.add_parser("score", help="pontua um CSV de funcionários")
+    score_parser.add_argument("csv")
+    score_parser.add_argument("--model-file", default=str(MODEL_FILE))
+    score_parser.add_argument("--out", help="CSV de saída (padrão: imprime o resumo)")
+    score_parser.add_argument("--chunksize", type=int, default=SCORE_CHUNKSIZE, help="linhas pontuadas por lote")
+    args = parser.parse_args(argv)
+
+    if args.command == "train":
+        fitted = train(args.csv, args.model)
+        print(f"Modelo gravado em {save_model(fitted, args.out)}")
+        print(", ".join(f"{name}: {value:.3f}" for name, value in fitted.metrics.items()))
+    else:
+        import pandas as pd
+
+        fitted = load_model(args.model_file)
+        if fitted is None:
+            parser.exit(1, f"modelo não encontrado em {args.model_file} (rode o comando train)\n")
+        # Em blocos (memória limitada para extrações grandes), um lote por chamada ao modelo
+        total = at_risk = 0
+        for number, employees in enumerate(pd.read_csv(args.csv, chunksize=args.chunksize)):
+            employees["turnover_score"] = fitted.score(employees)
+            if args.out:
+                employees.to_csv(args.out, mode="a" if number else "w", header=not number, index=False)
+            total += len(employees)
+            at_risk += int((employees["turnover_score"] >= fitted.metrics["threshold"]).sum())
+        print(f"{total} funcionários pontuados, {at_risk} acima do limiar de risco")
+
+
+if __name__ == "__main__":
+    # Pelo módulo importado, não por __main__: o joblib grava a classe como
+    # painel_turnover.TurnoverModel, que o painel e os outros scripts conseguem carregar
+    import painel_turnover
+
+    painel_turnover.main()
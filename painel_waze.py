@@ -0,0 +1,310 @@
+"""Feature store do projeto Waze (Waze_Project.ipynb).
+
+O notebook recalcula a cada execução, coluna a coluna, os atributos
+derivados da telemetria e depois corrige os infinitos das divisões por zero
+em passos separados. Aqui os sete atributos são calculados em uma única
+passada vetorizada por bloco, com divisão segura (denominador zero → 0, o
+mesmo valor que o notebook atribui aos infinitos), sobre os blocos tipados
+de painel_ingestao.
+
+O resultado fica em uma tabela Parquet particionada pela chave da origem
+(hash SHA-256 do CSV + versão das definições):
+    build/features/waze/source=<chave>/part-0.parquet
+Se a partição da chave existe, nada é recalculado; o painel e o modelo leem
+as colunas de que precisam com memory map (load_features).
+
+O modelo de churn do notebook (XGBoost ou RandomForest com os melhores
+hiperparâmetros do GridSearchCV, mesmo split estratificado) é treinado a
+partir dessa tabela e gravado com as colunas, as métricas de teste e um
+perfil de referência para completar registros parciais. Treino exige
+scikit-learn e joblib (requirements-ml.txt); XGBoost é opcional.
+
+Uso:
+    python painel_waze.py [--csv waze_dataset.csv] [--prune] [--train xgboost] [--model-out modelo.joblib]
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from painel_ingestao import DEFAULT_CHUNKSIZE, WAZE_FILE, read_chunks
+
+ROOT = Path(__file__).resolve().parent
+FEATURES_DIR = ROOT / "build" / "features" / "waze"
+PART_FILE = "part-0.parquet"
+
+# Versão das definições dos atributos: muda a chave quando uma fórmula muda
+FEATURES_FORMAT = 1
+
+FEATURE_COLUMNS = [
+    "km_per_driving_day", "percent_sessions_in_last_month", "professional_driver", "total_sessions_per_day",
+    "km_per_hour", "km_per_drive", "percent_of_drives_to_favorite",
+]
+
+# Critério do notebook para motorista profissional
+PROFESSIONAL_MIN_DRIVES = 60
+PROFESSIONAL_MIN_DRIVING_DAYS = 15
+
+MODEL_FILE = Path(os.environ.get("PAINEL_WAZE_MODEL") or ROOT / "build" / "waze-churn-model.joblib")
+TARGET = "label"
+POSITIVE_CLASS = "churned"
+
+# Entradas do modelo na ordem do notebook: X = df sem ID, label, label2 e device (device2 no lugar)
+RAW_COLUMNS = [
+    "sessions", "drives", "total_sessions", "n_days_after_onboarding", "total_navigations_fav1",
+    "total_navigations_fav2", "driven_km_drives", "duration_minutes_drives", "activity_days", "driving_days",
+]
+MODEL_COLUMNS = RAW_COLUMNS + FEATURE_COLUMNS + ["device2"]
+
+# Melhores hiperparâmetros do GridSearchCV do notebook (refit por recall)
+MODEL_PARAMS = {
+    "xgboost": {"objective": "binary:logistic", "learning_rate": 0.1, "max_depth": 12, "min_child_weight": 5, "n_estimators": 300},
+    "random_forest": {
+        "max_depth": None, "max_features": 1.0, "max_samples": 1.0, "min_samples_leaf": 2,
+        "min_samples_split": 2, "n_estimators": 300,
+    },
+}
+RANDOM_STATE = 42
+
+
+# Chaves já calculadas no processo, por (caminho, mtime, tamanho): o CSV só é relido quando muda
+_keys = {}
+
+
+def source_key(path) -> str:
+    """Hash do CSV de origem (lido em blocos) e da versão dos atributos"""
+    stat = os.stat(path)
+    version = (os.fspath(path), stat.st_mtime_ns, stat.st_size)
+    if version not in _keys:
+        digest = hashlib.sha256(f"features-v{FEATURES_FORMAT}".encode())
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        _keys[version] = digest.hexdigest()[:16]
+    return _keys[version]
+
+
+def safe_divide(numerator, denominator):
+    """Divisão elemento a elemento com 0 onde o denominador é zero (sem inf nem NaN)"""
+    import numpy as np
+
+    numerator = np.asarray(numerator, dtype="float64")
+    denominator = np.asarray(denominator, dtype="float64")
+    out = np.zeros(np.broadcast(numerator, denominator).shape)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out.astype("float32")
+
+
+def feature_arrays(columns) -> dict:
+    """Atributos derivados do notebook a partir das colunas cruas (DataFrame ou dicionário de arrays)"""
+    km, drives, driving_days = columns["driven_km_drives"], columns["drives"], columns["driving_days"]
+    total_sessions = columns["total_sessions"]
+    return {
+        "km_per_driving_day": safe_divide(km, driving_days),
+        "percent_sessions_in_last_month": safe_divide(columns["sessions"], total_sessions),
+        "professional_driver": (
+            (drives >= PROFESSIONAL_MIN_DRIVES) & (driving_days >= PROFESSIONAL_MIN_DRIVING_DAYS)
+        ).astype("int8"),
+        "total_sessions_per_day": safe_divide(total_sessions, columns["n_days_after_onboarding"]),
+        "km_per_hour": safe_divide(km * 60, columns["duration_minutes_drives"]),
+        "km_per_drive": safe_divide(km, drives),
+        "percent_of_drives_to_favorite": safe_divide(
+            columns["total_navigations_fav1"] + columns["total_navigations_fav2"], total_sessions
+        ),
+    }
+
+
+def engineer_features(frame):
+    """Acrescenta os atributos derivados ao bloco, todos de uma vez"""
+    return frame.assign(**feature_arrays(frame))
+
+
+def feature_partition(path=WAZE_FILE, out_dir=FEATURES_DIR) -> Path:
+    """Diretório da partição dos atributos para o CSV atual (existindo ou não)"""
+    return Path(out_dir) / f"source={source_key(path)}"
+
+
+def build_feature_store(path=WAZE_FILE, out_dir=FEATURES_DIR, chunksize=DEFAULT_CHUNKSIZE) -> Path:
+    """Calcula e grava a partição da origem, se ainda não existe; retorna o arquivo Parquet"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    partition = feature_partition(path, out_dir)
+    if (partition / PART_FILE).exists():
+        return partition / PART_FILE
+
+    partition.parent.mkdir(parents=True, exist_ok=True)
+    # Grava em um diretório temporário e renomeia: leitores nunca veem uma partição pela metade
+    tmp = Path(tempfile.mkdtemp(dir=partition.parent, prefix=".tmp-"))
+    try:
+        writer = None
+        for chunk in read_chunks(path, "waze", chunksize):
+            table = pa.Table.from_pandas(engineer_features(chunk), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp / PART_FILE, table.schema)
+            writer.write_table(table)
+        if writer is None:
+            raise ValueError(f"{path}: arquivo sem linhas")
+        writer.close()
+        try:
+            os.replace(tmp, partition)
+        except OSError:
+            # Outro processo gravou a mesma partição antes (conteúdo idêntico, mesma chave)
+            if not (partition / PART_FILE).exists():
+                raise
+            shutil.rmtree(tmp, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return partition / PART_FILE
+
+
+def load_features(path=WAZE_FILE, columns=None, out_dir=FEATURES_DIR):
+    """DataFrame dos atributos (só as colunas pedidas), lido com memory map; calcula na primeira vez"""
+    import pyarrow.parquet as pq
+
+    part = build_feature_store(path, out_dir)
+    return pq.read_table(part, columns=columns, memory_map=True).to_pandas()
+
+
+def prune_partitions(path=WAZE_FILE, out_dir=FEATURES_DIR) -> int:
+    """Remove as partições de outras versões do CSV ou dos atributos e retorna quantas saíram"""
+    keep = feature_partition(path, out_dir).name
+    removed = 0
+    for partition in Path(out_dir).glob("source=*"):
+        if partition.name != keep:
+            shutil.rmtree(partition)
+            removed += 1
+    return removed
+
+
+def model_matrix(columns):
+    """Matriz float32 das entradas do modelo (device2 = 0 para Android, 1 para iPhone, como no notebook)"""
+    import numpy as np
+
+    matrix = [np.asarray(columns[column], dtype="float32") for column in RAW_COLUMNS + FEATURE_COLUMNS]
+    matrix.append((np.asarray(columns["device"]) != "Android").astype("float32"))
+    return np.column_stack(matrix)
+
+
+def _build_estimator(model: str):
+    """Classificador do notebook com os melhores hiperparâmetros encontrados"""
+    if model == "xgboost":
+        from xgboost import XGBClassifier
+
+        return XGBClassifier(random_state=RANDOM_STATE, n_jobs=-1, **MODEL_PARAMS[model])
+    if model == "random_forest":
+        from sklearn.ensemble import RandomForestClassifier
+
+        return RandomForestClassifier(random_state=RANDOM_STATE, n_jobs=-1, **MODEL_PARAMS[model])
+    raise ValueError(f"modelo desconhecido: {model}")
+
+
+class ChurnModel:
+    """Modelo de churn ajustado + metadados para pontuar registros crus da telemetria"""
+
+    def __init__(self, estimator, reference_profile: dict, metrics: dict, meta: dict):
+        self.estimator = estimator
+        self.reference_profile = reference_profile
+        self.metrics = metrics
+        self.meta = meta
+
+    def predict_matrix(self, matrix):
+        """Probabilidade de churn de cada linha de uma matriz de MODEL_COLUMNS (uma chamada ao modelo)"""
+        return self.estimator.predict_proba(matrix)[:, 1]
+
+    def score_records(self, records: list) -> list:
+        """Probabilidades para registros crus (campos ausentes = perfil de referência), em um único lote"""
+        import numpy as np
+
+        # Colunas montadas direto em arrays: sem DataFrame no caminho de cada requisição
+        columns = {
+            column: np.array([record.get(column, value) for record in records], dtype="float64")
+            for column, value in self.reference_profile.items() if column != "device"
+        }
+        columns["device"] = np.array([record.get("device", self.reference_profile["device"]) for record in records])
+        columns.update(feature_arrays(columns))
+        return self.predict_matrix(model_matrix(columns)).tolist()
+
+
+def train_churn_model(path=WAZE_FILE, model="xgboost", out_dir=FEATURES_DIR) -> ChurnModel:
+    """Treina com o split do notebook (teste 20%, validação 25% do restante, estratificados) e avalia no teste"""
+    from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+    from sklearn.model_selection import train_test_split
+
+    frame = load_features(path, RAW_COLUMNS + FEATURE_COLUMNS + ["device", TARGET], out_dir)
+    frame = frame[frame[TARGET].notna()]
+    X, y = model_matrix(frame), (frame[TARGET] == POSITIVE_CLASS).to_numpy(dtype="int8")
+    X_tr, X_test, y_tr, y_test = train_test_split(X, y, stratify=y, test_size=0.2, random_state=RANDOM_STATE)
+    X_train, _, y_train, _ = train_test_split(X_tr, y_tr, stratify=y_tr, test_size=0.25, random_state=RANDOM_STATE)
+
+    estimator = _build_estimator(model)
+    estimator.fit(X_train, y_train)
+    predicted = estimator.predict(X_test)
+    metrics = {
+        "Accuracy": float(accuracy_score(y_test, predicted)),
+        "Precision": float(precision_score(y_test, predicted)),
+        "Recall": float(recall_score(y_test, predicted)),
+        "F1": float(f1_score(y_test, predicted)),
+    }
+    reference_profile = {column: float(frame[column].median()) for column in RAW_COLUMNS}
+    reference_profile["device"] = str(frame["device"].mode().iloc[0])
+    meta = {
+        "model": model,
+        "trained": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "source": feature_partition(path, out_dir).name,
+        "rows": len(frame),
+    }
+    return ChurnModel(estimator, reference_profile, metrics, meta)
+
+
+def save_churn_model(model: ChurnModel, path=MODEL_FILE) -> Path:
+    """Grava o modelo de churn com joblib"""
+    import joblib
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(model, path)
+    return path
+
+
+def load_churn_model(path=MODEL_FILE):
+    """Modelo de churn gravado, ou None se ainda não foi treinado ou as dependências de ML não estão instaladas"""
+    try:
+        import joblib
+    except ImportError:
+        return None
+    if not Path(path).exists():
+        return None
+    return joblib.load(path)
+
+
+def main(argv=None):
+    """CLI: grava os atributos e, com --train, o modelo de churn"""
+    parser = argparse.ArgumentParser(description="Calcula e grava os atributos do projeto Waze em Parquet")
+    parser.add_argument("--csv", default=str(WAZE_FILE), help="waze_dataset.csv")
+    parser.add_argument("--out", default=str(FEATURES_DIR))
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--prune", action="store_true", help="remove partições de versões anteriores")
+    parser.add_argument("--train", choices=sorted(MODEL_PARAMS), help="treina e grava o modelo de churn")
+    parser.add_argument("--model-out", default=str(MODEL_FILE), help="arquivo do modelo treinado")
+    args = parser.parse_args(argv)
+
+    print(f"Atributos em {build_feature_store(args.csv, args.out, args.chunksize)}")
+    if args.prune:
+        print(f"{prune_partitions(args.csv, args.out)} partição(ões) antiga(s) removida(s)")
+    if args.train:
+        fitted = train_churn_model(args.csv, args.train, args.out)
+        print(f"Modelo gravado em {save_churn_model(fitted, args.model_out)}")
+        print(", ".join(f"{name}: {value:.3f}" for name, value in fitted.metrics.items()))
+
+
+if __name__ == "__main__":
+    # Pelo módulo importado, não por __main__: o joblib grava a classe como
+    # painel_waze.ChurnModel, que o painel e o servidor de inferência conseguem carregar
+    import painel_waze
+
+    painel_waze.main()
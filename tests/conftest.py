@@ -0,0 +1,73 @@
+"""Configuração dos testes: módulos do painel importáveis a partir da raiz do repositório e bases sintéticas"""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def hr_frame(rows=300, seed=0):
+    """Base de RH sintética com as colunas usadas pelo pré-processamento do notebook (OverTime eleva a saída)"""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    overtime = rng.random(rows) < 0.3
+    return pd.DataFrame({
+        "Age": rng.integers(18, 60, rows),
+        "Attrition": np.where(overtime & (rng.random(rows) < 0.7), "Yes", "No"),
+        "Department": rng.choice(["Sales", "Research & Development", "Human Resources"], rows),
+        "Education": rng.integers(1, 6, rows),
+        "EmployeeCount": 1,
+        "EmployeeNumber": np.arange(rows),
+        "JobSatisfaction": rng.integers(1, 5, rows),
+        "MonthlyIncome": rng.integers(1000, 20000, rows),
+        "OverTime": np.where(overtime, "Yes", "No"),
+        "Over18": "Y",
+        "StandardHours": 80,
+        "WorkLifeBalance": rng.integers(1, 5, rows),
+    })
+
+
+def waze_frame(rows=400, seed=0):
+    """Telemetria sintética no schema de waze_dataset.csv (poucos dias de atividade = churn)"""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    activity_days = rng.integers(0, 31, rows)
+    return pd.DataFrame({
+        "ID": np.arange(rows),
+        "label": np.where(activity_days < 10, "churned", "retained"),
+        "sessions": rng.integers(0, 500, rows),
+        "drives": rng.integers(0, 400, rows),
+        "total_sessions": rng.uniform(0, 1000, rows),
+        "n_days_after_onboarding": rng.integers(0, 3500, rows),
+        "total_navigations_fav1": rng.integers(0, 1000, rows),
+        "total_navigations_fav2": rng.integers(0, 400, rows),
+        "driven_km_drives": rng.uniform(0, 20000, rows),
+        "duration_minutes_drives": rng.uniform(0, 15000, rows),
+        "activity_days": activity_days,
+        "driving_days": np.minimum(activity_days, rng.integers(0, 31, rows)),
+        "device": rng.choice(["Android", "iPhone"], rows),
+    })
+
+
+@pytest.fixture
+def hr_csv(tmp_path):
+    """CSV da base de RH sintética"""
+    pytest.importorskip("pandas")
+    path = tmp_path / "hr.csv"
+    hr_frame().to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def waze_csv(tmp_path):
+    """CSV da telemetria sintética do Waze"""
+    pytest.importorskip("pandas")
+    path = tmp_path / "waze.csv"
+    waze_frame().to_csv(path, index=False)
+    return path
@@ -0,0 +1,39 @@
+"""Arquivo de artefatos: ida e volta de textos e objetos, expiração e formato inválido"""
+import time
+
+import pandas as pd
+import pytest
+
+from painel_artefatos import ArtifactStore, write_artifacts
+
+
+def test_round_trip_of_strings_and_pickled_values(tmp_path):
+    frame = pd.DataFrame({"Empresa": ["Honda Brasil"], "Anos": [2.5]})
+    entries = [
+        ("html", "a", "<div>Análise 📊</div>", None),
+        ("kpis", "a", [("Experiência", "15+ anos", None, True)], None),
+        ("career_df", "a", frame, time.time() + 3600),
+    ]
+    path = write_artifacts(entries, tmp_path / "painel.artifacts", meta={"content_hash": "abc"})
+
+    store = ArtifactStore(path)
+    assert len(store) == 3
+    assert store.meta == {"content_hash": "abc"}
+    assert store.get("html", "a") == (None, "<div>Análise 📊</div>")
+    assert store.get("kpis", "a")[1] == [("Experiência", "15+ anos", None, True)]
+    pd.testing.assert_frame_equal(store.get("career_df", "a")[1], frame)
+    # Mesma chave em outro namespace não colide
+    assert store.get("kpis", "b") is None
+    assert store.get("figuras", "a") is None
+
+
+def test_expired_entries_are_misses(tmp_path):
+    path = write_artifacts([("html", "a", "<p>velho</p>", time.time() - 1)], tmp_path / "painel.artifacts")
+    assert ArtifactStore(path).get("html", "a") is None
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "outro.bin"
+    path.write_bytes(b"not an artifacts file")
+    with pytest.raises(ValueError):
+        ArtifactStore(path)
@@ -0,0 +1,49 @@
+"""Busca de hiperparâmetros: retomada depois de um results.jsonl cortado por uma interrupção"""
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sklearn")
+pytest.importorskip("imblearn")
+
+FOLDS = 3
+
+
+@pytest.fixture
+def small_grid(monkeypatch):
+    import painel_busca
+
+    monkeypatch.setitem(painel_busca.SEARCH_SPACE, "random_forest", {"n_estimators": [10], "max_depth": [2, 4]})
+
+
+def test_search_resumes_after_a_truncated_results_file(hr_csv, tmp_path, small_grid):
+    from painel_busca import search
+
+    first = search(hr_csv, workers=1, n_folds=FOLDS, models=["random_forest"], out_dir=tmp_path)
+    assert (first["tasks"], first["scored"], first["reused"]) == (6, 6, 0)
+
+    # Interrupção durante a escrita: última linha perdida e a penúltima cortada ao meio
+    results_file = Path(first["folds_dir"]) / "results.jsonl"
+    lines = results_file.read_text(encoding="utf-8").splitlines(keepends=True)
+    results_file.write_text("".join(lines[:-2]) + lines[-2][:20], encoding="utf-8")
+
+    resumed = search(hr_csv, workers=1, n_folds=FOLDS, models=["random_forest"], out_dir=tmp_path)
+    assert (resumed["scored"], resumed["reused"]) == (2, 4)
+    assert resumed["folds_dir"] == first["folds_dir"]
+    assert [row["AUC"] for row in resumed["ranking"]] == pytest.approx([row["AUC"] for row in first["ranking"]])
+
+    # A linha cortada fica isolada: as novas começam em uma linha própria
+    rows = []
+    for line in results_file.read_text(encoding="utf-8").splitlines():
+        try:
+            rows.append(json.loads(line))
+        except json.JSONDecodeError:
+            assert line == lines[-2][:20]
+    assert len(rows) == 6
+    assert {(row["config"], row["fold"]) for row in rows} == {
+        (config, fold) for config in {row["config"] for row in rows} for fold in range(FOLDS)
+    }
+
+    again = search(hr_csv, workers=1, n_folds=FOLDS, models=["random_forest"], out_dir=tmp_path)
+    assert (again["scored"], again["reused"]) == (0, 6)
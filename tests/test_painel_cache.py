@@ -0,0 +1,85 @@
+"""SharedCache: cópias por leitura e valores sem pickle no backend em disco"""
+import threading
+
+import pandas as pd
+
+from painel_artefatos import ArtifactStore, write_artifacts
+from painel_cache import SharedCache
+
+
+def test_sessions_cannot_change_each_others_values():
+    cache = SharedCache()
+    frame = pd.DataFrame({"nivel": [40.0, 87.0]})
+    frame.attrs["forecast_year"] = 2026
+
+    first = cache.get_or_compute("tabela", "k", lambda: frame)
+    first.loc[0, "nivel"] = -1
+    second = cache.get("tabela", "k")
+    assert second.loc[0, "nivel"] == 40.0
+    assert second.attrs["forecast_year"] == 2026
+
+    cache.set("kpis", "k", {"anos": [1, 2]})
+    cache.get("kpis", "k")["anos"].append(3)
+    assert cache.get("kpis", "k") == {"anos": [1, 2]}
+
+
+def test_immutable_values_are_not_copied():
+    cache = SharedCache()
+    html = "<div>" + "x" * 1000 + "</div>"
+    cache.set("html", "k", html)
+    assert cache.get("html", "k") is html
+
+
+def test_disk_copy_is_private(tmp_path):
+    writer = SharedCache(disk_dir=tmp_path)
+    writer.set("kpis", "k", {"anos": [1, 2]})
+    reader = SharedCache(disk_dir=tmp_path)
+    reader.get("kpis", "k")["anos"].append(3)
+    assert reader.get("kpis", "k") == {"anos": [1, 2]}
+
+
+def test_unpicklable_values_skip_the_disk(tmp_path):
+    cache = SharedCache(disk_dir=tmp_path)
+    lock = threading.Lock()
+    cache.set("objeto", "trava", lock)
+    cache.set("objeto", "local", lambda: None)
+    assert cache.get("objeto", "local") is not None
+    assert not list(tmp_path.glob("**/*.pkl"))
+    assert not list(tmp_path.glob("**/*.tmp"))
+
+
+def test_oversized_value_drops_the_previous_entry():
+    cache = SharedCache(max_bytes=10_000)
+    cache.set("html", "k", "pequeno")
+    cache.set("html", "k", "x" * 20_000)
+    assert cache.get("html", "k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_disk_sweep_removes_expired_entries(tmp_path):
+    cache = SharedCache(disk_dir=tmp_path)
+    cache.disk.sweep_every = 3
+    for query in ["python", "sql", "xgboost"]:
+        cache.set("html", query, f"<p>{query}</p>", ttl=-1)
+    cache.set("html", "fixo", "<p>fixo</p>")
+    assert [path.stem for path in tmp_path.glob("*/*.pkl")] == ["fixo"]
+
+
+def test_disk_stays_under_its_byte_cap(tmp_path):
+    cache = SharedCache(disk_dir=tmp_path)
+    cache.disk.max_bytes = 50_000
+    for number in range(20):
+        cache.set("html", f"busca-{number}", "x" * 10_000)
+    files = list(tmp_path.glob("*/*.pkl"))
+    assert sum(path.stat().st_size for path in files) <= 50_000
+    assert tmp_path / "html" / "busca-19.pkl" in files
+
+
+def test_artifact_is_unpickled_once_and_copied(tmp_path):
+    path = write_artifacts([("kpis", "k", {"anos": [1, 2]}, None)], tmp_path / "painel.artifacts")
+    cache = SharedCache(artifacts=ArtifactStore(path))
+
+    cache.get("kpis", "k")["anos"].append(3)
+    assert cache.get("kpis", "k") == {"anos": [1, 2]}
+    stats = cache.stats()
+    assert (stats["artifact_hits"], stats["hits"], stats["entries"]) == (1, 1, 1)
@@ -0,0 +1,81 @@
+"""Carregamento de data/perfil.json: mesmo conteúdo dos literais do painel original, recarga e validação"""
+import json
+
+import pytest
+
+from painel_dados import DataValidationError, load_data
+
+# Literais que o painel original definia no próprio script
+BASELINE_EDUCATION = [
+    {"title": "Ciência da Computação (em andamento)", "org": "UniAnchieta", "year": "2025"},
+    {"title": "Power BI Analyst Certificate", "org": "Microsoft", "year": "2024"},
+    {"title": "Google Advanced Data Analytics Certificate", "org": "Google", "year": "2024"},
+    {"title": "Google Data Analytics Certificate", "org": "Google", "year": "2023"},
+    {"title": "Digital Marketing Specialization", "org": "University of Illinois", "year": "2020"},
+    {"title": "MBA em Comércio Exterior", "org": "UniAnchieta", "year": "2012"},
+    {"title": "B.Tech em Marketing", "org": "UniAnchieta", "year": "2010"},
+]
+BASELINE_SKILLS = {
+    "Python": {"current": 87, "history": {2019: 40, 2021: 55, 2023: 70, 2024: 80, 2025: 87}},
+    "Power BI": {"current": 85, "history": {2019: 20, 2021: 35, 2023: 60, 2024: 75, 2025: 85}},
+    "SQL": {"current": 70, "history": {2019: 30, 2021: 40, 2023: 55, 2024: 65, 2025: 70}},
+    "Machine Learning": {"current": 65, "history": {2019: 15, 2021: 25, 2023: 40, 2024: 55, 2025: 65}},
+    "Data Storytelling": {"current": 92, "history": {2019: 75, 2021: 80, 2023: 85, 2024: 90, 2025: 92}},
+    "Streamlit": {"current": 70, "history": {2019: 0, 2021: 20, 2023: 45, 2024: 60, 2025: 70}},
+    "AWS": {"current": 50, "history": {2019: 10, 2021: 20, 2023: 35, 2024: 45, 2025: 50}},
+    "Databricks": {"current": 55, "history": {2019: 0, 2021: 15, 2023: 35, 2024: 50, 2025: 55}},
+}
+BASELINE_LANGUAGES = {"Alemão": 30, "Espanhol": 70, "Inglês": 95, "Português": 100}
+BASELINE_EXPERIENCES = [
+    ("Honda Brasil", "Analista de Dados", "2025-03", None),
+    ("Honda Brasil", "Analista de Operações Internacionais", "2023-04", "2025-02"),
+    ("Honda Brasil", "Consultor Comercial", "2019-06", "2023-03"),
+    ("Aditivo Media", "Founder | Head of Everything", "2015-06", "2019-06"),
+    ("CNH Industrial Capital", "Field Representative", "2011-09", "2015-06"),
+    ("Banco Mercedes-Benz", "Analista de F&I", "2010-01", "2011-09"),
+]
+
+
+def test_bundled_data_matches_the_original_literals():
+    data = load_data()
+    assert data["education"] == BASELINE_EDUCATION
+    # Anos do histórico voltam a ser inteiros, como nos literais (chaves JSON são strings)
+    assert data["skills"] == BASELINE_SKILLS
+    assert data["languages"] == BASELINE_LANGUAGES
+    assert [(e["company"], e["role"], e["start"], e["end"]) for e in data["experiences"]] == BASELINE_EXPERIENCES
+    assert len(data["projects"]) == 7
+    assert data["profile"]["name"] == "Murillo Martins"
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    from painel_dados import DATA_FILE
+
+    path = tmp_path / "perfil.json"
+    path.write_bytes(DATA_FILE.read_bytes())
+    return path
+
+
+def test_reload_follows_file_changes(data_file):
+    first = load_data(data_file)
+    assert load_data(data_file) is first
+
+    document = json.loads(data_file.read_text(encoding="utf-8"))
+    document["languages"]["Francês"] = 20
+    # Tamanho diferente: nova versão mesmo com o mtime na mesma resolução
+    data_file.write_text(json.dumps(document, ensure_ascii=False), encoding="utf-8")
+
+    reloaded = load_data(data_file)
+    assert reloaded["languages"]["Francês"] == 20
+    assert reloaded["content_hash"] != first["content_hash"]
+
+
+def test_invalid_file_lists_the_errors(data_file):
+    document = json.loads(data_file.read_text(encoding="utf-8"))
+    document["experiences"][0]["start"] = "2025-13"
+    del document["profile"]["email"]
+    data_file.write_text(json.dumps(document, ensure_ascii=False), encoding="utf-8")
+
+    with pytest.raises(DataValidationError) as error:
+        load_data(data_file)
+    assert len(error.value.errors) == 2
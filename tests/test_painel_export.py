@@ -0,0 +1,59 @@
+"""Exportação estática: página completa, assets referenciados presentes e figuras embutidas"""
+import json
+import re
+from datetime import date
+
+import pytest
+
+pytest.importorskip("plotly")
+
+TABS = ["📖 Minha História", "📈 Trajetória", "🛠️ Competências", "🚀 Projetos", "🎓 Formação"]
+
+
+@pytest.fixture(scope="module")
+def exported(tmp_path_factory):
+    from painel_export import export_site
+
+    out_dir = tmp_path_factory.mktemp("dist")
+    index = export_site(out_dir, plotly_cdn=True, today=date(2025, 6, 1))
+    return out_dir, index.read_text(encoding="utf-8")
+
+
+def test_page_has_every_tab_and_the_data(exported):
+    from painel_dados import load_data
+
+    _, page = exported
+    data = load_data()
+    for i, title in enumerate(TABS):
+        assert f'<label for="tab-{i}">{title}</label>' in page
+    assert page.count('class="tab-panel"') == len(TABS)
+    assert data["profile"]["name"] in page
+    # Experiência desde 2010-01 até a data de referência: 15 anos e 5 meses
+    assert "15+ anos" in page
+    for exp in data["experiences"]:
+        assert exp["role"] in page
+    assert re.findall(r'class="delta">([^<]+)', page) == [
+        "↑ +47% desde 2019", "↑ +65% desde 2019", "↑ +50% desde 2019",
+    ]
+
+
+def test_local_assets_exist_and_plotly_comes_from_the_cdn(exported):
+    out_dir, page = exported
+    local = {
+        ref.split("?")[0]
+        for ref in re.findall(r'(?:href|src)="([^"#]+)"', page)
+        if not re.match(r"[a-z]+:", ref)
+    }
+    assert any(ref.startswith("css/tema.") for ref in local)
+    assert [ref for ref in local if not (out_dir / ref).is_file()] == []
+    assert re.search(r'<script src="https://cdn\.plot\.ly/plotly-[\d.]+\.min\.js" defer>', page)
+    assert not (out_dir / "plotly.min.js").exists()
+
+
+def test_figures_are_embedded_without_the_template(exported):
+    _, page = exported
+    figures = [json.loads(block) for block in re.findall(r'<script type="application/json" data-plot>(.*?)</script>', page, re.S)]
+    assert len(figures) == 5
+    assert all(figure["data"] for figure in figures)
+    assert all("template" not in figure.get("layout", {}) for figure in figures)
+    assert json.loads(re.search(r'<script type="application/json" id="plot-template">(.*?)</script>', page, re.S).group(1))
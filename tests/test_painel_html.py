@@ -0,0 +1,16 @@
+"""Fragmentos HTML: métricas com o mesmo delta do st.metric"""
+from painel_html import metric_html
+from painel_modelo import skill_delta_label
+
+
+def test_metric_without_delta_has_no_arrow():
+    html = metric_html("Python", "87%", skill_delta_label(float("nan")))
+    assert "delta" not in html
+    assert "—" not in html
+
+
+def test_metric_arrow_follows_the_sign():
+    up = metric_html("Python", "87%", skill_delta_label(47.0))
+    down = metric_html("SQL", "30%", skill_delta_label(-5.0))
+    assert '<span class="delta">↑ +47% desde 2019</span>' in up
+    assert '<span class="delta down">↓ -5% desde 2019</span>' in down
@@ -0,0 +1,51 @@
+"""Índice invertido: busca por prefixo e contadores de KPI"""
+from painel_indice import SearchIndex
+from painel_modelo import count_certifications
+
+DATA = {
+    "experiences": [
+        {"company": "Honda Brasil", "role": "Analista de Dados", "city": "São Paulo", "skills": ["Python", "SQL"]},
+        {"company": "Aditivo Media", "role": "Founder", "city": "São José", "achievements": ["Gestão de operações"]},
+    ],
+    "projects": [
+        {"title": "Análise de Turnover", "summary": "Previsão de desligamento", "tags": ["Python", "XGBoost"]},
+        {"title": "Churn Prediction", "summary": "Análise de retenção", "tags": ["Scikit-learn"]},
+    ],
+    "education": [
+        {"title": "Google Data Analytics Certificate", "org": "Google"},
+        {"title": "MBA em Data Science", "org": "Certificadora Nacional"},
+        {"title": "Power BI certificate", "org": "Microsoft"},
+        {"title": "Power BI Analyst Certificate", "org": "Microsoft"},
+    ],
+}
+
+
+def test_certifications_match_the_title_only_criterion():
+    index = SearchIndex(DATA)
+    expected = sum(1 for edu in DATA["education"] if "Certificate" in edu["title"])
+    assert count_certifications(index, DATA["education"]) == expected == 2
+
+
+def test_search_matches_word_prefixes_without_accents_or_case():
+    index = SearchIndex(DATA)
+    assert index.search("projects", "anal") == [0, 1]
+    assert index.search("projects", "ANÁLISE turn") == [0]
+    assert index.search("experiences", "sao") == [0, 1]
+    assert index.search("experiences", "jose") == [1]
+    assert index.search("experiences", "pyth") == [0]
+
+
+def test_search_needs_every_term_and_whole_word_prefixes():
+    index = SearchIndex(DATA)
+    # "nalise" está dentro de "analise", mas não é início de palavra
+    assert index.search("projects", "nalise") == []
+    assert index.search("projects", "analise xgb") == [0]
+    assert index.search("projects", "analise sql") == []
+    assert index.search("projects", "  --  ") is None
+
+
+def test_facets_are_exact_values():
+    index = SearchIndex(DATA)
+    assert index.with_any("projects", "tags", ["python"]) == {0}
+    assert index.with_any("projects", "tags", ["Pyth"]) == set()
+    assert index.with_any("experiences", "company", ["Honda Brasil", "Aditivo Media"]) == {0, 1}
@@ -0,0 +1,87 @@
+"""MicroBatcher: agrupamento, isolamento de registros inválidos, scores faltando e encerramento"""
+import threading
+
+import pytest
+
+from painel_inferencia import MicroBatcher
+
+
+def double(records):
+    return [2.0 * record["x"] for record in records]
+
+
+@pytest.fixture
+def make_batcher():
+    batchers = []
+
+    def make(predict=double, **options):
+        batcher = MicroBatcher(predict, **options)
+        batchers.append(batcher)
+        return batcher
+
+    yield make
+    for batcher in batchers:
+        batcher.close()
+
+
+def test_records_in_the_window_share_one_batch(make_batcher):
+    calls = []
+
+    def predict(records):
+        calls.append(len(records))
+        return double(records)
+
+    batcher = make_batcher(predict, max_wait_ms=200)
+    futures = [batcher.submit({"x": x}) for x in range(10)]
+    assert [future.result(5) for future in futures] == [2.0 * x for x in range(10)]
+    assert calls == [10]
+    assert batcher.stats() == {"batches": 1, "rows": 10, "mean_batch": 10.0}
+
+
+def test_batches_are_capped_at_max_batch(make_batcher):
+    batcher = make_batcher(max_batch=4, max_wait_ms=50)
+    assert batcher.predict([{"x": x} for x in range(10)], timeout=5) == [2.0 * x for x in range(10)]
+    assert batcher.stats()["batches"] == 3
+
+
+def test_concurrent_callers_get_their_own_scores(make_batcher):
+    batcher = make_batcher(max_wait_ms=20)
+    results = {}
+
+    def client(x):
+        results[x] = batcher.predict([{"x": x}], timeout=5)[0]
+
+    threads = [threading.Thread(target=client, args=(x,)) for x in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {x: 2.0 * x for x in range(50)}
+    assert batcher.stats()["batches"] < 50
+
+
+def test_bad_record_fails_alone(make_batcher):
+    batcher = make_batcher(max_wait_ms=200)
+    good, bad, other = batcher.submit({"x": 1}), batcher.submit({}), batcher.submit({"x": 3})
+    assert good.result(5) == 2.0
+    assert other.result(5) == 6.0
+    with pytest.raises(KeyError):
+        bad.result(5)
+
+
+def test_missing_scores_fail_every_record_of_the_batch(make_batcher):
+    batcher = make_batcher(lambda records: [0.5], max_wait_ms=200)
+    futures = [batcher.submit({"x": x}) for x in range(2)]
+    for future in futures:
+        with pytest.raises(ValueError, match="1 scores para 2 registros"):
+            future.result(5)
+
+
+def test_close_scores_queued_records_and_rejects_new_ones():
+    batcher = MicroBatcher(double, max_wait_ms=200)
+    future = batcher.submit({"x": 4})
+    batcher.close()
+    assert future.result(5) == 8.0
+    with pytest.raises(RuntimeError):
+        batcher.submit({"x": 1})
+    batcher.close()
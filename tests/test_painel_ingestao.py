@@ -0,0 +1,31 @@
+"""Remoção de duplicatas entre blocos e resumo da ingestão"""
+import json
+
+import numpy as np
+import pandas as pd
+
+from painel_ingestao import RowDeduplicator, ingest
+
+
+def test_deduplicator_matches_drop_duplicates_across_chunks():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({"a": rng.integers(0, 30, 5000), "b": rng.choice(["x", "y"], 5000)})
+    deduplicate = RowDeduplicator()
+    kept = pd.concat([deduplicate(frame.iloc[start:start + 700]) for start in range(0, len(frame), 700)])
+
+    pd.testing.assert_frame_equal(kept, frame.drop_duplicates())
+    assert np.all(np.diff(deduplicate.seen.astype(np.float64)) >= 0)
+    assert len(deduplicate.seen) == len(kept)
+
+
+def test_summary_records_duplicates_and_collision_bound(tmp_path):
+    rows = ["ID,label,sessions,drives,total_sessions,n_days_after_onboarding,total_navigations_fav1,"
+            "total_navigations_fav2,driven_km_drives,duration_minutes_drives,activity_days,driving_days,device"]
+    rows += [f"{i % 3},retained,1,1,1.0,1,1,1,1.0,1.0,1,1,iPhone" for i in range(10)]
+    csv = tmp_path / "waze.csv"
+    csv.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    ingest("waze", csv, tmp_path, chunksize=4)
+    summary = json.loads((tmp_path / "waze.summary.json").read_text(encoding="utf-8"))
+    assert (summary["rows_read"], summary["duplicates"], summary["rows"]) == (10, 7, 3)
+    assert summary["hash_collision_bound"] == 9 / 2 ** 65
@@ -0,0 +1,64 @@
+"""Projeção e crescimento das habilidades com anos sem registro"""
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from painel_modelo import MISSING_VALUE, format_percent, forecast_skills, growth_rates
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "tardia": [np.nan, np.nan, 10, 20, 30],
+            "antiga": [0, 5, 10, np.nan, np.nan],
+            "unica": [np.nan, 50, np.nan, np.nan, np.nan],
+            "vazia": [np.nan] * 5,
+        },
+        index=[2019, 2020, 2021, 2022, 2023],
+        dtype=float,
+    )
+
+
+def test_forecast_fits_only_observed_years(frame):
+    forecast = forecast_skills(frame, 2024)
+    for skill in ["tardia", "antiga"]:
+        observed = frame[skill].dropna()
+        expected = np.polyval(np.polyfit(observed.index, observed, 1), 2024)
+        assert forecast[skill] == pytest.approx(expected)
+    assert forecast["unica"] == 50
+    assert math.isnan(forecast["vazia"])
+
+
+def test_growth_rate_without_positive_base_is_nan(frame):
+    rates = growth_rates(frame)
+    assert rates["tardia"] == pytest.approx(3 ** 0.5 - 1)
+    assert math.isnan(rates["antiga"])
+    assert math.isnan(rates["unica"])
+
+
+def test_format_percent_hides_missing_values():
+    assert format_percent(float("nan"), signed=True) == MISSING_VALUE
+    assert format_percent(float("inf"), fraction=True) == MISSING_VALUE
+    assert format_percent(47.0, signed=True) == "+47%"
+    assert format_percent(0.138, fraction=True) == "14%"
+
+
+def test_career_model_holds_rows_and_kpis():
+    from datetime import date
+
+    from painel_modelo import build_career_frame, compute_career_model
+
+    experiences = [
+        {"company": "Acme", "role": "Analista", "start": "2015-01", "end": "2019-12", "achievements": ["A", "B"]},
+        {"company": "Acme", "role": "Cientista", "start": "2020-01", "end": None},
+    ]
+    career = compute_career_model(experiences, date(2025, 7, 1))
+    assert (career["total_years"], career["num_companies"]) == (11, 1)
+    assert [row["Duracao_str"] for row in career["experiences"]] == ["4 anos e 11 meses", "5 anos e 6 meses"]
+    assert career["experiences"][0]["Desc"] == "A • B"
+
+    frame = build_career_frame(career)
+    assert list(frame["Cargo"]) == ["Cientista", "Analista"]
@@ -0,0 +1,62 @@
+"""Instrumentação: bytes por seção aninhada e servidor de métricas com a porta ocupada"""
+import types
+
+import pytest
+
+import painel_perfil
+
+
+class Message:
+    def __init__(self, size):
+        self.size = size
+
+    def ByteSize(self):
+        return self.size
+
+
+@pytest.fixture
+def profiling(monkeypatch):
+    monkeypatch.setattr(painel_perfil, "PROFILING", True)
+    monkeypatch.setattr(painel_perfil, "_totals", {})
+    return monkeypatch
+
+
+def test_nested_sections_count_bytes_once(profiling):
+    sent = []
+    ctx = types.SimpleNamespace(_enqueue=sent.append)
+    profiling.setattr(painel_perfil, "_script_context", lambda: ctx)
+
+    painel_perfil.start_run()
+    with painel_perfil.profile_section("aba"):
+        ctx._enqueue(Message(10))
+        with painel_perfil.profile_section("grafico"):
+            ctx._enqueue(Message(5))
+        ctx._enqueue(Message(1))
+    rows = {row["seção"]: row for row in painel_perfil.finish_run()}
+
+    assert [message.size for message in sent] == [10, 5, 1]
+    assert (rows["aba"]["mensagens"], rows["aba"]["bytes"]) == (2, 11)
+    assert (rows["grafico"]["mensagens"], rows["grafico"]["bytes"]) == (1, 5)
+    assert ctx._enqueue == sent.append
+
+
+def test_section_without_enqueue_only_measures_time(profiling):
+    profiling.setattr(painel_perfil, "_script_context", lambda: types.SimpleNamespace())
+    with painel_perfil.profile_section("aba"):
+        pass
+    assert painel_perfil.metrics_snapshot()["section"]["aba"]["bytes"] == 0
+
+
+def test_busy_port_is_tried_once_per_process(profiling):
+    attempts = []
+
+    def busy(*args):
+        attempts.append(args)
+        raise OSError("porta ocupada")
+
+    profiling.setattr(painel_perfil, "_server", None)
+    profiling.setattr(painel_perfil, "_server_failed", False)
+    profiling.setattr(painel_perfil, "ThreadingHTTPServer", busy)
+    assert painel_perfil.start_metrics_server() is None
+    assert painel_perfil.start_metrics_server() is None
+    assert len(attempts) == 1
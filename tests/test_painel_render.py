@@ -0,0 +1,42 @@
+"""Serviço de renderização: chave das imagens pelo conteúdo e limpeza das versões antigas"""
+from painel_figuras import MOBILE_IMAGE_WIDTH
+from painel_imagens import STATIC_URL
+from painel_render import RenderService, image_key
+
+SPEC = {"data": [{"type": "bar", "x": ["Python", "SQL"], "y": [87, 70]}], "layout": {"title": {"text": "Ferramentas"}}}
+
+
+def test_image_key_depends_on_content_and_parameters():
+    key = image_key(SPEC, "png", 400)
+    assert len(key) == 64
+    # Ordem das chaves do JSON não muda a imagem
+    assert image_key({"layout": SPEC["layout"], "data": SPEC["data"]}, "png", 400) == key
+    changed = {**SPEC, "data": [{"type": "bar", "x": ["Python", "SQL"], "y": [87, 71]}]}
+    others = {image_key(changed, "png", 400), image_key(SPEC, "webp", 400), image_key(SPEC, "png", 800),
+              image_key(SPEC, "png", 400, scale=1)}
+    assert key not in others and len(others) == 4
+
+
+def test_cached_url_only_for_rendered_images(tmp_path, monkeypatch):
+    import painel_render
+
+    monkeypatch.setattr(painel_render, "STATIC_DIR", tmp_path)
+    service = RenderService(tmp_path / "img" / "charts")
+    assert service.cached_url(SPEC, "png") is None
+
+    path = service.path(SPEC, "png")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"img")
+    assert service.cached_url(SPEC, "png") == f"{STATIC_URL}/img/charts/{image_key(SPEC, 'png', MOBILE_IMAGE_WIDTH)}.png"
+
+
+def test_prune_keeps_only_the_current_images(tmp_path):
+    service = RenderService(tmp_path)
+    current = [service.path(SPEC, fmt) for fmt in ("png", "webp")]
+    stale = service.path({**SPEC, "layout": {}}, "png")
+    for path in current + [stale]:
+        path.write_bytes(b"img")
+
+    assert service.prune(current) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(path.name for path in current)
+    assert service.prune(current) == 0
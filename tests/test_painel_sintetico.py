@@ -0,0 +1,12 @@
+"""Dados sintéticos: schema válido e experiências que não terminam antes de começar"""
+from painel_dados import validate_data
+from painel_sintetico import generate_data
+
+
+def test_generated_data_is_valid_and_chronological():
+    data = generate_data(500, seed=3)
+    assert validate_data(data) == []
+    ended = [exp for exp in data["experiences"] if exp["end"]]
+    assert ended
+    assert all(exp["end"] >= exp["start"] for exp in ended)
+    assert any(exp["end"][:4] == exp["start"][:4] for exp in ended)
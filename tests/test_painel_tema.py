@@ -0,0 +1,21 @@
+"""Tema: folha de estilo gravada com hash no nome e referenciada por <link>"""
+import re
+
+from painel_tema import CSS_DIR, compile_stylesheet, theme_link_tag, write_stylesheet
+
+
+def test_stylesheet_file_is_named_by_its_content(tmp_path):
+    desktop = write_stylesheet(tmp_path)
+    mobile = write_stylesheet(tmp_path, mobile=True)
+    assert desktop != mobile
+    assert write_stylesheet(tmp_path) == desktop
+    css, fingerprint = compile_stylesheet()
+    assert desktop.name == f"tema.{fingerprint}.css"
+    assert desktop.read_text(encoding="utf-8") == css
+
+
+def test_link_tag_points_to_the_compiled_file():
+    tag = theme_link_tag(mobile=True)
+    assert "<style" not in tag
+    href = re.search(r'rel="stylesheet" href="component/painel_tema\.static/css/([^"]+)"', tag).group(1)
+    assert (CSS_DIR / href).read_text(encoding="utf-8") == compile_stylesheet(mobile=True)[0]
@@ -0,0 +1,71 @@
+"""Modelo de turnover: codificação consistente entre treino e score, Lift@10% e ida e volta pelo CLI"""
+import math
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+pytest.importorskip("sklearn")
+pytest.importorskip("imblearn")
+pytest.importorskip("joblib")
+
+
+@pytest.fixture
+def model(hr_csv):
+    from painel_turnover import train
+
+    return train(hr_csv, params={"n_estimators": 20})
+
+
+def test_scoring_encodes_rows_like_the_training_matrix(hr_csv, model):
+    import pandas as pd
+
+    from painel_turnover import TARGET, encode_training_data, load_training_data
+
+    training = encode_training_data(hr_csv)["X"]
+    # SMOTE reamostra linhas, não colunas: o estimador vê as mesmas colunas do get_dummies do treino
+    assert list(model.estimator.feature_names_in_) == model.feature_columns == list(training.columns)
+
+    raw = pd.read_csv(hr_csv).loc[load_training_data(hr_csv).index].drop(columns=TARGET)
+    pd.testing.assert_frame_equal(model.encode(raw), training)
+
+
+def test_partial_records_get_every_model_column(model):
+    import pandas as pd
+
+    encoded = model.encode(pd.DataFrame.from_records([{"OverTime": "Yes", "Department": "Marketing"}]))
+    assert list(encoded.columns) == model.feature_columns
+    assert encoded.filter(like="OverTime_").iloc[0].tolist() == [1]
+    # Categoria fora do treino vira a de referência (todas as dummies em zero)
+    assert encoded.filter(like="Department_").iloc[0].sum() == 0
+
+
+def test_lift_at_top_fraction():
+    from painel_turnover import lift_at
+
+    y_true = [1, 0, 0, 0, 0, 1, 0, 0, 0, 0]
+    scores = [0.9, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.05]
+    # Top 10% = 1 linha, positiva; taxa geral = 20%
+    assert lift_at(y_true, scores) == pytest.approx(5.0)
+    assert lift_at(y_true, scores, fraction=0.5) == pytest.approx(2.0)
+    assert math.isnan(lift_at([0] * 10, scores))
+
+
+def test_model_trained_by_cli_loads_and_scores(hr_csv, tmp_path):
+    from painel_turnover import TurnoverModel, load_model
+
+    model_file = tmp_path / "turnover.joblib"
+    subprocess.run(
+        [sys.executable, str(ROOT / "painel_turnover.py"), "train", "--csv", str(hr_csv), "--out", str(model_file)],
+        check=True, cwd=ROOT, capture_output=True,
+    )
+
+    model = load_model(model_file)
+    assert isinstance(model, TurnoverModel)
+    assert type(model).__module__ == "painel_turnover"
+
+    scores = model.score_records([{"OverTime": "Yes"}, {"OverTime": "No", "JobSatisfaction": 4}])
+    assert len(scores) == 2
+    assert all(0.0 <= score <= 1.0 for score in scores)
@@ -0,0 +1,120 @@
+"""Waze: divisão segura, atributos derivados sem inf/NaN, partições Parquet e ida e volta do modelo de churn pelo CLI"""
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT, waze_frame
+
+np = pytest.importorskip("numpy")
+
+
+def test_safe_divide_returns_zero_where_the_denominator_is_zero():
+    from painel_waze import safe_divide
+
+    out = safe_divide([1, 4, -3, 0], [0, 2, 0, 0])
+    assert out.dtype == np.float32
+    assert out.tolist() == [0.0, 2.0, 0.0, 0.0]
+    assert safe_divide([2, 6], 2).tolist() == [1.0, 3.0]
+
+
+def test_feature_arrays_turn_notebook_infinities_into_zero():
+    from painel_waze import FEATURE_COLUMNS, feature_arrays
+
+    zero = np.zeros(2)
+    columns = {
+        "driven_km_drives": np.array([120.0, 0.0]),
+        "drives": np.array([0.0, 80.0]),
+        "driving_days": np.array([0.0, 20.0]),
+        "sessions": np.array([10.0, 0.0]),
+        "total_sessions": zero,
+        "n_days_after_onboarding": zero,
+        "duration_minutes_drives": zero,
+        "total_navigations_fav1": np.array([5.0, 0.0]),
+        "total_navigations_fav2": zero,
+    }
+    features = feature_arrays(columns)
+    assert set(features) == set(FEATURE_COLUMNS)
+    # O notebook gerava inf nas divisões por zero e as trocava por 0 depois
+    for name, values in features.items():
+        assert np.isfinite(values).all(), name
+    assert features["km_per_driving_day"].tolist() == [0.0, 0.0]
+    assert features["km_per_drive"].tolist() == [0.0, 0.0]
+    assert features["percent_sessions_in_last_month"].tolist() == [0.0, 0.0]
+    assert features["professional_driver"].tolist() == [0, 1]
+
+
+def test_dataframe_and_array_columns_give_the_same_features():
+    pytest.importorskip("pandas")
+    from painel_waze import engineer_features, feature_arrays
+
+    frame = waze_frame(rows=50)
+    arrays = feature_arrays({column: frame[column].to_numpy(dtype="float64") for column in frame.columns
+                             if column not in ("label", "device")})
+    engineered = engineer_features(frame)
+    for name, values in arrays.items():
+        np.testing.assert_array_equal(engineered[name].to_numpy(), values)
+
+
+def test_partition_key_follows_the_csv_content(waze_csv, tmp_path):
+    from painel_waze import feature_partition, source_key
+
+    copy = tmp_path / "copia.csv"
+    copy.write_bytes(waze_csv.read_bytes())
+    key = source_key(waze_csv)
+    assert feature_partition(waze_csv, tmp_path / "features").name == f"source={key}"
+    # Mesmo conteúdo em outro caminho: mesma partição
+    assert source_key(copy) == key
+
+    with open(copy, "a", encoding="utf-8") as f:
+        f.write(waze_frame(rows=1, seed=1).to_csv(header=False, index=False))
+    assert source_key(copy) != key
+
+
+def test_feature_store_reuses_the_cached_partition(waze_csv, tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    import painel_waze
+
+    out_dir = tmp_path / "features"
+    part = painel_waze.build_feature_store(waze_csv, out_dir, chunksize=150)
+    features = painel_waze.load_features(waze_csv, ["km_per_drive", "professional_driver"], out_dir)
+    assert len(features) == 400
+    # Mesmos valores do cálculo em memória, a menos do arredondamento do CSV
+    np.testing.assert_allclose(
+        features["km_per_drive"].to_numpy(), painel_waze.engineer_features(waze_frame())["km_per_drive"], rtol=1e-6
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError("a partição existente deveria ser reaproveitada")
+
+    monkeypatch.setattr(painel_waze, "read_chunks", fail)
+    mtime = part.stat().st_mtime_ns
+    assert painel_waze.build_feature_store(waze_csv, out_dir) == part
+    assert part.stat().st_mtime_ns == mtime
+
+    stale = out_dir / "source=0000000000000000"
+    stale.mkdir()
+    assert painel_waze.prune_partitions(waze_csv, out_dir) == 1
+    assert [path.name for path in out_dir.iterdir()] == [part.parent.name]
+
+
+def test_model_trained_by_cli_loads_and_scores(waze_csv, tmp_path):
+    pytest.importorskip("sklearn")
+    pytest.importorskip("joblib")
+    pytest.importorskip("pyarrow")
+    from painel_waze import ChurnModel, load_churn_model
+
+    model_file = tmp_path / "churn.joblib"
+    subprocess.run(
+        [sys.executable, str(ROOT / "painel_waze.py"), "--csv", str(waze_csv), "--out", str(tmp_path / "features"),
+         "--train", "random_forest", "--model-out", str(model_file)],
+        check=True, cwd=ROOT, capture_output=True,
+    )
+
+    model = load_churn_model(model_file)
+    assert isinstance(model, ChurnModel)
+    assert type(model).__module__ == "painel_waze"
+
+    scores = model.score_records([{"activity_days": 2}, {"activity_days": 28, "device": "iPhone"}])
+    assert len(scores) == 2
+    assert scores[0] > scores[1]